@@ -79,24 +79,25 @@ def extract_session_id_history(request: Request) -> str:
     return str(request.path_params.get("thread_id"))
 
 
+def _format_thread(s: Session) -> dict[str, Any]:
+    """Build the client-facing row for a single session."""
+    # Create base thread information with ID and timestamp
+    row: dict[str, Any] = {
+        "threadId": s.id,
+        "lastUpdateTime": str(int(getattr(s, "last_update_time", 0))),
+    }
+    # Add optional thread title from session state if available
+    if title := (getattr(s, "state", None) or {}).get("threadTitle"):
+        row["threadTitle"] = str(title)
+    return row
+
+
 async def format_thread_list(session_list: list[Session]) -> list[dict[str, Any]]:
     """Return threads in a simple client-friendly structure.
 
     Includes an optional title if present in session state.
     """
-    formatted: list[dict[str, Any]] = []
-    for s in session_list:
-        # Create base thread information with ID and timestamp
-        row: dict[str, Any] = {
-            "threadId": s.id,
-            "lastUpdateTime": str(int(getattr(s, "last_update_time", 0))),
-        }
-        # Add optional thread title from session state if available
-        title = getattr(s, "state", {}).get("threadTitle")
-        if title:
-            row["threadTitle"] = str(title)
-        formatted.append(row)
-    return formatted
+    return [_format_thread(s) for s in session_list]
 
 
 # Instantiate your agent and minimal middleware wiring
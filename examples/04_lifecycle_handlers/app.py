@@ -18,17 +18,20 @@ Environment variables (optional):
 - `ADK_MODEL_NAME` (default: `gemini-1.5-flash`)
 
 Note: Handlers here are intentionally simple and pass-through oriented to keep
-the example focused on structure and lifecycle, not business logic.
+the example focused on structure and lifecycle, not business logic. Their
+traces are logged at DEBUG level; enable it to follow the lifecycle, e.g.
+`logging.basicConfig(level=logging.DEBUG)`.
 """
 
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from typing import Any
 
-from ag_ui.core import BaseEvent, RunAgentInput
+from ag_ui.core import BaseEvent, RunAgentInput, RunErrorEvent
 from fastapi import FastAPI, Request
 from google.adk.events import Event
 
@@ -47,6 +50,30 @@ from adk_agui_middleware.data_model.config import PathConfig
 from adk_agui_middleware.data_model.context import ConfigContext, HandlerContext
 from adk_agui_middleware.data_model.event import TranslateEvent
 
+# Lifecycle traces; arguments are formatted only when DEBUG is enabled
+logger = logging.getLogger(__name__)
+
+# Session lock registry key: (app_name, user_id, session_id)
+SessionKey = tuple[str, str, str]
+
+
+class _EmptyAsyncIterator(AsyncIterator[Any]):
+    """Async iterator that yields nothing, shared by the no-op hooks.
+
+    The middleware awaits hooks such as `translate` and then iterates the
+    result, so a no-op hook can return this instance instead of creating an
+    async generator on every call.
+    """
+
+    __slots__ = ()
+
+    async def __anext__(self) -> Any:
+        """Signal exhaustion immediately."""
+        raise StopAsyncIteration
+
+
+_EMPTY = _EmptyAsyncIterator()
+
 
 def build_llm_agent() -> Any:
     """Create an LlmAgent from google.adk using a model name from env."""
@@ -73,49 +100,76 @@ class InMemorySessionLock(SessionLockHandler):
     Keep it minimal for local demos; for production, consider Redis or DB-backed locks.
     """
 
-    # Global registry of locks keyed by a composite session key
-    _locks: dict[str, asyncio.Lock] = {}
+    __slots__ = ("lock_timeout", "retry_count", "retry_interval")
+
+    # Global registry keyed by (app, user, session). Each entry holds the
+    # session's lock and how many requests currently hold or wait for it, so
+    # the entry can be dropped once the session goes idle.
+    _locks: dict[SessionKey, tuple[asyncio.Lock, int]] = {}
 
     def __init__(self, lock_config: SessionLockConfig) -> None:
         """Initialize lock handler with configuration parameters."""
         self.lock_timeout = lock_config.lock_timeout
-        self.retry_interval = lock_config.retry_interval
-        self.retry_count = lock_config.retry_count
+        self.retry_interval = lock_config.lock_retry_interval
+        self.retry_count = lock_config.lock_retry_times
 
     @staticmethod
-    def _key(info: InputInfo) -> str:
+    def _key(info: InputInfo) -> SessionKey:
         """Generate a unique key for session identification."""
-        return f"{info.app_name}:{info.user_id}:{info.session_id}"
+        return info.app_name, info.user_id, info.session_id
+
+    def _release_user(self, key: SessionKey) -> None:
+        """Drop one holder/waiter and evict the entry once nobody uses it."""
+        entry = self._locks.get(key)
+        if entry is None:
+            return
+        lock, users = entry
+        if users > 1:
+            self._locks[key] = (lock, users - 1)
+        elif not lock.locked():
+            del self._locks[key]
 
     async def lock(self, input_info: InputInfo) -> bool:
         """Attempt to acquire a lock for the session."""
         key = self._key(input_info)
-        # Get or create a lock for this session
-        lock = self._locks.setdefault(key, asyncio.Lock())
-        attempt = 0
-        # Retry logic with configurable attempts
-        while attempt <= self.retry_count:
+        # Get or create a lock for this session and count this request as a
+        # user. Nothing is awaited between the lookup and the update, so the
+        # registry needs no lock of its own on the event loop.
+        lock, users = self._locks.get(key) or (asyncio.Lock(), 0)
+        self._locks[key] = (lock, users + 1)
+        # A free lock is taken straight away, as the first retry attempt was.
+        # Otherwise wait as long as the retries would have; acquire() queues
+        # on the lock and wakes as soon as it is released. lock_timeout bounds
+        # how long the lock is held, not how long to wait for it.
+        wait_budget = self.retry_count * self.retry_interval
+        acquired = False
+        try:
             if not lock.locked():
-                await lock.acquire()  # Acquire the lock
-                return True
-            attempt += 1
-            await asyncio.sleep(self.retry_interval)  # Wait before retry
-        return False  # Failed to acquire lock
+                await lock.acquire()
+                acquired = True
+            elif wait_budget > 0:
+                await asyncio.wait_for(lock.acquire(), timeout=wait_budget)
+                acquired = True
+        except TimeoutError:
+            pass  # Failed to acquire lock
+        finally:
+            if not acquired:
+                self._release_user(key)
+        return acquired
 
     async def unlock(self, input_info: InputInfo) -> None:
         """Release the lock for the session."""
         key = self._key(input_info)
-        lock = self._locks.get(key)
-        if lock and lock.locked():
-            lock.release()  # Release the acquired lock
+        entry = self._locks.get(key)
+        if entry and entry[0].locked():
+            entry[0].release()  # Release the acquired lock
+            self._release_user(key)
 
-    async def get_locked_message(self, input_info: InputInfo):  # returns RunErrorEvent
+    async def get_locked_message(self, input_info: InputInfo) -> RunErrorEvent:
         """Generate error message when session is locked."""
-        from ag_ui.core import RunErrorEvent
-
         return RunErrorEvent(
             id="session-locked",
-            message=f"Session {self._key(input_info)} is locked by another request.",
+            message=f"Session {':'.join(self._key(input_info))} is locked by another request.",
         )
 
 
@@ -126,16 +180,18 @@ class LifecycleADKEventHandler(BaseADKEventHandler):
     - Filter internal roles
     - Modify metadata
     - Implement custom event routing
-    Here, we simply pass through and print a short trace to illustrate placement.
+    Here, we simply pass through and log a short debug trace to illustrate placement.
     """
 
+    __slots__ = ("info",)
+
     def __init__(self, input_info: InputInfo | None) -> None:
         """Initialize handler with optional input context."""
         self.info = input_info
 
     async def process(self, event: Event) -> AsyncGenerator[Event | None]:
         """Process ADK events before translation to AGUI format."""
-        print("[Lifecycle] ADK event ->", getattr(event, "author", None))
+        logger.debug("[Lifecycle] ADK event -> %s", event.author)
         # Yield the event as-is; return None to filter it out.
         # This is where you could filter, modify, or route events
         yield event
@@ -147,6 +203,8 @@ class LifecycleTimeoutHandler(BaseADKEventTimeoutHandler):
     Keep generous timeouts for demos to avoid unexpected fallbacks.
     """
 
+    __slots__ = ("info",)
+
     def __init__(self, input_info: InputInfo | None) -> None:  # noqa: D401
         """Initialize timeout handler with optional input context."""
         self.info = input_info
@@ -156,14 +214,12 @@ class LifecycleTimeoutHandler(BaseADKEventTimeoutHandler):
         # 30 seconds demo timeout - adjust based on your needs
         return 30
 
-    async def process_timeout_fallback(self) -> AsyncGenerator[Event | None]:
+    async def process_timeout_fallback(self) -> AsyncIterator[Event | None]:
         """Handle timeout scenarios by providing fallback events."""
-        print("[Lifecycle] Timeout fallback invoked")
+        logger.debug("[Lifecycle] Timeout fallback invoked")
         # In a real app, emit an ADK error event or a synthetic explanation event.
-        # We yield None here to keep the example neutral.
-        if False:  # pragma: no cover - placeholder
-            yield None
-        return
+        # We emit nothing here to keep the example neutral.
+        return _EMPTY
 
 
 class LifecycleTranslateHandler(BaseTranslateHandler):
@@ -173,18 +229,18 @@ class LifecycleTranslateHandler(BaseTranslateHandler):
     traces when the hook runs without altering the pipeline.
     """
 
+    __slots__ = ("info",)
+
     def __init__(self, input_info: InputInfo | None) -> None:
         """Initialize translate handler with optional input context."""
         self.info = input_info
 
-    async def translate(self, adk_event: Event) -> AsyncGenerator[TranslateEvent]:
+    async def translate(self, adk_event: Event) -> AsyncIterator[TranslateEvent]:
         """Intercept and potentially modify event translation."""
-        print("[Lifecycle] Translate hook for event")
-        # No-op: do not yield any TranslateEvent so the default translator runs.
+        logger.debug("[Lifecycle] Translate hook for event")
+        # No-op: return no TranslateEvent so the default translator runs.
         # This is where you could provide custom event translation logic
-        if False:  # pragma: no cover - sample structure
-            yield TranslateEvent()
-        return
+        return _EMPTY
 
 
 class LifecycleAGUIEventHandler(BaseAGUIEventHandler):
@@ -194,13 +250,15 @@ class LifecycleAGUIEventHandler(BaseAGUIEventHandler):
     Here, we log and pass through.
     """
 
+    __slots__ = ("info",)
+
     def __init__(self, input_info: InputInfo | None) -> None:
         """Initialize AGUI event handler with optional input context."""
         self.info = input_info
 
     async def process(self, event: BaseEvent) -> AsyncGenerator[BaseEvent | None]:
         """Process AGUI events after translation from ADK events."""
-        print("[Lifecycle] AGUI event ->", type(event).__name__)
+        logger.debug("[Lifecycle] AGUI event -> %s", event.type)
         # This is where you could filter or modify AGUI events before SSE output
         yield event
 
@@ -211,15 +269,19 @@ class LifecycleStateHandler(BaseAGUIStateSnapshotHandler):
     For example, you might drop sensitive server-only keys.
     """
 
+    __slots__ = ("info",)
+
     def __init__(self, input_info: InputInfo | None) -> None:  # noqa: D401
         """Initialize state handler with optional input context."""
         self.info = input_info
 
     async def process(self, state_snapshot: dict[str, Any]) -> dict[str, Any] | None:
         """Filter or transform the state snapshot before sending to client."""
-        # Example: Remove private/internal keys that start with underscore
-        filtered = {k: v for k, v in state_snapshot.items() if not k.startswith("_")}
-        return filtered
+        # Example: Remove private/internal keys that start with underscore.
+        # Most snapshots have none, so pass those through without copying.
+        if not any(key.startswith("_") for key in state_snapshot):
+            return state_snapshot
+        return {k: v for k, v in state_snapshot.items() if not k.startswith("_")}
 
 
 class LifecycleIORecorder(BaseInOutHandler):
@@ -228,32 +290,41 @@ class LifecycleIORecorder(BaseInOutHandler):
     Keep output minimal to avoid noise in development.
     """
 
+    __slots__ = ()
+
+    # Events pass through unchanged, so the middleware skips
+    # output_catch_and_change for every streamed event.
+    modifies_output = False
+
     async def input_record(self, input_info: InputInfo) -> None:
         """Record incoming request context for monitoring/debugging."""
-        print(
-            "[Lifecycle] INPUT",
-            {
-                "app": input_info.app_name,  # Application name
-                "user": input_info.user_id,  # User identifier
-                "session": input_info.session_id,  # Session/thread ID
-            },
+        logger.debug(
+            "[Lifecycle] INPUT app=%s user=%s session=%s",
+            input_info.app_name,  # Application name
+            input_info.user_id,  # User identifier
+            input_info.session_id,  # Session/thread ID
         )
 
-    async def output_record(self, agui_event: dict[str, str]) -> None:
-        """Record outgoing SSE events for monitoring/debugging."""
-        print("[Lifecycle] OUTPUT", {k: agui_event.get(k) for k in ("event", "id")})
+    async def output_record(self, agui_event: BaseEvent) -> None:
+        """Record outgoing AGUI events for monitoring/debugging."""
+        logger.debug("[Lifecycle] OUTPUT %s", agui_event.type)
 
-    async def output_catch_and_change(
-        self, agui_event: dict[str, str]
-    ) -> dict[str, str]:
-        """Transform outgoing SSE events if needed (use with caution)."""
+    async def output_catch_and_change(self, agui_event: BaseEvent) -> BaseEvent:
+        """Transform outgoing AGUI events if needed (use with caution)."""
         # Pass through without modification - be careful with changes here
         return agui_event
 
 
-def extract_user_id(_: RunAgentInput, request: Request) -> str:
-    """Minimal user id extraction."""
-    return request.headers.get("X-User-Id", "guest")
+async def extract_user_id(_: RunAgentInput, request: Request) -> str:
+    """Minimal user id extraction from the `X-User-Id` header.
+
+    Reads the raw ASGI header list, whose names are lowercase bytes, instead
+    of building Starlette's `Headers` mapping for a single lookup.
+    """
+    for name, value in request.scope["headers"]:
+        if name == b"x-user-id":
+            return value.decode("latin-1")
+    return "guest"
 
 
 # Agent and middleware wiring with full lifecycle handlers
@@ -271,14 +342,15 @@ handler_context = HandlerContext(
     session_lock_handler=InMemorySessionLock,
     # ADK-side hooks for event processing
     adk_event_handler=LifecycleADKEventHandler,  # Pre-process ADK events
-    adk_event_timeout_handler=LifecycleTimeoutHandler,  # Handle timeouts
+    # Stateless hooks can be shared instances instead of per-request classes
+    adk_event_timeout_handler=LifecycleTimeoutHandler(None),  # Handle timeouts
     # Translation intercept hook
     translate_handler=LifecycleTranslateHandler,  # Custom event translation
     # AGUI-side hooks for final processing
     agui_event_handler=LifecycleAGUIEventHandler,  # Post-process AGUI events
     agui_state_snapshot_handler=LifecycleStateHandler,  # Filter state snapshots
     # Input/output recorder for monitoring
-    in_out_record_handler=LifecycleIORecorder,  # Record I/O for debugging
+    in_out_record_handler=LifecycleIORecorder(),  # Record I/O for debugging
 )
 
 # SSE service with comprehensive lifecycle handling
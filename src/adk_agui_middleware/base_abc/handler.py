@@ -1,9 +1,17 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
-"""Abstract base classes for event and state handlers in the middleware."""
+"""Abstract base classes for event and state handlers in the middleware.
 
+The bases declare empty ``__slots__`` so that handlers which declare their
+own slots get instances without a per-instance ``__dict__``. Subclasses must
+define the awaited hooks with ``async def``; a plain ``def`` override would
+block the event loop, so it is rejected when the subclass is created.
+"""
+
+import inspect
 from abc import ABCMeta, abstractmethod
-from collections.abc import AsyncGenerator
-from typing import Any
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, ClassVar
 
 from ag_ui.core import BaseEvent, RunErrorEvent
 from google.adk.events import Event
@@ -12,6 +20,29 @@ from ..data_model.common import InputInfo, SessionLockConfig
 from ..data_model.event import TranslateEvent
 
 
+def _require_async_hooks(cls: type, hook_names: tuple[str, ...]) -> None:
+    """Reject subclasses that override an awaited hook with a plain function.
+
+    Args:
+        :param cls: Newly created handler subclass
+        :param hook_names: Names of the hooks the middleware awaits or iterates
+
+    Raises:
+        TypeError: If a hook defined on cls is a plain function that is
+            neither a coroutine function nor an async generator function
+    """
+    for name in hook_names:
+        hook = cls.__dict__.get(name)
+        if (
+            inspect.isfunction(hook)
+            and not inspect.iscoroutinefunction(hook)
+            and not inspect.isasyncgenfunction(hook)
+        ):
+            raise TypeError(
+                f"{cls.__qualname__}.{name} must be defined with 'async def'"
+            )
+
+
 class SessionLockHandler(metaclass=ABCMeta):
     """Abstract base class for session locking mechanism handlers.
 
@@ -20,6 +51,13 @@ class SessionLockHandler(metaclass=ABCMeta):
     Implementations should provide thread-safe locking mechanisms for session access.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that subclass hooks are asynchronous."""
+        super().__init_subclass__(**kwargs)
+        _require_async_hooks(cls, ("lock", "unlock", "get_locked_message"))
+
     @abstractmethod
     def __init__(self, lock_config: SessionLockConfig):
         """Initialize the session lock handler with configuration.
@@ -80,6 +118,28 @@ class SessionLockHandler(metaclass=ABCMeta):
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    @asynccontextmanager
+    async def locked(self, input_info: InputInfo) -> AsyncIterator[bool]:
+        """Hold the session lock for the duration of the context.
+
+        Acquires the lock on entry and yields whether it was acquired. The
+        lock is released on exit only if this context acquired it, so a
+        request that was turned away never releases a lock held by another
+        request.
+
+        Args:
+            :param input_info: Input information containing session identifiers
+
+        Yields:
+            True if the lock was acquired, False otherwise
+        """
+        acquired = await self.lock(input_info)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await self.unlock(input_info)
+
 
 class BaseTranslateHandler(metaclass=ABCMeta):
     """Abstract base class for event translation handlers.
@@ -90,6 +150,13 @@ class BaseTranslateHandler(metaclass=ABCMeta):
     or transformation of events during the translation pipeline.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that subclass hooks are asynchronous."""
+        super().__init_subclass__(**kwargs)
+        _require_async_hooks(cls, ("translate",))
+
     @abstractmethod
     def __init__(self, input_info: InputInfo | None):
         """Initialize the translate handler with input context.
@@ -128,6 +195,13 @@ class BaseADKEventHandler(metaclass=ABCMeta):
     or enrichment based on application-specific requirements.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that subclass hooks are asynchronous."""
+        super().__init_subclass__(**kwargs)
+        _require_async_hooks(cls, ("process",))
+
     @abstractmethod
     def __init__(self, input_info: InputInfo | None):
         """Initialize the ADK event handler with input context.
@@ -165,6 +239,13 @@ class BaseADKEventTimeoutHandler(metaclass=ABCMeta):
     This enables graceful handling of long-running or stuck agent processes.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that subclass hooks are asynchronous."""
+        super().__init_subclass__(**kwargs)
+        _require_async_hooks(cls, ("get_timeout", "process_timeout_fallback"))
+
     @abstractmethod
     def __init__(self, input_info: InputInfo | None):
         """Initialize the ADK event timeout handler with input context.
@@ -216,6 +297,13 @@ class BaseAGUIEventHandler(metaclass=ABCMeta):
     client capabilities, enrichment with additional data, or format customization.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that subclass hooks are asynchronous."""
+        super().__init_subclass__(**kwargs)
+        _require_async_hooks(cls, ("process",))
+
     @abstractmethod
     def __init__(self, input_info: InputInfo | None):
         """Initialize the AGUI event handler with input context.
@@ -255,6 +343,13 @@ class BaseAGUIStateSnapshotHandler(metaclass=ABCMeta):
     computed fields.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that subclass hooks are asynchronous."""
+        super().__init_subclass__(**kwargs)
+        _require_async_hooks(cls, ("process",))
+
     @abstractmethod
     def __init__(self, input_info: InputInfo | None):
         """Initialize the state snapshot handler with input context.
@@ -291,8 +386,34 @@ class BaseInOutHandler(metaclass=ABCMeta):
     as well as potentially modify or transform output data before transmission. This enables
     comprehensive audit logging, request/response transformation, and monitoring of all
     data flowing through the middleware.
+
+    Attributes:
+        modifies_output: Whether output_catch_and_change may change events; handlers
+            that always return the event unchanged set this to False so the
+            middleware skips that call for every streamed event
+        defers_input_record: Whether input_record may run in the background;
+            when True the middleware schedules it instead of awaiting it before
+            the response starts, and waits for it before the first output_record
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that subclass hooks are asynchronous."""
+        super().__init_subclass__(**kwargs)
+        _require_async_hooks(
+            cls,
+            (
+                "input_record",
+                "output_record",
+                "output_catch_and_change",
+                "output_process",
+            ),
+        )
+
+    modifies_output: ClassVar[bool] = True
+    defers_input_record: ClassVar[bool] = False
+
     @abstractmethod
     async def input_record(self, input_info: InputInfo) -> None:
         """Record incoming AGUI input for logging or audit purposes.
@@ -343,3 +464,22 @@ class BaseInOutHandler(metaclass=ABCMeta):
             NotImplementedError: Must be implemented by subclasses
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
+
+    async def output_process(self, agui_event: BaseEvent) -> BaseEvent:
+        """Record and potentially modify one outgoing AGUI event.
+
+        This is the single call the middleware makes for every streamed event.
+        The default records the event and then applies output_catch_and_change
+        unless modifies_output is False. Handlers can override it to record
+        and transform in one step, saving a coroutine per event.
+
+        Args:
+            :param agui_event: AGUI BaseEvent instance to record and potentially modify
+
+        Returns:
+            BaseEvent to send to the client (may be unchanged from input)
+        """
+        await self.output_record(agui_event)
+        if self.modifies_output:
+            return await self.output_catch_and_change(agui_event)
+        return agui_event
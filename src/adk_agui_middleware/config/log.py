@@ -19,6 +19,8 @@ class LogConfig(BaseSettings):
     """Enable or disable raw AGUI event logging for debugging."""
     LOG_EVENT_QUEUE: bool = False
     """Enable or disable logging of event queue message display."""
+    LOG_REQUEST_BODY_MAX_BYTES: int = 2048
+    """Maximum number of request body bytes included in request logs."""
 
 
 # Global log configuration instance
@@ -5,6 +5,7 @@ Defines the ``SessionLockConfig`` used by session lock handlers, and the
 ``InputInfo`` container that carries request context through the middleware.
 """
 
+import asyncio
 from typing import Any
 
 from ag_ui.core import RunAgentInput
@@ -54,6 +55,8 @@ class InputInfo(BaseModel):
         session_id: Session identifier for conversation persistence and state management
         initial_state: Optional initial state dictionary for new session initialization
         event_queue: Queue handler bundling ADK and AGUI queues for this interaction
+        input_record_task: Background input_record of a handler that defers it,
+            awaited before the first output is recorded
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -65,3 +68,4 @@ class InputInfo(BaseModel):
     session_id: str  # Session identifier for conversation persistence
     initial_state: dict[str, Any] | None = None  # Optional initial session state
     event_queue: QueueHandler
+    input_record_task: asyncio.Task[None] | None = None  # Deferred input record
@@ -42,6 +42,9 @@ class HandlerContext(BaseModel):
     Provides a configuration structure for customizing event processing
     behavior by injecting custom handlers at different stages of the pipeline.
     This enables extensible event processing through dependency injection.
+    Each optional handler may be given as a class, instantiated per request,
+    or as an instance that is shared by all requests; the latter suits
+    stateless handlers and must be safe for concurrent use.
 
     Attributes:
         session_lock_handler: Concrete SessionLockHandler class to enforce per-session mutual exclusion
@@ -58,12 +61,16 @@ class HandlerContext(BaseModel):
     session_lock_handler: type[SessionLockHandler] = Field(
         default_factory=_get_default_session_lock_handler
     )
-    adk_event_handler: type[BaseADKEventHandler] | None = None
-    adk_event_timeout_handler: type[BaseADKEventTimeoutHandler] | None = None
-    agui_event_handler: type[BaseAGUIEventHandler] | None = None
-    agui_state_snapshot_handler: type[BaseAGUIStateSnapshotHandler] | None = None
-    translate_handler: type[BaseTranslateHandler] | None = None
-    in_out_record_handler: type[BaseInOutHandler] | None = None
+    adk_event_handler: type[BaseADKEventHandler] | BaseADKEventHandler | None = None
+    adk_event_timeout_handler: (
+        type[BaseADKEventTimeoutHandler] | BaseADKEventTimeoutHandler | None
+    ) = None
+    agui_event_handler: type[BaseAGUIEventHandler] | BaseAGUIEventHandler | None = None
+    agui_state_snapshot_handler: (
+        type[BaseAGUIStateSnapshotHandler] | BaseAGUIStateSnapshotHandler | None
+    ) = None
+    translate_handler: type[BaseTranslateHandler] | BaseTranslateHandler | None = None
+    in_out_record_handler: type[BaseInOutHandler] | BaseInOutHandler | None = None
 
 
 class ConfigContext(BaseModel):
@@ -79,6 +86,9 @@ class ConfigContext(BaseModel):
         user_id: Static user ID or callable to extract from request context (required)
         session_id: Static session ID or callable to extract from request context
         extract_initial_state: Optional callable to extract initial session state from request
+        agui_event_queue_max_size: Maximum number of AGUI events buffered per request
+            before AGUI producers (translation and frontend tools) wait for the
+            client stream; 0 means unbounded. The ADK event queue stays unbounded
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -99,3 +109,4 @@ class ConfigContext(BaseModel):
     retune_on_stream_complete: bool = False
     is_add_adk_event_in_agui_event: bool = False
     auto_remove_agui_raw_event: bool = False
+    agui_event_queue_max_size: int = 0
@@ -1,12 +1,13 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Data model for structured log messages in AGUI middleware."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any
 
-from pydantic import BaseModel
 
-
-class LogMessage(BaseModel):
+@dataclass(slots=True)
+class LogMessage:
     """Structured log message model for consistent logging format.
 
     Contains all fields needed for comprehensive logging including context,
@@ -15,7 +16,9 @@ class LogMessage(BaseModel):
     enabling consistent log aggregation and analysis.
 
     This model supports both operational logging and debugging scenarios
-    with structured fields for different types of log data.
+    with structured fields for different types of log data. It is a plain
+    slotted dataclass rather than a Pydantic model because log messages are
+    write-only and built on every request, so validation is pure overhead.
 
     Attributes:
         msg: Primary log message content describing the event
@@ -36,8 +39,9 @@ class LogMessage(BaseModel):
     error_message: str | None = None
     """String representation of any exception that occurred."""
 
-    headers: dict[str, Any] | None = None
-    """HTTP request headers when logging request-related events."""
+    headers: Mapping[str, str] | None = None
+    """HTTP request headers when logging request-related events, kept as the
+    request's own mapping and only copied when the record is serialized."""
 
     request_body: str | None = None
     """HTTP request body content for request logging."""
@@ -47,3 +51,20 @@ class LogMessage(BaseModel):
 
     stack_message: Any | None = None
     """Stack trace information when an exception occurred."""
+
+    def to_dict(self, exclude_none: bool = False) -> dict[str, Any]:
+        """Convert the log message to a dictionary without deep-copying values.
+
+        Args:
+            :param exclude_none: Whether to omit fields whose value is None
+
+        Returns:
+            Dictionary of field names to field values
+        """
+        if exclude_none:
+            return {
+                field: value
+                for field in self.__slots__
+                if (value := getattr(self, field)) is not None
+            }
+        return {field: getattr(self, field) for field in self.__slots__}
@@ -6,6 +6,29 @@ from ag_ui.core import EventType, RunErrorEvent
 from ..loggers.record_log import record_error_log
 
 
+# Upper bound on exception text echoed back to clients in error events
+_MAX_EXCEPTION_TEXT_LENGTH = 256
+
+
+def _describe_exception(e: Exception) -> str:
+    """Render an exception for an error event message with bounded length.
+
+    Exceptions can carry arbitrarily large payloads in their arguments, so the
+    representation is truncated to keep error events small. The full details
+    are still available in the error log.
+
+    Args:
+        :param e: Exception to describe
+
+    Returns:
+        Exception representation truncated to a fixed maximum length
+    """
+    text = repr(e)
+    if len(text) <= _MAX_EXCEPTION_TEXT_LENGTH:
+        return text
+    return f"{text[:_MAX_EXCEPTION_TEXT_LENGTH]}..."
+
+
 class AGUIErrorEvent:
     """Utility class for creating specific types of AGUI error events.
 
@@ -30,7 +53,7 @@ class AGUIErrorEvent:
         """
         error_event = RunErrorEvent(
             type=EventType.RUN_ERROR,
-            message=f"Event encoding failed: {repr(e)}",
+            message=f"Event encoding failed: {_describe_exception(e)}",
             code="ENCODING_ERROR",
         )
         record_error_log("Event encoding failed", e)
@@ -52,7 +75,7 @@ class AGUIErrorEvent:
         """
         error_event = RunErrorEvent(
             type=EventType.RUN_ERROR,
-            message=f"Agent execution failed: {repr(e)}",
+            message=f"Agent execution failed: {_describe_exception(e)}",
             code="AGENT_ERROR",
         )
         record_error_log("AGUI Agent Error Handler", e)
@@ -73,7 +96,9 @@ class AGUIErrorEvent:
         """
         record_error_log("Error in new execution", e)
         return RunErrorEvent(
-            type=EventType.RUN_ERROR, message=repr(e), code="EXECUTION_ERROR"
+            type=EventType.RUN_ERROR,
+            message=_describe_exception(e),
+            code="EXECUTION_ERROR",
         )
 
     @staticmethod
@@ -135,7 +160,7 @@ class AGUIErrorEvent:
         record_error_log("Error handling tool results.", e)
         return RunErrorEvent(
             type=EventType.RUN_ERROR,
-            message=f"Failed to process tool results: {repr(e)}",
+            message=f"Failed to process tool results: {_describe_exception(e)}",
             code="TOOL_RESULT_PROCESSING_ERROR",
         )
 
@@ -1,8 +1,6 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Event translation service for converting ADK events to AGUI format with streaming support."""
 
-import uuid
-from collections.abc import AsyncGenerator
 from typing import Any
 
 from ag_ui.core import (
@@ -16,8 +14,10 @@ from ag_ui.core import (
     TextMessageStartEvent,
 )
 from google.adk.events import Event as ADKEvent
+from google.genai import types
 
 from ..loggers.record_log import record_debug_log, record_error_log, record_warning_log
+from ..tools.id_generator import generate_id
 from ..utils.translate import FunctionCallEventUtil, MessageEventUtil, StateEventUtil
 
 
@@ -34,23 +34,28 @@ class EventTranslator:
     - Handle tool call and function response translation
     - Process state deltas and custom metadata
     - Support long-running tool detection and management
+
+    Only the streaming and long-running tool bookkeeping is per request; the
+    translation utilities are stateless and shared by all translators.
     """
 
+    # Stateless translation helpers shared across translator instances
+    state_event_util = StateEventUtil()
+    function_call_event_util = FunctionCallEventUtil()
+    message_event_util = MessageEventUtil()
+
     def __init__(
         self, retune_on_stream_complete: bool = False, add_raw_event: bool = False
     ) -> None:
         """Initialize the event translator with empty state containers.
 
-        Sets up internal state tracking for streaming messages, long-running tools,
-        and utility classes for different types of event translation.
+        Sets up internal state tracking for streaming messages and long-running
+        tools for a single request.
         """
         self.retune_on_stream_complete = retune_on_stream_complete
         self.add_raw_event = add_raw_event
         self._streaming_message_id: dict[str, str] = {}
         self.long_running_tool_ids: dict[str, str] = {}  # IDs of long-running tools
-        self.state_event_util = StateEventUtil()
-        self.function_call_event_util = FunctionCallEventUtil()
-        self.message_event_util = MessageEventUtil()
 
     def _add_adk_event(self, raw_event: ADKEvent | None) -> ADKEvent | None:
         """Optionally attach the original ADK event to emitted AGUI events.
@@ -66,44 +71,52 @@ class EventTranslator:
         """
         return raw_event if self.add_raw_event else None
 
-    async def translate(self, adk_event: ADKEvent) -> AsyncGenerator[BaseEvent]:
+    def translate(self, adk_event: ADKEvent) -> list[BaseEvent]:
         """Translate an ADK event into corresponding AGUI events.
 
         Processes different types of ADK events (text content, function calls,
-        function responses, state updates) and yields appropriate AGUI events.
+        function responses, state updates) and returns appropriate AGUI events.
         This is the main entry point for event translation in the middleware.
+        Translation never awaits, so the events are built into a list instead
+        of being yielded through a chain of async generators.
 
         Args:
             :param adk_event: ADK event to translate
 
-        Yields:
-            BaseEvent objects in AGUI format
+        Returns:
+            List of BaseEvent objects in AGUI format, in emission order
         """
+        events: list[BaseEvent] = []
         try:
             # Skip user-authored events as they don't need translation
             if adk_event.author == "user":
-                return
-            # Handle text content streaming
+                return events
             if adk_event.content and adk_event.content.parts:
-                async for event in self.translate_text_content(adk_event):
-                    yield event
-            # Handle function calls with proper streaming closure
-            if adk_event.get_function_calls():
-                async for event in self._handle_function_calls(adk_event):
-                    yield event
-            # Handle function responses from tool execution
-            if adk_event.get_function_responses():
-                async for event in self.translate_function_responses(adk_event):
-                    yield event
+                # Classify the parts once instead of walking them per handler
+                combined_text, function_calls, function_responses = self._split_parts(
+                    adk_event.content.parts
+                )
+                # Handle text content streaming
+                events.extend(self._translate_text(adk_event, combined_text))
+                # Handle function calls with proper streaming closure
+                if function_calls:
+                    events.extend(
+                        self._handle_function_calls(adk_event, function_calls)
+                    )
+                # Handle function responses from tool execution
+                if function_responses:
+                    events.extend(
+                        self.translate_function_responses(adk_event, function_responses)
+                    )
             # Handle state updates and custom metadata
-            async for event in self._handle_additional_data(adk_event):
-                yield event
+            events.extend(self._handle_additional_data(adk_event))
         except Exception as e:
             record_error_log("Error translating ADK event.", e)
+        return events
 
-    async def _handle_function_calls(
-        self, adk_event: ADKEvent
-    ) -> AsyncGenerator[BaseEvent]:
+    def _handle_function_calls(
+        self, adk_event: ADKEvent, function_calls: list[types.FunctionCall]
+    ) -> list[BaseEvent]:
         """Handle function calls by closing streaming messages and translating calls.
 
         Ensures proper sequencing by closing any active streaming messages before
@@ -111,22 +124,22 @@ class EventTranslator:
 
         Args:
             :param adk_event: ADK event containing function calls
+            :param function_calls: Function calls already extracted from the event
 
-        Yields:
-            BaseEvent objects for function call handling
+        Returns:
+            List of BaseEvent objects for function call handling
         """
         # Force close any active streaming message before handling function calls
-        async for event in self.force_close_streaming_message():
-            yield event
+        events = self.force_close_streaming_message()
         # Translate the function calls to AGUI events
-        async for event in self.function_call_event_util.generate_function_calls_event(
-            adk_event.get_function_calls(), self._add_adk_event(adk_event)
-        ):
-            yield event
+        events.extend(
+            self.function_call_event_util._build_function_calls_events(
+                function_calls, self._add_adk_event(adk_event)
+            )
+        )
+        return events
 
-    async def _handle_additional_data(
-        self, adk_event: ADKEvent
-    ) -> AsyncGenerator[BaseEvent]:
+    def _handle_additional_data(self, adk_event: ADKEvent) -> list[BaseEvent]:
         """Handle additional data like state deltas and custom metadata.
 
         Processes auxiliary data from ADK events including state updates
@@ -135,26 +148,68 @@ class EventTranslator:
         Args:
             :param adk_event: ADK event potentially containing additional data
 
-        Yields:
-            BaseEvent objects for state updates and custom events
+        Returns:
+            List of BaseEvent objects for state updates and custom events
         """
+        events: list[BaseEvent] = []
         # Handle state delta updates
         if adk_event.actions and adk_event.actions.state_delta:
-            yield self.create_state_delta_event(
-                adk_event.actions.state_delta, adk_event=self._add_adk_event(adk_event)
+            events.append(
+                self.create_state_delta_event(
+                    adk_event.actions.state_delta,
+                    adk_event=self._add_adk_event(adk_event),
+                )
             )
         # Handle custom metadata as custom events
         if adk_event.custom_metadata:
-            yield CustomEvent(
-                type=EventType.CUSTOM,
-                name="adk_custom_metadata",
-                value=adk_event.custom_metadata,
-                raw_event=self._add_adk_event(adk_event),
+            events.append(
+                CustomEvent(
+                    type=EventType.CUSTOM,
+                    name="adk_custom_metadata",
+                    value=adk_event.custom_metadata,
+                    raw_event=self._add_adk_event(adk_event),
+                )
             )
+        return events
 
-    async def translate_text_content(
-        self, adk_event: ADKEvent
-    ) -> AsyncGenerator[BaseEvent]:
+    @staticmethod
+    def _split_parts(
+        parts: list[types.Part],
+    ) -> tuple[str, list[types.FunctionCall], list[types.FunctionResponse]]:
+        """Classify content parts into text, function calls and responses in one pass.
+
+        Replaces separate walks for the text, get_function_calls() and
+        get_function_responses(). Streaming chunks usually carry one text
+        part, whose string is returned as is; a list is only built and joined
+        when several parts carry text.
+
+        Args:
+            :param parts: Content parts of an ADK event
+
+        Returns:
+            Tuple of combined text (empty if none), function calls and function responses
+        """
+        combined_text = ""
+        text_parts: list[str] | None = None
+        function_calls: list[types.FunctionCall] = []
+        function_responses: list[types.FunctionResponse] = []
+        for part in parts:
+            if text := part.text:
+                if not combined_text:
+                    combined_text = text
+                elif text_parts is None:
+                    text_parts = [combined_text, text]
+                else:
+                    text_parts.append(text)
+            if part.function_call:
+                function_calls.append(part.function_call)
+            if part.function_response:
+                function_responses.append(part.function_response)
+        if text_parts is not None:
+            combined_text = "".join(text_parts)
+        return combined_text, function_calls, function_responses
+
+    def translate_text_content(self, adk_event: ADKEvent) -> list[BaseEvent]:
         """Translate text content from ADK event to AGUI streaming text events.
 
         Handles streaming text messages by managing message start, content chunks,
@@ -164,62 +219,79 @@ class EventTranslator:
         Args:
             :param adk_event: ADK event containing text content to translate
 
-        Yields:
-            AGUI text message events (start, content, end) for streaming text
+        Returns:
+            List of AGUI text message events (start, content, end) for streaming text
         """
         if not (adk_event.content and adk_event.content.parts):
-            return
-        text_parts = [part.text for part in adk_event.content.parts if part.text]
-        if not text_parts:
-            return
+            return []
+        return self._translate_text(
+            adk_event, self._split_parts(adk_event.content.parts)[0]
+        )
+
+    def _translate_text(
+        self, adk_event: ADKEvent, combined_text: str
+    ) -> list[BaseEvent]:
+        """Translate already-combined event text to AGUI text message events.
+
+        Args:
+            :param adk_event: ADK event the text was taken from
+            :param combined_text: Concatenated text of the event's content parts
+
+        Returns:
+            List of AGUI text message events (start, content, end) for the text
+        """
+        events: list[BaseEvent] = []
+        if not combined_text:
+            return events
         author_id = self._streaming_message_id.get(adk_event.author, None)
         add_adk_event = self._add_adk_event(adk_event)
+        # is_final_response() inspects every part, so evaluate it only once
+        is_final_response = adk_event.is_final_response()
 
-        if not author_id and adk_event.is_final_response() and not adk_event.partial:
-            async for agui_event in self.message_event_util.generate_message_event(
-                adk_event.id, "".join(text_parts), adk_event=add_adk_event
-            ):
-                yield agui_event
-            return
+        if not author_id and is_final_response and not adk_event.partial:
+            return self.message_event_util._build_message_events(
+                adk_event.id, combined_text, adk_event=add_adk_event
+            )
 
         # Start streaming if not already streaming and not a final response
-        if not author_id and not adk_event.is_final_response():
-            author_id = str(uuid.uuid4())
+        if not author_id and not is_final_response:
+            author_id = generate_id("msg_")
             self._streaming_message_id[adk_event.author] = author_id
-            yield TextMessageStartEvent(
-                type=EventType.TEXT_MESSAGE_START,
-                message_id=author_id,
-                role="assistant",
-                raw_event=add_adk_event,
+            events.append(
+                TextMessageStartEvent(
+                    type=EventType.TEXT_MESSAGE_START,
+                    message_id=author_id,
+                    role="assistant",
+                    raw_event=add_adk_event,
+                )
             )
 
         # Yield content if there's text and we're streaming
-        if (
-            author_id
-            and (combined_text := "".join(text_parts))
-            and not (
-                adk_event.is_final_response() and not self.retune_on_stream_complete
-            )
-        ):
-            yield TextMessageContentEvent(
-                type=EventType.TEXT_MESSAGE_CONTENT,
-                message_id=author_id,
-                delta=combined_text,
-                raw_event=add_adk_event,
+        if author_id and not (is_final_response and not self.retune_on_stream_complete):
+            events.append(
+                TextMessageContentEvent(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    message_id=author_id,
+                    delta=combined_text,
+                    raw_event=add_adk_event,
+                )
             )
 
         # End streaming on final response
-        if author_id and adk_event.is_final_response():
-            yield TextMessageEndEvent(
-                type=EventType.TEXT_MESSAGE_END,
-                message_id=author_id,
-                raw_event=add_adk_event,
+        if author_id and is_final_response:
+            events.append(
+                TextMessageEndEvent(
+                    type=EventType.TEXT_MESSAGE_END,
+                    message_id=author_id,
+                    raw_event=add_adk_event,
+                )
             )
             del self._streaming_message_id[adk_event.author]
+        return events
 
-    async def translate_long_running_function_calls(
+    def translate_long_running_function_calls(
         self, adk_event: ADKEvent
-    ) -> AsyncGenerator[BaseEvent]:
+    ) -> list[BaseEvent]:
         """Translate long-running operation (LRO) function calls to AGUI tool events.
 
         Processes function calls that are marked as long-running operations and
@@ -228,33 +300,39 @@ class EventTranslator:
         Args:
             :param adk_event: ADK event containing long-running function calls
 
-        Yields:
-            AGUI tool call events for long-running operations
+        Returns:
+            List of AGUI tool call events for long-running operations
         """
-        if not (adk_event.content and adk_event.content.parts):
-            return
+        events: list[BaseEvent] = []
+        long_running_tool_ids = adk_event.long_running_tool_ids
+        if not (
+            long_running_tool_ids and adk_event.content and adk_event.content.parts
+        ):
+            return events
         for part in adk_event.content.parts:
             if (
                 (not part.function_call)
                 or part.function_call.id is None
                 or part.function_call.name is None
-                or part.function_call.id not in (adk_event.long_running_tool_ids or [])
+                or part.function_call.id not in long_running_tool_ids
             ):
                 continue
             self.long_running_tool_ids[part.function_call.id] = part.function_call.name
-            async for (
-                agui_event
-            ) in self.function_call_event_util.generate_function_call_event(
-                part.function_call.id,
-                part.function_call.name,
-                part.function_call.args,
-                adk_event=self._add_adk_event(adk_event),
-            ):
-                yield agui_event
+            events.extend(
+                self.function_call_event_util._build_function_call_events(
+                    part.function_call.id,
+                    part.function_call.name,
+                    part.function_call.args,
+                    adk_event=self._add_adk_event(adk_event),
+                )
+            )
+        return events
 
-    async def translate_function_responses(
-        self, adk_event: ADKEvent
-    ) -> AsyncGenerator[BaseEvent]:
+    def translate_function_responses(
+        self,
+        adk_event: ADKEvent,
+        function_responses: list[types.FunctionResponse] | None = None,
+    ) -> list[BaseEvent]:
         """Translate function responses to AGUI tool call result events.
 
         Processes function execution responses and generates AGUI ToolCallResultEvent
@@ -263,21 +341,30 @@ class EventTranslator:
 
         Args:
             :param adk_event: ADK event containing one or more function responses
-        Yields:
-            AGUI ToolCallResultEvent objects for completed function calls
+            :param function_responses: Responses already extracted from the event, if any
+
+        Returns:
+            List of AGUI ToolCallResultEvent objects for completed function calls
         """
-        for func_response in adk_event.get_function_responses():
-            tool_call_id = func_response.id or str(uuid.uuid4())
+        events: list[BaseEvent] = []
+        if function_responses is None:
+            function_responses = adk_event.get_function_responses()
+        for func_response in function_responses:
+            tool_call_id = func_response.id or generate_id("call_")
             if not self.long_running_tool_ids.get(tool_call_id):
-                yield self.function_call_event_util.create_function_result_event(
-                    tool_call_id=tool_call_id,
-                    content=func_response.response,
-                    adk_event=self._add_adk_event(adk_event),
+                events.append(
+                    self.function_call_event_util.create_function_result_event(
+                        tool_call_id=tool_call_id,
+                        content=func_response.response,
+                        adk_event=self._add_adk_event(adk_event),
+                    )
                 )
             else:
                 record_debug_log(
-                    f"Skipping ToolCallResultEvent for long-running tool: {tool_call_id}"
+                    "Skipping ToolCallResultEvent for long-running tool: %s",
+                    args=(tool_call_id,),
                 )
+        return events
 
     def create_state_delta_event(
         self, state_delta: dict[str, Any], adk_event: ADKEvent | None = None
@@ -293,9 +380,10 @@ class EventTranslator:
         Returns:
             StateDeltaEvent with JSON Patch operations
         """
-        patches = []
-        for key, value in state_delta.items():
-            patches.append({"op": "add", "path": f"/{key}", "value": value})
+        patches = [
+            {"op": "add", "path": f"/{key}", "value": value}
+            for key, value in state_delta.items()
+        ]
         return self.state_event_util.create_state_delta_event_with_json_patch(
             patches, adk_event=self._add_adk_event(adk_event)
         )
@@ -318,22 +406,24 @@ class EventTranslator:
             state_snapshot, adk_event=self._add_adk_event(adk_event)
         )
 
-    async def force_close_streaming_message(self) -> AsyncGenerator[BaseEvent]:
+    def force_close_streaming_message(self) -> list[BaseEvent]:
         """Force close any active streaming message that wasn't properly terminated.
 
         This method is used to clean up streaming state when transitioning to
         function calls or other operations that require a clean state.
 
-        Yields:
-            TextMessageEndEvent if there was an active streaming message
+        Returns:
+            List with a TextMessageEndEvent per active streaming message
         """
         if not self._streaming_message_id:
-            return
+            return []
         record_warning_log(
-            f"🚨 Force-closing unterminated streaming message: {self._streaming_message_id}"
+            "🚨 Force-closing unterminated streaming message: %s",
+            args=(self._streaming_message_id,),
         )
-        for message_id in self._streaming_message_id.values():
-            yield TextMessageEndEvent(
-                type=EventType.TEXT_MESSAGE_END, message_id=message_id
-            )
+        events: list[BaseEvent] = [
+            TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=message_id)
+            for message_id in self._streaming_message_id.values()
+        ]
         self._streaming_message_id = {}
+        return events
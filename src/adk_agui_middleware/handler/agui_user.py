@@ -68,6 +68,11 @@ class AGUIUserHandler:
         self.queue_handler = queue_handler
         self.adk_queue = queue_handler.get_adk_queue()
         self.agui_queue = queue_handler.get_agui_queue()
+        # Session identifiers are fixed for the request and read on every run
+        # event, so they are copied once instead of resolved through properties
+        self.app_name: str = session_handler.app_name
+        self.user_id: str = session_handler.user_id
+        self.session_id: str = session_handler.session_id
 
         self.tool_call_info: dict[str, str] = {}
 
@@ -96,37 +101,12 @@ class AGUIUserHandler:
         """
         await self.running_handler.close()
 
-    @property
-    def app_name(self) -> str:
-        """Get the application name from the session handler.
-
-        Returns:
-            Application name string
-        """
-        return self.session_handler.app_name
-
-    @property
-    def user_id(self) -> str:
-        """Get the user ID from the session handler.
-
-        Returns:
-            User identifier string
-        """
-        return self.session_handler.user_id
-
-    @property
-    def session_id(self) -> str:
-        """Get the session ID from the session handler.
-
-        Returns:
-            Session identifier string
-        """
-        return self.session_handler.session_id
-
     @property
     def run_id(self) -> str:
         """Get the run ID from the user message content.
 
+        Stays a property because input conversion may replace the content.
+
         Returns:
             Run identifier string
         """
@@ -171,13 +151,14 @@ class AGUIUserHandler:
         Returns:
             True if the event contains long-running tool calls that should pause execution
         """
-        if not adk_event.long_running_tool_ids:
+        long_running_tool_ids = adk_event.long_running_tool_ids
+        if not long_running_tool_ids:
             return False
         for func_call in adk_event.get_function_calls():
             if (
-                func_call.id in adk_event.long_running_tool_ids
-                and func_call.id
+                func_call.id
                 and func_call.name
+                and func_call.id in long_running_tool_ids
             ):
                 self.tool_call_info[func_call.id] = func_call.name
                 return True
@@ -257,20 +238,24 @@ class AGUIUserHandler:
 
         Consumes ADK events from the ADK queue, translates them to AGUI
         events via the running handler, and forwards them to the AGUI queue.
+        The AGUI events translated from one ADK event are enqueued together.
         Guarantees a termination sentinel is sent even on exceptions.
         """
         async with agui_event_exception_handler(self.agui_queue):
             async for adk_event in self.adk_queue.get_iterator():
-                async for agui_event in self.running_handler.run_async_with_agui(
-                    adk_event
-                ):
-                    await self.agui_queue.put(agui_event)
+                await self.agui_queue.put_many(
+                    [
+                        agui_event
+                        async for agui_event in self.running_handler.run_async_with_agui(
+                            adk_event
+                        )
+                    ]
+                )
                 if self.check_is_long_running_tool(adk_event):
                     return
-            async for (
-                ag_ui_event
-            ) in self.running_handler.force_close_streaming_message():
-                await self.agui_queue.put(ag_ui_event)
+            await self.agui_queue.put_many(
+                self.running_handler.force_close_streaming_message()
+            )
             if (
                 event_final_state
                 := await self.running_handler.create_state_snapshot_event(
@@ -279,42 +264,14 @@ class AGUIUserHandler:
             ) is not None:
                 await self.agui_queue.put(event_final_state)
 
-    async def _run_workflow(self) -> AsyncGenerator[BaseEvent]:
-        """Execute the complete agent workflow with session management.
-
-        Manages the entire workflow including session creation, state updates,
-        agent execution, pending tool call management, and run completion.
-        This orchestrates the full lifecycle of an agent execution request.
-
-        Yields:
-            AGUI BaseEvent objects for the complete workflow
-        """
-        yield self.call_start()
-        await self.session_handler.check_and_create_session(
-            self.user_message_handler.initial_state
-        )
-        await self.session_handler.update_session_state(
-            self.user_message_handler.initial_state
-        )
-        try:
-            async with asyncio.TaskGroup() as tg:
-                tg.create_task(self._run_async_with_adk())
-                tg.create_task(self._run_async_with_agui())
-                async for agui_event in self.agui_queue.get_iterator():
-                    yield agui_event
-        except* Exception as eg:
-            for exc in eg.exceptions:
-                yield AGUIErrorEvent.create_execution_error_event(exc)
-        await self.session_handler.overwrite_pending_tool_calls(self.tool_call_info)
-        yield self.call_finished()
-
     async def run(self) -> AsyncGenerator[BaseEvent]:
         """Execute the complete AGUI user interaction workflow.
 
         Main entry point for processing user requests through the middleware.
-        Handles initialization, input processing, workflow execution, and error handling.
-        This method orchestrates the entire agent execution lifecycle from request
-        processing to response generation.
+        Handles initialization, input processing, session creation and state
+        updates, agent execution, pending tool call management, and run
+        completion. The whole workflow runs in this single generator so each
+        streamed event passes through one generator frame.
 
         Yields:
             BaseEvent objects representing the complete agent interaction workflow
@@ -327,8 +284,24 @@ class AGUIUserHandler:
             yield error
             return
         try:
-            async for event in self._run_workflow():
-                yield event
+            yield self.call_start()
+            session = await self.session_handler.check_and_create_session(
+                self.user_message_handler.initial_state
+            )
+            await self.session_handler.update_session_state(
+                self.user_message_handler.initial_state, session=session
+            )
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._run_async_with_adk())
+                    tg.create_task(self._run_async_with_agui())
+                    async for agui_event in self.agui_queue.get_iterator():
+                        yield agui_event
+            except* Exception as eg:
+                for exc in eg.exceptions:
+                    yield AGUIErrorEvent.create_execution_error_event(exc)
+            await self.session_handler.overwrite_pending_tool_calls(self.tool_call_info)
+            yield self.call_finished()
         except Exception as e:
             yield AGUIErrorEvent.create_execution_error_event(e)
         finally:
@@ -2,8 +2,9 @@
 """Handler for managing agent execution and event translation between ADK and AGUI formats."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable
-from typing import Any
+import inspect
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from typing import Any, cast
 
 from ag_ui.core import BaseEvent, StateSnapshotEvent, Tool
 from google.adk import Runner
@@ -29,6 +30,34 @@ from ..manager.queue import QueueManager
 from ..tools.frontend_tool import FrontendToolset
 
 
+# Handler hook awaited to obtain an async iterator of events
+_StreamMethod = Callable[..., Awaitable[AsyncIterator[Any]]]
+
+
+def _awaitable_stream(method: Callable[..., Any]) -> _StreamMethod:
+    """Adapt a handler stream method to the awaited calling convention.
+
+    Handler hooks such as ``process`` and ``translate`` are called by awaiting
+    them and iterating the result, which suits coroutines that return an
+    async iterator. Hooks written as async generators are wrapped so they can
+    be called the same way. The check runs once when the handler is bound,
+    so each event costs a plain ``await``.
+
+    Args:
+        :param method: Bound handler method returning or yielding events
+
+    Returns:
+        Callable that is awaited to obtain an async iterator of events
+    """
+    if not inspect.isasyncgenfunction(method):
+        return method
+
+    async def _open(*args: Any) -> AsyncIterator[Any]:
+        return cast(AsyncIterator[Any], method(*args))
+
+    return _open
+
+
 class RunningHandler:
     """Manages agent execution and event translation between ADK and AGUI formats.
 
@@ -74,6 +103,10 @@ class RunningHandler:
         self.agui_event_handler: BaseAGUIEventHandler | None = None
         self.agui_state_snapshot_handler: BaseAGUIStateSnapshotHandler | None = None
         self.translate_handler: BaseTranslateHandler | None = None
+        # Hot-path hook methods, adapted once when the handlers are bound
+        self._adk_event_process: _StreamMethod | None = None
+        self._agui_event_process: _StreamMethod | None = None
+        self._translate: _StreamMethod | None = None
         self._init_handler(handler_context)
 
     def _init_handler(self, handler_context: HandlerContext | None) -> None:
@@ -81,10 +114,13 @@ class RunningHandler:
 
         Creates instances of event handlers if they are configured in the handler context.
         Each handler type serves a specific purpose in the event processing pipeline,
-        enabling customization of event processing behavior.
+        enabling customization of event processing behavior. Handlers configured
+        as instances are shared as-is instead of being instantiated per request.
+        Their per-event hooks are adapted to the awaited calling convention here,
+        so they may be written as coroutines or as async generators.
 
         Args:
-            :param handler_context: Context containing handler class types to instantiate
+            :param handler_context: Context containing handler classes or shared instances
         """
         if handler_context is None:
             return
@@ -95,8 +131,20 @@ class RunningHandler:
             "agui_state_snapshot_handler",
             "translate_handler",
         ]:
-            if handler_class := getattr(handler_context, attr, None):
-                setattr(self, attr, handler_class(self.input_info))
+            if handler := getattr(handler_context, attr, None):
+                setattr(
+                    self,
+                    attr,
+                    handler(self.input_info) if isinstance(handler, type) else handler,
+                )
+        if self.adk_event_handler is not None:
+            self._adk_event_process = _awaitable_stream(self.adk_event_handler.process)
+        if self.agui_event_handler is not None:
+            self._agui_event_process = _awaitable_stream(
+                self.agui_event_handler.process
+            )
+        if self.translate_handler is not None:
+            self._translate = _awaitable_stream(self.translate_handler.translate)
 
     async def _get_timeout(self, enable_timeout: bool) -> float | None:
         """Get timeout duration for event processing if timeout is enabled.
@@ -118,73 +166,88 @@ class RunningHandler:
         """Handle timeout fallback when event processing exceeds time limit.
 
         Delegates to the timeout handler to generate appropriate fallback events
-        when agent processing exceeds the configured timeout duration.
+        when agent processing exceeds the configured timeout duration. The
+        fallback may be written as a coroutine or as an async generator.
 
         Yields:
             Fallback ADK events to process when timeout occurs, or None if no handler
         """
         if self.adk_event_timeout_handler is None:
             return
-        async for (
-            event
-        ) in await self.adk_event_timeout_handler.process_timeout_fallback():
+        fallback = _awaitable_stream(
+            self.adk_event_timeout_handler.process_timeout_fallback
+        )
+        async for event in await fallback():
             yield event
 
     @staticmethod
-    async def _process_single_event(
-        event: BaseEvent | Event,
+    async def _process_events(
+        event_stream: AsyncGenerator,  # type: ignore[type-arg]
         log_func: Any,
-        event_handler: BaseADKEventHandler | BaseAGUIEventHandler | None,
+        process: _StreamMethod | None,
     ) -> AsyncGenerator[BaseEvent | Event]:
-        """Process a single event with logging and optional custom event handler.
+        """Process each event of a stream with logging and optional custom event handler.
 
-        Logs the event and optionally processes it through a custom handler.
+        Logs every event and optionally processes it through a custom handler.
         User-authored events are passed through unchanged to avoid infinite loops.
+        The whole stream is handled in this one generator, so no generator is
+        created per event.
 
         Args:
-            :param event: Event to process (ADK or AGUI format)
-            :param log_func: Logging function to record the event
-            :param event_handler: Optional custom handler to process the event
+            :param event_stream: Async generator of events to process
+            :param log_func: Logging function to record each event
+            :param process: Optional bound handler hook that processes each event
 
         Yields:
             Processed events (original or modified by handler)
         """
-        log_func(event)
-        if not event_handler or (isinstance(event, Event) and event.author == "user"):
-            yield event
+        if process is None:
+            async for event in event_stream:
+                log_func(event)
+                yield event
             return
-        async for new_event in await event_handler.process(event):  # type: ignore[arg-type]
-            if new_event:
-                yield new_event
+        async for event in event_stream:
+            log_func(event)
+            if isinstance(event, Event) and event.author == "user":
+                yield event
+                continue
+            async for new_event in await process(event):
+                if new_event:
+                    yield new_event
 
     async def _process_events_with_handler(
         self,
         event_stream: AsyncGenerator,  # type: ignore[type-arg]
         log_func: Any,
-        event_handler: BaseADKEventHandler | BaseAGUIEventHandler | None = None,
+        process: _StreamMethod | None = None,
         enable_timeout: bool = False,
     ) -> AsyncGenerator:  # type: ignore[type-arg]
         """Process an event stream with optional event handler and logging.
 
         Applies logging to all events and optionally processes them through
-        a custom event handler before yielding them.
+        a custom event handler before yielding them. Streams without a
+        timeout, such as the per-event AGUI translation, skip the timeout
+        scope entirely.
 
         Args:
             :param event_stream: Async generator of events to process
             :param log_func: Function to call for logging each event
-            :param event_handler: Optional handler to process events before yielding
+            :param process: Optional bound handler hook to process events before yielding
             :param enable_timeout: Whether to enable timeout handling for ADK events
 
         Yields:
             Events from the stream, potentially modified by the event handler
         """
+        timeout = await self._get_timeout(enable_timeout) if enable_timeout else None
+        events = self._process_events(event_stream, log_func, process)
         try:
-            async with asyncio.timeout(await self._get_timeout(enable_timeout)):
-                async for event in event_stream:
-                    async for processed_event in self._process_single_event(
-                        event, log_func, event_handler
-                    ):
-                        yield processed_event
+            if timeout is None:
+                async for event in events:
+                    yield event
+                return
+            async with asyncio.timeout(timeout):
+                async for event in events:
+                    yield event
         except TimeoutError:
             record_warning_log("Timeout occurred while processing events.")
             async for fallback_event in self._handle_timeout_fallback():
@@ -192,7 +255,7 @@ class RunningHandler:
 
     def _select_translation_function(
         self, adk_event: Event
-    ) -> Callable[[Event], AsyncGenerator[BaseEvent]]:
+    ) -> Callable[[Event], list[BaseEvent]]:
         """Select appropriate translation function based on event characteristics.
 
         Determines whether to use standard translation or long-running function
@@ -225,10 +288,8 @@ class RunningHandler:
         Yields:
             AGUI BaseEvent objects translated from the ADK event
         """
-        if self.translate_handler:
-            async for translate_event in await self.translate_handler.translate(
-                adk_event
-            ):
+        if self._translate is not None:
+            async for translate_event in await self._translate(adk_event):
                 if translate_event.agui_event is not None:
                     yield translate_event.agui_event
                 if translate_event.is_retune:
@@ -236,8 +297,7 @@ class RunningHandler:
                 if translate_event.adk_event and translate_event.is_replace:
                     adk_event = translate_event.adk_event
 
-        translate_func = self._select_translation_function(adk_event)
-        async for agui_event in translate_func(adk_event):
+        for agui_event in self._select_translation_function(adk_event)(adk_event):
             yield agui_event
 
     def _update_agent_tools_recursive(
@@ -254,10 +314,10 @@ class RunningHandler:
             :param agui_queue: Queue for emitting AGUI tool call events
             :param frontend_tools: List of frontend Tool definitions to expose
         """
-        for tool in getattr(agent, "tools", []):
+        for tool in getattr(agent, "tools", ()):
             if isinstance(tool, FrontendToolset):
                 tool.set_frontend_tools(agui_queue, frontend_tools)
-        for sub_agent in getattr(agent, "sub_agents", []):
+        for sub_agent in getattr(agent, "sub_agents", ()):
             self._update_agent_tools_recursive(sub_agent, agui_queue, frontend_tools)
 
     def update_agent_tools(
@@ -288,7 +348,7 @@ class RunningHandler:
         """
         self.event_translator.long_running_tool_ids = long_running_tool_ids
 
-    def force_close_streaming_message(self) -> AsyncGenerator[BaseEvent]:
+    def force_close_streaming_message(self) -> list[BaseEvent]:
         """Force close any active streaming message in the event translator.
 
         Delegates to the event translator to handle cleanup of unclosed
@@ -296,7 +356,7 @@ class RunningHandler:
         proper message closure for incomplete streaming responses.
 
         Returns:
-            AsyncGenerator yielding events for closing streaming messages
+            List of events closing the streaming messages
         """
         return self.event_translator.force_close_streaming_message()
 
@@ -345,7 +405,7 @@ class RunningHandler:
         return self._process_events_with_handler(
             self.runner.run_async(*args, run_config=self.run_config, **kwargs),
             record_event_raw_log,
-            self.adk_event_handler,
+            self._adk_event_process,
             enable_timeout=True,
         )
 
@@ -368,7 +428,7 @@ class RunningHandler:
         return self._process_events_with_handler(
             runner,
             record_event_raw_log,
-            self.adk_event_handler,
+            self._adk_event_process,
         )
 
     def run_async_with_agui(self, adk_event: Event) -> AsyncGenerator[BaseEvent]:
@@ -387,7 +447,7 @@ class RunningHandler:
         return self._process_events_with_handler(
             self._translate_adk_to_agui_async(adk_event),
             record_agui_raw_log,
-            self.agui_event_handler,
+            self._agui_event_process,
         )
 
     async def close(self) -> None:
@@ -1,6 +1,7 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Session handler for managing user session state and tool call lifecycle."""
 
+from collections.abc import Awaitable, Callable
 from typing import Any, cast
 
 from google.adk.sessions import Session
@@ -17,6 +18,10 @@ class SessionHandler:
     session state updates, and session lifecycle. Acts as a bridge between the AGUI
     handler layer and the underlying session management infrastructure.
 
+    Simple delegations to the session manager are plain methods returning the
+    manager's awaitable, so callers await it directly without an extra
+    coroutine frame per call.
+
     Key Responsibilities:
     - Manage session lifecycle (creation, retrieval, state updates)
     - Track pending tool calls for HITL (Human-in-the-Loop) workflows
@@ -38,35 +43,12 @@ class SessionHandler:
         """
         self.session_manager = session_manager
         self.session_parameter = session_parameter
+        # Identifiers copied onto the instance; they are read on every log line
+        self.app_name = session_parameter.app_name
+        self.user_id = session_parameter.user_id
+        self.session_id = session_parameter.session_id
 
-    @property
-    def app_name(self) -> str:
-        """Get the application name from session parameters.
-
-        Returns:
-            Application name string
-        """
-        return self.session_parameter.app_name
-
-    @property
-    def user_id(self) -> str:
-        """Get the user ID from session parameters.
-
-        Returns:
-            User identifier string
-        """
-        return self.session_parameter.user_id
-
-    @property
-    def session_id(self) -> str:
-        """Get the session ID from session parameters.
-
-        Returns:
-            Session identifier string
-        """
-        return self.session_parameter.session_id
-
-    async def get_session(self) -> Session | None:
+    def get_session(self) -> Awaitable[Session | None]:
         """Retrieve the session object for this handler's parameters.
 
         Delegates to the session manager to retrieve the session identified
@@ -75,9 +57,9 @@ class SessionHandler:
         Returns:
             Session object if found, None otherwise
         """
-        return await self.session_manager.get_session(self.session_parameter)
+        return self.session_manager.get_session(self.session_parameter)
 
-    async def get_session_state(self) -> dict[str, Any]:
+    def get_session_state(self) -> Awaitable[dict[str, Any]]:
         """Get the current state dictionary for this session.
 
         Retrieves the complete state dictionary from the session,
@@ -86,11 +68,11 @@ class SessionHandler:
         Returns:
             Dictionary containing session state key-value pairs
         """
-        return await self.session_manager.get_session_state(self.session_parameter)
+        return self.session_manager.get_session_state(self.session_parameter)
 
-    async def check_and_create_session(
+    def check_and_create_session(
         self, initial_state: dict[str, Any] | None = None
-    ) -> Session:
+    ) -> Awaitable[Session]:
         """Create session if it doesn't exist, otherwise return existing session.
 
         Implements the "get or create" pattern for sessions, ensuring a session
@@ -102,13 +84,15 @@ class SessionHandler:
         Returns:
             Session object (either existing or newly created)
         """
-        return await self.session_manager.check_and_create_session(
+        return self.session_manager.check_and_create_session(
             session_parameter=self.session_parameter, initial_state=initial_state
         )
 
-    async def update_session_state(
-        self, initial_state: dict[str, Any] | None = None
-    ) -> bool:
+    def update_session_state(
+        self,
+        initial_state: dict[str, Any] | None = None,
+        session: Session | None = None,
+    ) -> Awaitable[bool]:
         """Update the session state with new values.
 
         Applies the provided state updates to the current session,
@@ -116,15 +100,33 @@ class SessionHandler:
 
         Args:
             :param initial_state: Dictionary of state updates to apply
+            :param session: Already-fetched session to update, fetched when omitted
 
         Returns:
             True if update was successful, False otherwise
         """
-        return await self.session_manager.update_session_state(
+        return self.session_manager.update_session_state(
             session_parameter=self.session_parameter,
             state_updates=initial_state,
+            session=session,
         )
 
+    def mutate_state(
+        self, mutate: Callable[[dict[str, Any]], dict[str, Any]]
+    ) -> Awaitable[bool]:
+        """Apply a read-modify-write transform to the session state.
+
+        Fetches the session once and persists only the changed keys as a
+        single state delta event.
+
+        Args:
+            :param mutate: Function mapping the current state to the new state
+
+        Returns:
+            True if the state was updated or already up to date, False if session not found
+        """
+        return self.session_manager.mutate_state(self.session_parameter, mutate)
+
     async def overwrite_pending_tool_calls(
         self, tool_call_info: dict[str, str]
     ) -> None:
@@ -138,7 +140,8 @@ class SessionHandler:
             :param tool_call_info: Dictionary mapping tool call IDs to function names
         """
         record_log(
-            f"Update pending tool call {tool_call_info} for session {self.session_parameter.session_id}, app_name={self.session_parameter.app_name}, user_id={self.session_parameter.user_id}"
+            "Update pending tool call %s for session %s, app_name=%s, user_id=%s",
+            args=(tool_call_info, self.session_id, self.app_name, self.user_id),
         )
         try:
             if await self.session_manager.update_session_state(
@@ -146,11 +149,12 @@ class SessionHandler:
                 state_updates={"pending_tool_calls": tool_call_info},
             ):
                 record_log(
-                    f"Update tool call {tool_call_info} to session {self.session_parameter.session_id} pending list"
+                    "Update tool call %s to session %s pending list",
+                    args=(tool_call_info, self.session_id),
                 )
         except Exception as e:
             record_error_log(
-                f"Failed to add pending tool call {tool_call_info} to session {self.session_parameter.session_id}.",
+                f"Failed to add pending tool call {tool_call_info} to session {self.session_id}.",
                 e,
             )
 
@@ -160,19 +164,22 @@ class SessionHandler:
         Gets the list of tool calls that are awaiting human results, which
         is crucial for resuming HITL workflows correctly. These pending calls
         represent long-running operations that have been submitted to humans
-        for completion.
+        for completion. Only the pending tool calls entry is read, in a single
+        session lookup; a missing session yields no pending calls.
 
         Returns:
             Dictionary mapping tool call IDs to function names for pending tools
         """
         try:
-            session_state = await self.session_manager.get_session_state(
-                self.session_parameter
+            return cast(
+                dict[str, str],
+                await self.session_manager.get_state_value(
+                    self.session_parameter, "pending_tool_calls", {}
+                ),
             )
-            return cast(dict[str, str], session_state.get("pending_tool_calls", {}))
         except Exception as e:
             record_error_log(
-                f"Failed to check pending tool calls for session {self.session_parameter.session_id}.",
+                f"Failed to check pending tool calls for session {self.session_id}.",
                 e,
             )
             return {}
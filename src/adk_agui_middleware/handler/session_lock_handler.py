@@ -2,8 +2,8 @@
 """Default implementation of session locking for preventing concurrent access."""
 
 import asyncio
+import heapq
 import time
-from typing import Any
 
 from ag_ui.core import RunErrorEvent
 
@@ -12,18 +12,23 @@ from ..data_model.common import InputInfo, SessionLockConfig
 from ..event.error_event import AGUIErrorEvent
 
 
+# Stale deadline entries tolerated before the heap is rebuilt from held locks
+_DEADLINE_SLACK = 64
+
+
 class DefaultSessionLockHandler(SessionLockHandler):
     """Default session lock handler implementation using in-memory locks with timeout.
 
-    Provides thread-safe session locking with automatic timeout and cleanup to prevent
-    concurrent access to session data. Uses asyncio locks internally for concurrency
-    control and implements retry logic for lock acquisition.
+    Provides session locking with automatic timeout and cleanup to prevent
+    concurrent access to session data and implements retry logic for lock
+    acquisition. All lock bookkeeping is synchronous dictionary work with no
+    await points, so it is atomic on the event loop without an extra lock.
 
     Key Features:
     - Automatic timeout-based lock cleanup to prevent deadlocks
     - Configurable retry mechanism for lock acquisition
-    - Thread-safe lock management using asyncio.Lock
-    - In-memory lock storage with timestamp tracking
+    - Lock-free bookkeeping that never suspends between check and insert
+    - In-memory lock storage keyed by session ID with acquisition timestamps
     - Graceful error handling for locked sessions
     """
 
@@ -37,41 +42,59 @@ class DefaultSessionLockHandler(SessionLockHandler):
             :param lock_config: Configuration object containing lock timeout and retry settings
         """
         self.lock_config = lock_config
-        # Dictionary to store session locks with metadata
-        # Structure: {session_id: {"timestamp": float, "locked_at": str}}
-        self.locks: dict[str, dict[str, Any]] = {}
-        # Internal asyncio lock to ensure thread-safe access to locks dictionary
-        self.internal_lock = asyncio.Lock()
+        # Monotonic acquisition timestamp of each held lock, keyed by session ID
+        self.locks: dict[str, float] = {}
+        # Min-heap of (expiry deadline, session_id) for timeout-based cleanup
+        self._deadlines: list[tuple[float, str]] = []
 
-    def _cleanup_expired_lock(self, session_id: str) -> None:
-        """Clean up expired locks based on configured timeout.
+    def _cleanup_expired_locks(self, now: float) -> None:
+        """Clean up all expired locks based on configured timeout.
 
         Removes locks that have exceeded the configured timeout duration to prevent
-        permanent lock situations. This method is called automatically during lock
-        operations to maintain lock hygiene.
+        permanent lock situations, including locks of sessions that are never
+        requested again. Expiry deadlines are kept in a min-heap, so only
+        entries that are actually due are inspected. Heap entries for locks that
+        were already released or re-acquired are discarded lazily.
 
         Args:
-            :param session_id: Session identifier to check for expiration
-
-        Note:
-            This method should only be called while holding the internal lock
-            to ensure thread safety during lock dictionary modifications.
+            :param now: Current monotonic time used to decide expiration
         """
-        if session_id not in self.locks:
+        lock_timeout = self.lock_config.lock_timeout
+        if lock_timeout is None:
             return
-        # Check if lock has exceeded the configured timeout
-        if (
-            time.time() - self.locks[session_id]["timestamp"]
-            >= self.lock_config.lock_timeout
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            _, session_id = heapq.heappop(deadlines)
+            locked_at = self.locks.get(session_id)
+            # Only drop the lock if it is the one this deadline was pushed for
+            if locked_at is not None and now - locked_at >= lock_timeout:
+                del self.locks[session_id]
+
+    def _compact_deadlines(self) -> None:
+        """Drop heap entries of locks that were released before they expired.
+
+        Released locks leave their deadline in the heap until it is due. Once
+        stale entries outnumber the held locks by more than a small slack, the
+        heap is rebuilt with one entry per held lock, so its size stays
+        proportional to the number of held locks rather than the request rate.
+        """
+        lock_timeout = self.lock_config.lock_timeout
+        if lock_timeout is None or len(self._deadlines) <= (
+            2 * len(self.locks) + _DEADLINE_SLACK
         ):
-            del self.locks[session_id]
+            return
+        self._deadlines = [
+            (locked_at + lock_timeout, session_id)
+            for session_id, locked_at in self.locks.items()
+        ]
+        heapq.heapify(self._deadlines)
 
-    async def _try_acquire_lock(self, session_id: str) -> bool:
+    def _try_acquire_lock(self, session_id: str) -> bool:
         """Attempt to acquire a lock for the specified session.
 
         Tries to acquire an exclusive lock for the session, cleaning up expired
         locks first and then checking availability. If successful, records the
-        lock with timestamp and formatted acquisition time.
+        acquisition timestamp for the session.
 
         Args:
             :param session_id: Session identifier to lock
@@ -80,25 +103,26 @@ class DefaultSessionLockHandler(SessionLockHandler):
             True if lock was successfully acquired, False if session is already locked
 
         Note:
-            This method is thread-safe and handles internal lock management.
+            The check and insert run without an await in between, so they are
+            atomic with respect to other coroutines on the event loop.
         """
-        async with self.internal_lock:
-            # Clean up any expired locks first
-            self._cleanup_expired_lock(session_id)
-
-            # Check if session is already locked
-            if session_id in self.locks:
-                return False
-
-            # Acquire lock by recording current time and readable timestamp
-            current_time = time.time()
-            self.locks[session_id] = {
-                "timestamp": current_time,
-                "locked_at": time.strftime(
-                    "%Y-%m-%d %H:%M:%S", time.localtime(current_time)
-                ),
-            }
-            return True
+        # Clean up any expired locks first; the monotonic clock is immune to
+        # wall-clock adjustments that could expire or pin locks early
+        current_time = time.monotonic()
+        self._cleanup_expired_locks(current_time)
+
+        # Check if session is already locked
+        if session_id in self.locks:
+            return False
+
+        # Acquire lock by recording the current time
+        if self.lock_config.lock_timeout is not None:
+            heapq.heappush(
+                self._deadlines,
+                (current_time + self.lock_config.lock_timeout, session_id),
+            )
+        self.locks[session_id] = current_time
+        return True
 
     async def lock(self, input_info: InputInfo) -> bool:
         """Acquire a lock for the session with retry logic.
@@ -114,13 +138,13 @@ class DefaultSessionLockHandler(SessionLockHandler):
             True if lock was successfully acquired, False if all retry attempts failed
         """
         # Try immediate acquisition first
-        if await self._try_acquire_lock(input_info.session_id):
+        if self._try_acquire_lock(input_info.session_id):
             return True
 
         # Implement retry logic with configurable delays
         for _ in range(self.lock_config.lock_retry_times):
             await asyncio.sleep(self.lock_config.lock_retry_interval)
-            if await self._try_acquire_lock(input_info.session_id):
+            if self._try_acquire_lock(input_info.session_id):
                 return True
 
         # All retry attempts failed
@@ -129,15 +153,14 @@ class DefaultSessionLockHandler(SessionLockHandler):
     async def unlock(self, input_info: InputInfo) -> None:
         """Release the lock for the specified session.
 
-        Removes the session lock, allowing other requests to access the session.
-        Also performs cleanup of expired locks during the operation.
+        Removes the session lock, allowing other requests to access the session,
+        and compacts the expiry heap when released locks have piled up in it.
 
         Args:
             :param input_info: Input information containing session identifiers
         """
-        async with self.internal_lock:
-            if input_info.session_id in self.locks:
-                del self.locks[input_info.session_id]
+        self.locks.pop(input_info.session_id, None)
+        self._compact_deadlines()
 
     async def get_locked_message(self, input_info: InputInfo) -> RunErrorEvent:
         """Generate an error event indicating that the session is locked.
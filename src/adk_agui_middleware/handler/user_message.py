@@ -4,17 +4,23 @@
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from ag_ui.core import RunAgentInput, Tool, ToolMessage, UserMessage
+from ag_ui.core import RunAgentInput, Tool, ToolMessage
 from fastapi import Request
 from google.genai import types
 
 
+# Sentinel marking a cached message lookup that has not been computed yet
+_UNSET: Any = object()
+
+
 class UserMessageHandler:
     """Handles processing of user messages and tool results in AGUI middleware.
 
     Manages user message extraction, tool result submissions, and HITL workflow transitions.
     This handler is responsible for determining whether incoming messages are new user
     requests or tool result submissions, and converting them to appropriate ADK format.
+    Message lookups are computed once per request and cached until the AGUI
+    content is replaced by input conversion.
 
     Key Responsibilities:
     - Extract user messages from AGUI RunAgentInput
@@ -51,6 +57,13 @@ class UserMessageHandler:
         self.request = request
         self.initial_state = initial_state
         self.convert_run_agent_input = convert_run_agent_input
+        self._tool_result_submission: ToolMessage | None = _UNSET
+        self._latest_message: types.Content | None = _UNSET
+
+    def _reset_message_cache(self) -> None:
+        """Drop cached message lookups after the AGUI content changes."""
+        self._tool_result_submission = _UNSET
+        self._latest_message = _UNSET
 
     @property
     def thread_id(self) -> str:
@@ -77,13 +90,12 @@ class UserMessageHandler:
         Note:
             This determines the HITL workflow branch: completion vs. initiation.
         """
-        if not self.agui_content.messages:
-            return None
-        return (
-            self.agui_content.messages[-1]
-            if isinstance(self.agui_content.messages[-1], ToolMessage)
-            else None
-        )
+        if self._tool_result_submission is _UNSET:
+            messages = self.agui_content.messages
+            self._tool_result_submission = (
+                messages[-1] if messages and messages[-1].role == "tool" else None
+            )
+        return self._tool_result_submission
 
     @property
     def frontend_tools(self) -> list[Tool]:
@@ -110,21 +122,33 @@ class UserMessageHandler:
             self.agui_content = await self.convert_run_agent_input(
                 self.agui_content, tool_call_info
             )
+            self._reset_message_cache()
 
     def get_latest_message(self) -> types.Content | None:
         """Extract the latest user message from the AGUI content.
 
         Searches through messages in reverse order to find the most recent
         user message with content, converting it to ADK format for agent processing.
+        The scan runs at most once per AGUI content.
+
+        Returns:
+            ADK Content object containing the user message, or None if no user message found
+        """
+        if self._latest_message is _UNSET:
+            self._latest_message = self._find_latest_message()
+        return self._latest_message
+
+    def _find_latest_message(self) -> types.Content | None:
+        """Scan messages from newest to oldest for the latest user text message.
 
         Returns:
             ADK Content object containing the user message, or None if no user message found
         """
-        if not self.agui_content.messages:
-            return None
         for message in reversed(self.agui_content.messages):
+            # Compare the role tag rather than isinstance, which is markedly
+            # slower against pydantic model classes in this loop
             if (
-                isinstance(message, UserMessage)
+                message.role == "user"
                 and message.content
                 and isinstance(message.content, str)
             ):
@@ -1,14 +1,22 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """JSON logging formatter and logger configuration for AGUI middleware."""
 
+import atexit
 import json
 import logging as log
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from ..config.log import log_config
 from ..tools.json_encoder import PydanticJsonEncoder
 
 
+# Sentinel for record attributes that are not present
+_MISSING = object()
+
+
 class JsonFormatter(log.Formatter):
     """Custom JSON formatter for structured logging.
 
@@ -33,11 +41,36 @@ class JsonFormatter(log.Formatter):
         """
         super().__init__()
         self.cls = cls
+        self._encoder = self._create_encoder(cls or json.JSONEncoder)
         self.fmt_dict = fmt_dict if fmt_dict is not None else {"message": "message"}
         self.default_time_format = time_format
         self.default_msec_format = msec_format
         self.datefmt = None
 
+    @staticmethod
+    def _create_encoder(encoder_cls: type[json.JSONEncoder]) -> json.JSONEncoder:
+        """Build the reusable JSON encoder for formatted records.
+
+        The encoder is created once per formatter instead of on every record.
+        Objects are serialized with the encoder class's own default() first
+        and fall back to str() for anything it cannot handle.
+
+        Args:
+            :param encoder_cls: JSON encoder class providing custom serialization
+
+        Returns:
+            JSON encoder instance used to serialize every log record
+        """
+        base_encoder = encoder_cls(ensure_ascii=False)
+
+        def _default(o: Any) -> Any:
+            try:
+                return base_encoder.default(o)
+            except TypeError:
+                return str(o)
+
+        return encoder_cls(ensure_ascii=False, default=_default)
+
     def uses_time(self) -> bool:
         """Check if the formatter requires timestamp formatting.
 
@@ -57,8 +90,10 @@ class JsonFormatter(log.Formatter):
         """
         message_dict = {}
         for fmt_key, fmt_val in self.fmt_dict.items():
-            if hasattr(record, fmt_val):
-                message_dict[fmt_key] = getattr(record, fmt_val)
+            # Single lookup with a sentinel instead of hasattr() followed by getattr()
+            value = getattr(record, fmt_val, _MISSING)
+            if value is not _MISSING:
+                message_dict[fmt_key] = value
         return message_dict
 
     def format(self, record: log.LogRecord) -> str:
@@ -94,8 +129,54 @@ class JsonFormatter(log.Formatter):
         # Add the main message
         message_dict["message"] = record.msg
 
-        # Serialize to JSON with custom encoder
-        return json.dumps(message_dict, default=str, cls=self.cls, ensure_ascii=False)
+        # Serialize to JSON with the cached custom encoder
+        return self._encoder.encode(message_dict)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue handler that hands records to the listener unformatted.
+
+    The middleware logs structured dictionaries that the JSON formatter of
+    the downstream handlers serializes, so the record must reach them as-is
+    rather than with its message pre-formatted to a string.
+    """
+
+    def prepare(self, record: log.LogRecord) -> log.LogRecord:
+        """Return the record unchanged for the listener thread.
+
+        Args:
+            :param record: Log record being enqueued
+
+        Returns:
+            The same log record
+        """
+        return record
+
+
+def create_queue_listener(logger: log.Logger) -> QueueListener:
+    """Move the logger's handlers behind a queue served by a listener thread.
+
+    Logging calls only enqueue the record, so formatting and stream I/O run
+    on the listener thread instead of the event loop. All levels share one
+    unbounded queue, so no record is dropped and records keep their order.
+    The listener is stopped at interpreter exit, which writes out every
+    record still queued.
+
+    Args:
+        :param logger: Logger whose handlers should run on the listener thread
+
+    Returns:
+        Started queue listener owning the logger's original handlers
+    """
+    records: queue.SimpleQueue[log.LogRecord] = queue.SimpleQueue()
+    handlers = tuple(logger.handlers)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(_RecordQueueHandler(records))
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 
 def create_logger(name: str, fmt_dict: dict[str, str] | None = None) -> log.Logger:
@@ -144,3 +225,61 @@ logging = create_logger(
         "level": "levelname",
     },
 )
+
+# Listener serving the default logger; None until the application opts in
+log_listener: QueueListener | None = None
+# Whether the at-fork hook restarting the listener in children is registered
+_fork_hook_registered = False
+
+
+def _restart_log_listener_in_child() -> None:
+    """Serve the log queue in a forked worker, whose listener thread is gone."""
+    global log_listener  # noqa: PLW0603
+    if log_listener is None:
+        return
+    log_listener = QueueListener(
+        log_listener.queue, *log_listener.handlers, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+def start_log_listener() -> QueueListener:
+    """Write the default logger's records from a background thread.
+
+    Opt-in, so importing the middleware neither starts a thread nor touches
+    the logger's handlers. Call it once the process is set up, ideally in
+    each worker after forking such as from the application's startup hook,
+    so logging never blocks the event loop. Calling it again is a no-op; a
+    listener started before a fork is restarted in the child.
+
+    Returns:
+        Running queue listener owning the default logger's handlers
+    """
+    global log_listener, _fork_hook_registered  # noqa: PLW0603
+    if log_listener is None:
+        log_listener = create_queue_listener(logging)
+    if not _fork_hook_registered and hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_restart_log_listener_in_child)
+        _fork_hook_registered = True
+    return log_listener
+
+
+def stop_log_listener() -> None:
+    """Stop the background listener and log synchronously again.
+
+    Writes out every queued record, then puts the default logger's original
+    handlers back in place of the queue handler. Does nothing if the
+    listener was never started.
+    """
+    global log_listener  # noqa: PLW0603
+    if log_listener is None:
+        return
+    listener, log_listener = log_listener, None
+    listener.stop()
+    atexit.unregister(listener.stop)
+    for handler in tuple(logging.handlers):
+        if isinstance(handler, _RecordQueueHandler):
+            logging.removeHandler(handler)
+    for handler in listener.handlers:
+        logging.addHandler(handler)
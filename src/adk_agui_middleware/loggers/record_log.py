@@ -1,39 +1,54 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Structured logging functions for recording application events and errors."""
 
-import json
-import traceback
+import logging
 from typing import Any
 
 from ..config.log import log_config
 from ..data_model.log import LogMessage
 from ..tools.function_name import extract_caller_name
-from ..tools.json_encoder import PydanticJsonEncoder
+from ..tools.json_encoder import to_jsonable
+from ..tools.lazy_traceback import LazyTraceback
 from . import logger
 
 
 def _create_and_log_message(
     msg: str,
-    log_level: Any = logger.logging.info,
+    log_level: int = logging.INFO,
     body: Any = None,
     error: Exception | None = None,
-) -> dict[str, Any]:
+    msg_args: tuple[Any, ...] = (),
+) -> dict[str, Any] | None:
     """Create a structured log message and log it at the specified level.
 
     Internal function that creates a LogMessage with function context,
-    optional body data, and error information, then logs it.
+    optional body data, and error information, then logs it. Nothing is
+    built when the level is disabled, and %-style message arguments are
+    only interpolated once the message is known to be emitted. A message
+    that cannot be formatted is logged as-is with its arguments appended,
+    as the standard logging module does, rather than raising.
 
     Args:
-        :param msg: Primary log message
-        :param log_level: Logging function to use (debug, info, warning, error)
+        :param msg: Primary log message, optionally a %-style format string
+        :param log_level: Standard logging level (DEBUG, INFO, WARNING, ERROR)
         :param body: Optional additional data to include in the log
         :param error: Optional exception to include with error details
+        :param msg_args: Arguments interpolated into msg with the % operator
 
     Returns:
-        Dictionary representation of the logged message
+        Dictionary representation of the logged message, or None if the level is disabled
     """
+    if not logger.logging.isEnabledFor(log_level):
+        return None
+
+    if msg_args:
+        try:
+            msg = msg % msg_args
+        except Exception as e:
+            msg = f"{msg} {msg_args!r} (message formatting failed: {e!r})"
+
     try:
-        log_str = json.loads(json.dumps(body, cls=PydanticJsonEncoder))
+        log_str = None if body is None else to_jsonable(body)
     except Exception as e:
         log_str = f"Can't convert body to json: {repr(e)}"
 
@@ -47,60 +62,69 @@ def _create_and_log_message(
     # Add error information if exception provided
     if error is not None:
         message_data.error_message = repr(error)
-        message_data.stack_message = traceback.format_exc()
+        message_data.stack_message = LazyTraceback(error)
 
     # Convert to dictionary and log at specified level
-    message_dump = message_data.model_dump(exclude_none=True)
-    log_level(message_dump)
+    message_dump = message_data.to_dict(exclude_none=True)
+    logger.logging.log(log_level, message_dump)
     return message_dump
 
 
-def record_debug_log(msg: str, body: Any = None) -> dict[str, Any]:
+def record_debug_log(
+    msg: str, body: Any = None, *, args: tuple[Any, ...] = ()
+) -> dict[str, Any] | None:
     """Record a debug-level log message.
 
     Args:
-        :param msg: Debug message to log
+        :param msg: Debug message to log, optionally a %-style format string
         :param body: Optional additional data to include
+        :param args: Keyword-only arguments lazily interpolated into msg
 
     Returns:
-        Dictionary representation of the logged message
+        Dictionary representation of the logged message, or None if disabled
     """
-    return _create_and_log_message(msg, logger.logging.debug, body)
+    return _create_and_log_message(msg, logging.DEBUG, body, msg_args=args)
 
 
-def record_log(msg: str, body: Any = None) -> dict[str, Any]:
+def record_log(
+    msg: str, body: Any = None, *, args: tuple[Any, ...] = ()
+) -> dict[str, Any] | None:
     """Record an info-level log message.
 
     Default logging function for general application events.
 
     Args:
-        :param msg: Information message to log
+        :param msg: Information message to log, optionally a %-style format string
         :param body: Optional additional data to include
+        :param args: Keyword-only arguments lazily interpolated into msg
 
     Returns:
-        Dictionary representation of the logged message
+        Dictionary representation of the logged message, or None if disabled
     """
-    return _create_and_log_message(msg, body=body)
+    return _create_and_log_message(msg, body=body, msg_args=args)
 
 
-def record_warning_log(msg: str, body: Any = None) -> dict[str, Any]:
+def record_warning_log(
+    msg: str, body: Any = None, *, args: tuple[Any, ...] = ()
+) -> dict[str, Any] | None:
     """Record a warning-level log message.
 
     Used for non-critical issues that should be noted but don't prevent operation.
 
     Args:
-        :param msg: Warning message to log
+        :param msg: Warning message to log, optionally a %-style format string
         :param body: Optional additional data to include
+        :param args: Keyword-only arguments lazily interpolated into msg
 
     Returns:
-        Dictionary representation of the logged message
+        Dictionary representation of the logged message, or None if disabled
     """
-    return _create_and_log_message(msg, logger.logging.warning, body)
+    return _create_and_log_message(msg, logging.WARNING, body, msg_args=args)
 
 
 def record_error_log(
     msg: str, e: Exception | None = None, body: Any = None
-) -> dict[str, Any]:
+) -> dict[str, Any] | None:
     """Record an error-level log message with optional exception details.
 
     Used for error conditions that need attention. Includes full stack trace
@@ -112,9 +136,10 @@ def record_error_log(
         :param body: Optional additional data to include
 
     Returns:
-        Dictionary representation of the logged message with error details
+        Dictionary representation of the logged message with error details,
+        or None if disabled
     """
-    return _create_and_log_message(msg, logger.logging.error, body, e)
+    return _create_and_log_message(msg, logging.ERROR, body, e)
 
 
 def record_agui_raw_log(raw_data: Any) -> None:
@@ -1,66 +1,100 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Request logging utilities for HTTP request and error tracking."""
 
-import traceback
+import logging
 from typing import Any
 
 from starlette.requests import Request
 
+from ..config.log import log_config
 from ..data_model.log import LogMessage
 from ..tools.function_name import extract_caller_name
+from ..tools.lazy_traceback import LazyTraceback
 from . import logger
 
 
-async def record_request_error_log(request: Request, e: Exception) -> dict[str, Any]:
+async def _read_request_body(request: Request) -> str:
+    """Read the request body for logging, truncated to the configured size.
+
+    The body is sliced before decoding so oversized payloads are never
+    decoded in full, and undecodable bytes are replaced instead of raising.
+
+    Args:
+        :param request: HTTP request whose body should be logged
+
+    Returns:
+        Decoded (and possibly truncated) request body
+    """
+    body = await request.body()
+    max_bytes = log_config.LOG_REQUEST_BODY_MAX_BYTES
+    if len(body) > max_bytes:
+        return body[:max_bytes].decode(errors="replace") + "...[truncated]"
+    return body.decode(errors="replace")
+
+
+async def record_request_error_log(
+    request: Request, e: Exception
+) -> dict[str, Any] | None:
     """Log an HTTP request that resulted in an error with full context.
 
     Captures comprehensive error information including request details,
     exception information, stack trace, and function context for debugging.
+    Nothing is collected when error logging is disabled, and the stack trace
+    is formatted lazily when the record is written.
 
     Args:
         :param request: HTTP request that caused the error
         :param e: Exception that occurred during request processing
 
     Returns:
-        Dictionary containing the logged error message data
+        Dictionary containing the logged error message data, or None if error
+        logging is disabled
     """
+    if not logger.logging.isEnabledFor(logging.ERROR):
+        return None
+
     # Create comprehensive error log with request context
     error_message = LogMessage(
         msg="record request error log",
         func_name=extract_caller_name(full_chain=True, max_depth=5),
         error_message=repr(e),
-        headers=dict(request.headers),
-        request_body=(await request.body()).decode(),
-        stack_message=traceback.format_exc(),
+        headers=request.headers,
+        request_body=await _read_request_body(request),
+        stack_message=LazyTraceback(e),
     )
 
     # Log the error and return the message data
-    error_message_dump = error_message.model_dump()
+    error_message_dump = error_message.to_dict()
     logger.logging.error(error_message_dump)
     return error_message_dump
 
 
-async def record_request_log(request: Request) -> dict[str, Any]:
+async def record_request_log(request: Request) -> dict[str, Any] | None:
     """Log an incoming HTTP request with headers and body for audit trail.
 
     Records basic request information including headers, body content,
-    and function context for request tracking and debugging.
+    and function context for request tracking and debugging. Nothing is
+    collected when info logging is disabled.
 
     Args:
         :param request: HTTP request to log
 
     Returns:
-        Dictionary containing the logged request message data
+        Dictionary containing the logged request message data, or None if info
+        logging is disabled
     """
+    if not logger.logging.isEnabledFor(logging.INFO):
+        return None
+
     # Create request log message with basic request information
     message = LogMessage(
         msg="record request log",
         func_name=extract_caller_name(full_chain=True, max_depth=5),
-        headers=dict(request.headers),
-        request_body=(await request.body()).decode(),
+        headers=request.headers,
+        request_body=await _read_request_body(request),
     )
 
     # Log the request and return the message data
-    message_dump = message.model_dump(exclude_none=True)
+    message_dump = message.to_dict(exclude_none=True)
     logger.logging.info(message_dump)
     return message_dump
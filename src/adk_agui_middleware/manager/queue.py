@@ -1,12 +1,15 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Queue manager providing logging and iteration support for event queues."""
 
+import asyncio
 from asyncio import Queue
+from collections.abc import Iterable
 from typing import Any
 
 from ag_ui.core import BaseEvent
 from google.adk.events import Event
 
+from ..config.log import log_config
 from ..loggers.record_log import record_queue_log
 from ..tools.async_queue_iterator import AsyncQueueIterator
 from ..tools.function_name import extract_caller_name
@@ -23,8 +26,14 @@ class QueueManager:
     This manager is used for both ADK and AGUI event queues, providing
     consistent queue operation patterns throughout the middleware.
 
+    Once the None sentinel has been put, the consumer stops reading, so any
+    later put is dropped instead of waiting forever for room in a bounded
+    queue. Puts already waiting for room when the consumer reads the
+    sentinel are released the same way.
+
     Attributes:
         queue: The underlying asyncio Queue being managed
+        closed: Whether the termination sentinel has been put
     """
 
     def __init__(self, queue: Queue[Any]) -> None:
@@ -34,17 +43,23 @@ class QueueManager:
             :param queue: Asyncio Queue to manage
         """
         self.queue = queue
+        self.closed = False
+        # Puts waiting for room in a full bounded queue
+        self._blocked_puts: set[asyncio.Future[None]] = set()
+        self._consumer_done = False
 
-    async def put(self, event: Event | BaseEvent | None) -> None:
-        """Add an event to the queue with automatic logging.
+    @staticmethod
+    def _record_put(event: Event | BaseEvent | None) -> None:
+        """Log a queue put when event queue logging is enabled.
 
-        Logs the event type and caller information before adding to the queue.
-        This provides visibility into event flow for debugging and monitoring.
-        None events are logged as termination signals.
+        The log payload, including the caller chain, is only built when
+        LOG_EVENT_QUEUE is on, keeping puts cheap in normal operation.
 
         Args:
-            :param event: Event to add to the queue (ADK Event, AGUI BaseEvent, or None sentinel)
+            :param event: Event being added to the queue
         """
+        if not log_config.LOG_EVENT_QUEUE:
+            return
         record_queue_log(
             {
                 "call_function": extract_caller_name(full_chain=True, max_depth=5),
@@ -52,16 +67,75 @@ class QueueManager:
                 "event": event,
             }
         )
-        await self.queue.put(event)
+
+    async def put(self, event: Event | BaseEvent | None) -> None:
+        """Add an event to the queue with automatic logging.
+
+        Logs the event type and caller information before adding to the queue.
+        This provides visibility into event flow for debugging and monitoring.
+        None events are logged as termination signals; nothing is added after
+        one.
+
+        Args:
+            :param event: Event to add to the queue (ADK Event, AGUI BaseEvent, or None sentinel)
+        """
+        await self.put_many((event,))
+
+    async def put_many(self, events: Iterable[Event | BaseEvent | None]) -> None:
+        """Add a burst of events to the queue in order.
+
+        Events are added without awaiting while the queue has room, so a burst
+        costs one coroutine instead of one per event. Bounded queues that are
+        full still apply backpressure by awaiting space. Events following the
+        None sentinel, from this or any later call, are dropped.
+
+        Args:
+            :param events: Events to add to the queue, in order
+        """
+        queue = self.queue
+        for event in events:
+            if self.closed:
+                return
+            self._record_put(event)
+            if event is None:
+                self.closed = True
+            if queue.full():
+                await self._wait_and_put(event)
+            else:
+                queue.put_nowait(event)
+
+    async def _wait_and_put(self, event: Event | BaseEvent | None) -> None:
+        """Wait for room in a full queue unless its consumer has finished.
+
+        Args:
+            :param event: Event to add once the queue has room
+        """
+        putter = asyncio.ensure_future(self.queue.put(event))
+        self._blocked_puts.add(putter)
+        try:
+            await putter
+        except asyncio.CancelledError:
+            # Swallow only the release below, never a cancellation of the caller
+            task = asyncio.current_task()
+            if not self._consumer_done or (task is not None and task.cancelling()):
+                raise
+        finally:
+            self._blocked_puts.discard(putter)
+
+    def _release_blocked_puts(self) -> None:
+        """Drop puts still waiting for room once the sentinel has been read."""
+        self._consumer_done = True
+        for putter in self._blocked_puts:
+            putter.cancel()
 
     def get_iterator(self) -> AsyncQueueIterator:
         """Get an async iterator for consuming queue items.
 
         Creates an AsyncQueueIterator wrapping this queue, enabling consumption
         with async for loops. The iterator automatically handles queue termination
-        when None is encountered.
+        when None is encountered, releasing producers still waiting for room.
 
         Returns:
             AsyncQueueIterator for consuming queue items with async for
         """
-        return AsyncQueueIterator(self.queue)
+        return AsyncQueueIterator(self.queue, on_sentinel=self._release_blocked_puts)
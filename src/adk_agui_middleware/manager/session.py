@@ -1,7 +1,9 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Session manager for handling ADK session operations and state management."""
 
+import itertools
 import time
+from collections.abc import Callable
 from typing import Any
 
 from google.adk.events import Event, EventActions
@@ -26,6 +28,8 @@ class SessionManager:
             :param session_service: ADK session service implementation for session operations
         """
         self.session_service = session_service
+        # Per-manager sequence keeping state update invocation IDs unique
+        self._invocation_seq = itertools.count()
 
     async def list_sessions(self, app_name: str, user_id: str) -> list[Session]:
         """List all sessions for a given app and user.
@@ -111,38 +115,87 @@ class SessionManager:
         self,
         session_parameter: SessionParameter,
         state_updates: dict[str, Any] | None,
+        session: Session | None = None,
     ) -> bool:
         """Update session state by appending a state delta event.
 
         Creates an ADK Event with state delta actions and appends it to the session,
         which triggers state updates in the session service. This is the primary
         mechanism for persisting state changes including HITL workflow data.
+        Callers that already hold a freshly fetched session can pass it in to
+        skip a redundant backend lookup.
 
         Args:
             :param session_parameter: Parameters identifying the session to update
             :param state_updates: Dictionary of state changes to apply
+            :param session: Already-fetched session to update, fetched when omitted
 
         Returns:
             True if update was successful, False if session not found or no updates
         """
-        session = await self.get_session(session_parameter)
-        if not (session and state_updates):
+        # Nothing to persist, so skip the backend lookup entirely
+        if not state_updates:
+            return False
+        if session is None:
+            session = await self.get_session(session_parameter)
+        if not session:
             record_warning_log(
-                f"Session not found: {session_parameter.app_name}:{session_parameter.session_id}"
+                "Session not found: %s:%s",
+                args=(session_parameter.app_name, session_parameter.session_id),
             )
             return False
 
         # Create system event with state delta for the update
+        now = time.time()
         event = Event(
-            invocation_id=f"state_update_{int(time.time())}",
+            invocation_id=f"state_update_{now:.6f}_{next(self._invocation_seq)}",
             author="system",
             actions=EventActions(state_delta=state_updates),
-            timestamp=time.time(),
+            timestamp=now,
         )
         # Append event to session to trigger state update
         await self.session_service.append_event(session, event)
         return True
 
+    async def mutate_state(
+        self,
+        session_parameter: SessionParameter,
+        mutate: Callable[[dict[str, Any]], dict[str, Any]],
+    ) -> bool:
+        """Apply a read-modify-write transform to session state in one round trip.
+
+        Fetches the session once, computes the new state with the given
+        function, and appends a single state delta event containing only the
+        keys whose values changed. The function must return a new mapping
+        rather than mutating the state it receives in place.
+
+        Args:
+            :param session_parameter: Parameters identifying the session to update
+            :param mutate: Function mapping the current state to the new state
+
+        Returns:
+            True if the state was updated or already up to date, False if session not found
+        """
+        session = await self.get_session(session_parameter)
+        if not session:
+            record_warning_log(
+                "Session not found: %s:%s",
+                args=(session_parameter.app_name, session_parameter.session_id),
+            )
+            return False
+
+        current_state = session.state
+        state_delta = {
+            key: value
+            for key, value in mutate(current_state).items()
+            if key not in current_state or current_state[key] != value
+        }
+        if not state_delta:
+            return True
+        return await self.update_session_state(
+            session_parameter, state_delta, session=session
+        )
+
     async def get_session_state(
         self, session_parameter: SessionParameter
     ) -> dict[str, Any]:
@@ -162,10 +215,11 @@ class SessionManager:
             if session := await self.get_session(session_parameter):
                 return session.state
             record_warning_log(
-                f"Session not found: {session_parameter.app_name}:{session_parameter.session_id}"
+                "Session not found: %s:%s",
+                args=(session_parameter.app_name, session_parameter.session_id),
             )
         except Exception as e:
-            record_error_log(f"Failed to get session state: {e}")
+            record_error_log("Failed to get session state.", e)
             return {}
         return {}
 
@@ -193,10 +247,11 @@ class SessionManager:
             session = await self.get_session(session_parameter)
             if not session:
                 record_warning_log(
-                    f"Session not found: {session_parameter.app_name}:{session_parameter.session_id}"
+                    "Session not found: %s:%s",
+                    args=(session_parameter.app_name, session_parameter.session_id),
                 )
                 return default
             return session.state.get(key, default)
         except Exception as e:
-            record_error_log(f"Failed to get state value: {e}")
+            record_error_log("Failed to get state value.", e)
             return default
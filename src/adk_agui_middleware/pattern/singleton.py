@@ -16,6 +16,8 @@ class Singleton(type):
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
         """Create or return the singleton instance of the class.
 
+        The cached instance is fetched with a single dictionary lookup.
+
         Args:
             :param args: Positional arguments for class instantiation
             :param kwargs: Keyword arguments for class instantiation
@@ -23,6 +25,7 @@ class Singleton(type):
         Returns:
             The singleton instance of the class
         """
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = cls._instances[cls] = super().__call__(*args, **kwargs)
+        return instance
@@ -3,6 +3,8 @@
 
 import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
+from functools import partial
 from typing import Any, cast
 
 from ag_ui.core import BaseEvent, RunAgentInput
@@ -26,6 +28,7 @@ from ..handler.queue import QueueHandler
 from ..handler.running import RunningHandler
 from ..handler.session import SessionHandler
 from ..handler.user_message import UserMessageHandler
+from ..loggers.record_log import record_error_log
 from ..manager.session import SessionManager
 from ..tools.shutdown import ShutdownHandler
 from ..utils.convert.agui_event_to_sse import (
@@ -67,6 +70,8 @@ class SSEService(BaseSSEService):
         self.session_lock_handler = self.handler_context.session_lock_handler(
             config_context.session_lock_config
         )
+        # Strong references to deferred input records until they finish
+        self._input_record_tasks: set[asyncio.Task[None]] = set()
 
     async def _get_config_value(
         self, config_attr: str, agui_content: RunAgentInput, request: Request
@@ -97,8 +102,11 @@ class SSEService(BaseSSEService):
     ) -> BaseInOutHandler | None:
         """Create and record incoming message for audit and logging purposes.
 
-        Creates an input/output record handler if configured and records the
-        incoming AGUI content and request for audit trails and logging.
+        Creates an input/output record handler if configured, or reuses the
+        configured shared instance, and records the incoming AGUI content and
+        request for audit trails and logging. Handlers that defer input
+        recording get it scheduled as a task stored on input_info, so the
+        response can start streaming while it runs.
 
         Args:
             :param input_info: Processed request context for the current interaction
@@ -106,11 +114,63 @@ class SSEService(BaseSSEService):
         Returns:
             BaseInOutHandler instance if configured, None otherwise
         """
-        if self.handler_context.in_out_record_handler:
-            in_out_record = self.handler_context.in_out_record_handler()
+        handler = self.handler_context.in_out_record_handler
+        if handler is None:
+            return None
+        in_out_record = handler() if isinstance(handler, type) else handler
+        if not in_out_record.defers_input_record:
             await in_out_record.input_record(input_info)
             return in_out_record
-        return None
+        task = asyncio.create_task(
+            self._deferred_input_record(in_out_record, input_info)
+        )
+        self._input_record_tasks.add(task)
+        task.add_done_callback(self._input_record_tasks.discard)
+        input_info.input_record_task = task
+        return in_out_record
+
+    @staticmethod
+    async def _deferred_input_record(
+        in_out_record: BaseInOutHandler, input_info: InputInfo
+    ) -> None:
+        """Run a deferred input_record, logging instead of raising on failure.
+
+        The task runs alongside the response, so a failed audit write is
+        logged here rather than aborting the stream or going unretrieved.
+
+        Args:
+            :param in_out_record: Handler whose input recording was deferred
+            :param input_info: Processed request context for the current interaction
+        """
+        try:
+            await in_out_record.input_record(input_info)
+        except Exception as e:
+            record_error_log("Deferred input record failed", e)
+
+    @staticmethod
+    async def _after_input_record(
+        input_record_task: asyncio.Task[None] | None,
+        events: AsyncGenerator[BaseEvent],
+    ) -> AsyncGenerator[BaseEvent]:
+        """Yield events only once the deferred input record has finished.
+
+        The agent keeps running while the input is being recorded; the wait
+        happens before the first event is handed on, so input_record still
+        completes before any output_record.
+
+        Args:
+            :param input_record_task: Deferred input_record task, if any
+            :param events: Event stream produced by the runner
+
+        Yields:
+            BaseEvent objects from the runner, in order
+        """
+        async with aclosing(events):
+            async for event in events:
+                if input_record_task is not None:
+                    await input_record_task
+                    input_record_task = None
+                yield event
 
     @staticmethod
     async def _record_output_message(
@@ -119,7 +179,8 @@ class SSEService(BaseSSEService):
         """Record and potentially transform outgoing message data.
 
         Records the output data through the configured handler and applies any
-        transformations or modifications before sending to the client.
+        transformations or modifications before sending to the client, via the
+        handler's output_process.
 
         Args:
             :param inout_handler: Optional handler for recording and transforming output
@@ -129,8 +190,7 @@ class SSEService(BaseSSEService):
             BaseEvent (potentially modified by handler)
         """
         if inout_handler:
-            await inout_handler.output_record(output_data)
-            return await inout_handler.output_catch_and_change(output_data)
+            return await inout_handler.output_process(output_data)
         return output_data
 
     async def extract_app_name(
@@ -227,7 +287,7 @@ class SSEService(BaseSSEService):
         except Exception as e:
             return converter(AGUIErrorEvent.create_encoding_error_event(e))
 
-    async def _create_runner(self, app_name: str) -> Runner:
+    def _create_runner(self, app_name: str) -> Runner:
         """Create a fresh ADK Runner instance for the provided app name.
 
         Clones the agent to avoid cross-request state leakage and wires in
@@ -258,8 +318,8 @@ class SSEService(BaseSSEService):
     ]:
         """Create a configured runner function for the given request.
 
-        Extracts context from the request, creates necessary handlers and managers,
-        and returns a runner function that generates agent events.
+        Extracts context from the request and returns the agent run bound to
+        it; the per-request handlers are created when the run starts.
 
         Args:
             :param agui_content: Input containing agent execution parameters
@@ -279,37 +339,53 @@ class SSEService(BaseSSEService):
             event_queue=QueueHandler(
                 EventQueue(
                     adk_event_queue=asyncio.Queue(),
-                    agui_event_queue=asyncio.Queue(),
+                    agui_event_queue=asyncio.Queue(
+                        maxsize=self.config_context.agui_event_queue_max_size
+                    ),
                 )
             ),
         )
 
-        async def runner() -> AsyncGenerator[BaseEvent]:
-            """Internal runner function that executes the agent and yields events.
+        in_out_record = await self._create_and_record_message(input_info)
+        return partial(self._run_agent, input_info), input_info, in_out_record
 
-            Yields:
-                BaseEvent objects representing agent execution events
-            """
-            if not await self.session_lock_handler.lock(input_info):
+    async def _run_agent(self, input_info: InputInfo) -> AsyncGenerator[BaseEvent]:
+        """Execute the agent for one request and yield its AGUI events.
+
+        Holds the session lock while it wires up the per-request handlers and
+        streams the events produced by the AGUI user handler; the lock is
+        released when the stream ends or is closed, and only if this request
+        acquired it. get_runner binds this method to the request's input
+        information, so no closure is created per request.
+
+        Args:
+            :param input_info: Processed request context for the current interaction
+
+        Yields:
+            BaseEvent objects representing agent execution events
+        """
+        async with self.session_lock_handler.locked(input_info) as acquired:
+            if not acquired:
                 yield await self.session_lock_handler.get_locked_message(input_info)
                 return
 
+            config_context = self.config_context
             user_handler = AGUIUserHandler(
                 running_handler=RunningHandler(
-                    runner=await self._create_runner(input_info.app_name),
+                    runner=self._create_runner(input_info.app_name),
                     run_config=self.runner_config.run_config,
                     handler_context=self.handler_context,
                     input_info=input_info,
                     event_translator=EventTranslator(
-                        retune_on_stream_complete=self.config_context.retune_on_stream_complete,
-                        add_raw_event=self.config_context.is_add_adk_event_in_agui_event,
+                        retune_on_stream_complete=config_context.retune_on_stream_complete,
+                        add_raw_event=config_context.is_add_adk_event_in_agui_event,
                     ),
                 ),
                 user_message_handler=UserMessageHandler(
-                    agui_content=agui_content,
-                    request=request,
+                    agui_content=input_info.agui_content,
+                    request=input_info.request,
                     initial_state=input_info.initial_state,
-                    convert_run_agent_input=self.config_context.convert_run_agent_input,
+                    convert_run_agent_input=config_context.convert_run_agent_input,
                 ),
                 session_handler=SessionHandler(
                     session_manager=self.session_manager,
@@ -321,14 +397,15 @@ class SSEService(BaseSSEService):
                 ),
                 queue_handler=input_info.event_queue,
             )
+            # Decide once per request whether raw events are stripped
+            if not config_context.auto_remove_agui_raw_event:
+                async for event in user_handler.run():
+                    yield event
+                return
             async for event in user_handler.run():
-                if self.config_context.auto_remove_agui_raw_event:
-                    event.raw_event = None
+                event.raw_event = None
                 yield event
 
-        in_out_record = await self._create_and_record_message(input_info)
-        return runner, input_info, in_out_record
-
     async def event_generator(
         self,
         runner: Callable[[], AsyncGenerator[BaseEvent]],
@@ -338,11 +415,13 @@ class SSEService(BaseSSEService):
         """Generate encoded event strings from the agent runner.
 
         Executes the runner and encodes each event for SSE transmission,
-        handling any errors that occur during execution or encoding.
+        handling any errors that occur during execution or encoding. The
+        runner owns the session lock and is closed when streaming stops.
 
         Args:
             :param runner: Callable that returns an async generator of events
-            :param input_info: Input information containing session and context details
+            :param input_info: Input information containing session and context details,
+                including any deferred input record to wait for
             :param inout_handler: Optional handler for input/output recording and transformation
 
         Yields:
@@ -355,19 +434,40 @@ class SSEService(BaseSSEService):
             Yields:
                 Encoded event dictionaries or error events if exceptions occur
             """
+            encode = self._encode_event_to_sse
             try:
-                async for event in runner():
-                    yield self._encode_event_to_sse(
-                        await self._record_output_message(inout_handler, event)
+                # Close the runner as soon as streaming stops, e.g. on client
+                # disconnect, so it releases the session lock it holds
+                events = runner()
+                if input_info.input_record_task is not None:
+                    events = self._after_input_record(
+                        input_info.input_record_task, events
                     )
+                async with aclosing(events) as events:
+                    if inout_handler is None:
+                        # Nothing records output, so skip the per-event coroutine
+                        async for event in events:
+                            yield encode(event)
+                    elif (
+                        not inout_handler.modifies_output
+                        and type(inout_handler).output_process
+                        is BaseInOutHandler.output_process
+                    ):
+                        # Output is only recorded, never changed
+                        output_record = inout_handler.output_record
+                        async for event in events:
+                            await output_record(event)
+                            yield encode(event)
+                    else:
+                        output_process = inout_handler.output_process
+                        async for event in events:
+                            yield encode(await output_process(event))
             except Exception as e:
                 yield self._encode_event_to_sse(
                     await self._record_output_message(
                         inout_handler, AGUIErrorEvent.create_agent_error_event(e)
                     )
                 )
-            finally:
-                await self.session_lock_handler.unlock(input_info)
 
         if self.config_context.event_source_response_mode:
             return EventSourceResponse(_generate())
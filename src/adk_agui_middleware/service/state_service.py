@@ -129,7 +129,8 @@ class StateService:
 
         Extracts session context from the request, retrieves the current state,
         applies JSON patch operations, and updates the session with the modified state.
-        This enables partial state updates without replacing the entire state dictionary.
+        This enables partial state updates without replacing the entire state dictionary;
+        only the keys changed by the patch are written back as a state delta.
 
         Args:
             :param request: HTTP request containing session context in path
@@ -142,10 +143,8 @@ class StateService:
             ValueError: If session is not found or does not exist
         """
         session_handler = await self._create_session_handler(request)
-        session = await session_handler.get_session()
-        if session is None:
+        if not await session_handler.mutate_state(
+            lambda state: jsonpatch.apply_patch(state, state_patch)
+        ):
             raise ValueError("Session not found")
-        await session_handler.update_session_state(
-            jsonpatch.apply_patch(session.state, state_patch)
-        )
         return {"status": "updated"}
@@ -2,6 +2,7 @@
 """Async iterator wrapper for asyncio Queue enabling async for loop consumption."""
 
 from asyncio import Queue
+from collections.abc import Callable
 from typing import Any
 
 
@@ -18,15 +19,20 @@ class AsyncQueueIterator:
 
     Attributes:
         queue: The asyncio Queue to iterate over
+        on_sentinel: Optional callback invoked when the None sentinel is read
     """
 
-    def __init__(self, queue: Queue[Any]) -> None:
+    def __init__(
+        self, queue: Queue[Any], on_sentinel: Callable[[], None] | None = None
+    ) -> None:
         """Initialize the async queue iterator.
 
         Args:
             :param queue: Asyncio Queue to wrap with iterator protocol
+            :param on_sentinel: Optional callback invoked when the None sentinel is read
         """
         self.queue = queue
+        self.on_sentinel = on_sentinel
 
     def __aiter__(self) -> "AsyncQueueIterator":
         """Return the iterator object (self) for async for protocol.
@@ -40,6 +46,7 @@ class AsyncQueueIterator:
         """Get the next item from the queue, stopping on None sentinel.
 
         Retrieves the next item from the queue, treating None as a termination signal.
+        Items already in the queue are taken without creating a get() coroutine.
         Automatically marks the task as done on the queue after retrieval, supporting
         proper queue synchronization patterns.
 
@@ -49,10 +56,14 @@ class AsyncQueueIterator:
         Raises:
             StopAsyncIteration: When None is encountered (signals end of iteration)
         """
-        item = await self.queue.get()
+        queue = self.queue
+        # Take ready items directly; only suspend on queue.get() when empty
+        item = await queue.get() if queue.empty() else queue.get_nowait()
         try:
             if item is None:
+                if self.on_sentinel is not None:
+                    self.on_sentinel()
                 raise StopAsyncIteration
             return item
         finally:
-            self.queue.task_done()
+            queue.task_done()
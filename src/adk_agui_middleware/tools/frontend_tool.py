@@ -1,19 +1,19 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Frontend tool adapter for exposing client-side tools through ADK agent framework."""
 
-import uuid
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable
 from typing import Any, cast
 
 from ag_ui.core import Tool
 from google.adk.agents.readonly_context import ReadonlyContext
-from google.adk.tools import BaseTool, LongRunningFunctionTool, ToolContext
+from google.adk.tools import BaseTool, ToolContext
 from google.adk.tools.base_toolset import BaseToolset, ToolPredicate
 from google.genai import types
 
 from ..loggers.record_log import record_error_log
 from ..manager.queue import QueueManager
 from ..utils.translate import FunctionCallEventUtil
+from .id_generator import generate_id
 
 
 class FrontendTool(BaseTool):
@@ -53,66 +53,33 @@ class FrontendTool(BaseTool):
         # Ensure parameters is a valid JSON Schema dict
         if not isinstance(self.parameters, dict):
             self.parameters = {"type": "object", "properties": {}}
-        # Create the underlying long-running tool with dynamic signature
-        self._long_running_tool = LongRunningFunctionTool(
-            self._create_agui_function_call(
-                self.name,
-                self.description,
-            )
-        )
-
-    def _create_agui_function_call(
-        self,
-        name: str,
-        description: str,
-    ) -> Callable[..., Coroutine[Any, Any, Any]]:
-        """Create an async function used to proxy an AGUI tool invocation.
-
-        Generates a coroutine function with a dynamic name and docstring that
-        delegates to ``self._execute``. This allows the ADK tool system to
-        expose the frontend tool with the expected metadata.
-
-        Args:
-            :param name: Function name to expose to the tool system
-            :param description: Human-readable description used as the docstring
-
-        Returns:
-            A coroutine function that forwards execution to ``_execute``
-        """
-
-        async def dynamic_func(args: dict[str, Any], tool_context: ToolContext) -> Any:
-            """Proxy execution that forwards to the tool's internal executor.
-
-            Args:
-                :param args: Tool invocation arguments
-                :param tool_context: Execution context with function call metadata
-
-            Returns:
-                The result of ``_execute`` (typically None; result arrives via HITL)
-            """
-            return await self._execute(args, tool_context)
-
-        dynamic_func.__name__ = name
-        dynamic_func.__doc__ = description
-        return dynamic_func
+        # Declaration built on first use and reused while the name is unchanged
+        self._declaration: types.FunctionDeclaration | None = None
 
     def _get_declaration(self) -> types.FunctionDeclaration | None:
         """Get the function declaration for this tool.
 
+        The parameter schema is validated once and the declaration is cached.
+        It is rebuilt only if the tool has been renamed since, e.g. when a
+        toolset applies its name prefix.
+
         Returns:
             FunctionDeclaration with tool metadata and parameter schema
         """
-        return types.FunctionDeclaration(
-            name=self.name,
-            description=self.description,
-            parameters=types.Schema.model_validate(self.parameters),
-        )
+        declaration = self._declaration
+        if declaration is None or declaration.name != self.name:
+            declaration = self._declaration = types.FunctionDeclaration(
+                name=self.name,
+                description=self.description,
+                parameters=types.Schema.model_validate(self.parameters),
+            )
+        return declaration
 
     async def _execute(self, args: dict[str, Any], tool_context: ToolContext) -> Any:
         """Execute the frontend tool by generating a function call event.
 
         Generates AGUI function call events and sends them to the client through
-        the event queue. This does not execute the tool locally - it sends the
+        the event queue in a single batch. This does not execute the tool locally - it sends the
         invocation to the client and relies on the long-running pattern to pause
         agent execution until the client provides results.
 
@@ -124,14 +91,13 @@ class FrontendTool(BaseTool):
             Exception: Re-raises any errors after logging for proper error handling
         """
         try:
-            async for (
-                agui_event
-            ) in FunctionCallEventUtil().generate_function_call_event(
-                tool_call_id=tool_context.function_call_id or str(uuid.uuid4()),
-                tool_call_name=self.name,
-                tool_call_args=args,
-            ):
-                await self.agui_queue.put(agui_event)
+            await self.agui_queue.put_many(
+                FunctionCallEventUtil._build_function_call_events(
+                    tool_call_id=tool_context.function_call_id or generate_id("call_"),
+                    tool_call_name=self.name,
+                    tool_call_args=args,
+                )
+            )
         except Exception as e:
             record_error_log(
                 f"Error in proxy tool execution for {tool_context.function_call_id}.", e
@@ -150,21 +116,21 @@ class FrontendTool(BaseTool):
     async def run_async(
         self, *, args: dict[str, Any], tool_context: ToolContext
     ) -> Any:
-        """Run the frontend tool asynchronously through the long-running tool pattern.
+        """Run the frontend tool by emitting its function call events.
 
-        Delegates to the underlying long-running tool implementation which handles
-        the HITL pause/resume workflow.
+        Calls _execute directly with the arguments and context of this
+        invocation. Nothing is stored on the instance, so concurrent
+        invocations of the same tool are independent. The HITL pause/resume
+        follows from the tool being marked long-running.
 
         Args:
             :param args: Tool invocation arguments
             :param tool_context: Execution context for this tool invocation
 
         Returns:
-            Tool execution results (provided by client after HITL completion)
+            None; the tool result is provided by the client after HITL completion
         """
-        return await self._long_running_tool.run_async(
-            args=args, tool_context=tool_context
-        )
+        return await self._execute(args, tool_context)
 
 
 class FrontendToolset(BaseToolset):
@@ -187,6 +153,8 @@ class FrontendToolset(BaseToolset):
         super().__init__(tool_filter=tool_filter, tool_name_prefix=tool_name_prefix)
         self.frontend_tools: list[FrontendTool] = []
         self.agui_queue: QueueManager | None = None
+        # AGUI tool definitions the current frontend tools were built from
+        self._agui_tools: list[Tool] | None = None
 
     def _get_filter_func(self) -> Callable[[BaseTool], bool] | None:
         """Return a predicate function derived from the configured filter.
@@ -214,12 +182,17 @@ class FrontendToolset(BaseToolset):
 
         Builds FrontendTool instances for the provided AGUI tools, applies an
         optional name prefix and filter predicate, and stores the resulting list.
+        The build is skipped when called again with the same queue and tool
+        definitions, e.g. for a toolset shared by several agents in the tree.
 
         Args:
             :param agui_queue: Queue manager used by tools to emit AGUI events
             :param agui_tools: List of AGUI Tool schemas from the client
         """
+        if agui_queue is self.agui_queue and agui_tools is self._agui_tools:
+            return
         self.agui_queue = agui_queue
+        self._agui_tools = agui_tools
         filter_func = self._get_filter_func()
         frontend_tools = []
         for agui_tool in agui_tools:
@@ -1,25 +1,15 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Function name extraction utilities for debugging and logging."""
 
-import inspect
+import functools
+import sys
+from types import CodeType, FrameType
 from typing import Any
 
 
-def _should_skip_function(function_name: str) -> bool:
-    """Determine if a function should be skipped from the call chain.
-
-    Filters out logging functions, wrappers, and most dunder methods
-    to provide cleaner function name chains for debugging. This helps
-    focus on business logic functions rather than infrastructure code.
-
-    Args:
-        :param function_name: Name of the function to evaluate
-
-    Returns:
-        True if the function should be skipped, False otherwise
-    """
-    # Functions to always skip (logging, wrappers, etc.)
-    default_skip = {
+# Functions to always skip (logging, wrappers, etc.)
+_DEFAULT_SKIP = frozenset(
+    {
         "get_function_name",
         "_record_raw_data_log",
         "_create_and_log_message",
@@ -34,23 +24,43 @@ def _should_skip_function(function_name: str) -> bool:
         "trace",
         "debug",
     }
+)
 
-    # Special dunder methods that are meaningful to include
-    default_include_special = {
+# Special dunder methods that are meaningful to include
+_DEFAULT_INCLUDE_SPECIAL = frozenset(
+    {
         "__init__",
         "__new__",
         "__enter__",
         "__exit__",
     }
+)
+
+# Local names that identify the owning instance or class of a method
+_OWNER_NAMES = ("self", "cls")
+
+
+def _should_skip_function(function_name: str) -> bool:
+    """Determine if a function should be skipped from the call chain.
+
+    Filters out logging functions, wrappers, and most dunder methods
+    to provide cleaner function name chains for debugging. This helps
+    focus on business logic functions rather than infrastructure code.
+
+    Args:
+        :param function_name: Name of the function to evaluate
 
-    if function_name in default_skip:
+    Returns:
+        True if the function should be skipped, False otherwise
+    """
+    if function_name in _DEFAULT_SKIP:
         return True
 
     # Skip most dunder methods except meaningful ones
     return (
         function_name.startswith("__")
         and function_name.endswith("__")
-        and function_name not in default_include_special
+        and function_name not in _DEFAULT_INCLUDE_SPECIAL
     )
 
 
@@ -82,30 +92,56 @@ def _format_function_name(function_name: str, frame_locals: dict[str, Any]) -> s
     return function_name
 
 
-def _collect_valid_functions(stack_frames: list[Any]) -> list[str]:
-    """Collect and format valid function names from stack frames.
+@functools.lru_cache(maxsize=1024)
+def _inspect_code(code: CodeType) -> tuple[bool, bool]:
+    """Classify a code object once for call chain extraction.
+
+    The answers only depend on the code object, so they are cached to keep
+    repeated log calls from the same call sites cheap.
+
+    Args:
+        :param code: Code object of a stack frame
+
+    Returns:
+        Tuple of (skip the function, function may reference self or cls)
+    """
+    if _should_skip_function(code.co_name):
+        return True, False
+    names = code.co_varnames + code.co_cellvars + code.co_freevars
+    return False, any(owner in names for owner in _OWNER_NAMES)
+
+
+def _collect_valid_functions(
+    frame: FrameType | None, max_depth: int | None = None
+) -> list[str]:
+    """Collect and format valid function names by walking frames outward.
 
     Processes the call stack to extract meaningful function names,
     filtering out internal functions and formatting with class context.
-    This creates a clean representation of the execution path.
+    Walking stops as soon as max_depth names are collected, and frame
+    locals are only read for functions that can reference self or cls.
 
     Args:
-        :param stack_frames: List of frame info objects from inspect.stack()
+        :param frame: Innermost frame to start walking from
+        :param max_depth: Maximum number of functions to collect (None for unlimited)
 
     Returns:
-        List of formatted function names in call order
+        List of formatted function names from innermost to outermost
     """
-    valid_functions = []
-    for frame_info in stack_frames:
-        function_name = frame_info.function
+    valid_functions: list[str] = []
+    while frame is not None and (max_depth is None or len(valid_functions) < max_depth):
+        code = frame.f_code
+        skip, may_have_owner = _inspect_code(code)
 
         # Skip functions that shouldn't be included in the chain
-        if _should_skip_function(function_name):
-            continue
-
-        # Format with class context if available
-        formatted_name = _format_function_name(function_name, frame_info.frame.f_locals)
-        valid_functions.append(formatted_name)
+        if not skip:
+            # Format with class context if available
+            valid_functions.append(
+                _format_function_name(code.co_name, frame.f_locals)
+                if may_have_owner
+                else code.co_name
+            )
+        frame = frame.f_back
 
     return valid_functions
 
@@ -134,19 +170,14 @@ def extract_caller_name(
         extract_caller_name(full_chain=True) -> "main -> MyClass.my_method -> helper"
         extract_caller_name(max_depth=2) -> "MyClass.my_method"
     """
-    # Get the current call stack
-    stack_frames = inspect.stack()
-
-    # Filter and format valid function names
-    valid_functions = _collect_valid_functions(stack_frames)
+    # Walk from the caller's frame, stopping once enough names are found
+    valid_functions = _collect_valid_functions(
+        sys._getframe(1), max_depth if full_chain else 1
+    )
 
     if not valid_functions:
         return "unknown_function"
 
-    # Limit depth if specified
-    if max_depth is not None:
-        valid_functions = valid_functions[:max_depth]
-
     # Return just the immediate caller or full chain
     if not full_chain:
         return valid_functions[0]
@@ -2,9 +2,11 @@
 """Custom JSON encoder for handling Pydantic models and special data types."""
 
 import json
+from collections.abc import Mapping
 from typing import Any
 
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_json, to_jsonable_python
 
 
 class PydanticJsonEncoder(json.JSONEncoder):
@@ -18,7 +20,8 @@ class PydanticJsonEncoder(json.JSONEncoder):
         """Override default serialization for custom object types.
 
         Handles serialization of objects that the standard JSON encoder
-        cannot process, including Pydantic models and bytes.
+        cannot process, including Pydantic models, sets, non-dict mappings
+        and bytes.
 
         Args:
             :param o: Object to serialize
@@ -34,6 +37,9 @@ class PydanticJsonEncoder(json.JSONEncoder):
             return o.model_dump()
         if isinstance(o, set):
             return list(o)
+        # Non-dict mappings such as request headers are copied only when written
+        if isinstance(o, Mapping):
+            return dict(o)
         if isinstance(o, bytes):
             try:
                 return o.decode()
@@ -42,3 +48,60 @@ class PydanticJsonEncoder(json.JSONEncoder):
 
         # Fall back to default JSON encoder behavior
         return super().default(o)
+
+
+# Shared encoder instance; encoding keeps no state, so it is reused rather
+# than constructing a new encoder for every json.dumps(..., cls=...) call
+pydantic_json_encoder = PydanticJsonEncoder()
+
+
+def encode_json(obj: Any) -> str:
+    """Serialize an object to a compact JSON string using pydantic-core.
+
+    Uses the Rust serializer bundled with pydantic, which is several times
+    faster than json.dumps for the dict payloads of tool calls and results.
+    Types it cannot handle natively go through PydanticJsonEncoder.default,
+    and payloads it rejects (e.g. non UTF-8 bytes) fall back to the
+    standard encoder so the output matches PydanticJsonEncoder semantics.
+
+    Args:
+        :param obj: Object to serialize
+
+    Returns:
+        Compact JSON string representation of the object
+
+    Raises:
+        TypeError: If the object contains values no encoder can serialize
+    """
+    try:
+        return to_json(
+            obj, by_alias=False, fallback=pydantic_json_encoder.default
+        ).decode()
+    except PydanticSerializationError:
+        return pydantic_json_encoder.encode(obj)
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Convert an object to JSON-compatible Python data in a single pass.
+
+    Walks the object once with pydantic-core instead of encoding it to a
+    JSON string and parsing it back. Pydantic models are dumped in JSON mode
+    as part of the same walk. Other unsupported types go through
+    PydanticJsonEncoder.default, and payloads pydantic-core rejects fall
+    back to the encode-and-parse round trip.
+
+    Args:
+        :param obj: Object to convert
+
+    Returns:
+        Structure of dicts, lists and JSON scalars equivalent to the object
+
+    Raises:
+        TypeError: If the object contains values no encoder can serialize
+    """
+    try:
+        return to_jsonable_python(
+            obj, by_alias=False, fallback=pydantic_json_encoder.default
+        )
+    except (PydanticSerializationError, UnicodeDecodeError):
+        return json.loads(pydantic_json_encoder.encode(obj))
@@ -0,0 +1,43 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Deferred traceback formatting for log records."""
+
+import traceback
+from types import TracebackType
+
+
+class LazyTraceback:
+    """Exception traceback that is only formatted when rendered as a string.
+
+    Walking frames and reading source lines is expensive, so formatting is
+    deferred until a log handler actually serializes the record. The
+    traceback is pinned at construction so later re-raises do not change
+    the rendered output, and the formatted text is cached after first use.
+    """
+
+    __slots__ = ("_exc", "_tb", "_text")
+
+    def __init__(self, exc: BaseException):
+        """Initialize the lazy traceback.
+
+        Args:
+            :param exc: Exception whose traceback should be rendered
+        """
+        self._exc = exc
+        self._tb: TracebackType | None = exc.__traceback__
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        """Format the traceback on first access and return the cached text.
+
+        Returns:
+            Formatted traceback text
+        """
+        if self._text is None:
+            self._text = "".join(
+                traceback.TracebackException(
+                    type(self._exc), self._exc, self._tb, capture_locals=False
+                ).format()
+            )
+        return self._text
+
+    __repr__ = __str__
@@ -7,10 +7,11 @@ simplified string-based fake SSE format for testing and debugging.
 """
 
 import time
-import uuid
 
 from ag_ui.core import BaseEvent
 
+from ...tools.id_generator import generate_id
+
 
 def convert_agui_event_to_str_fake_sse(event: BaseEvent) -> str:
     """Convert AGUI BaseEvent to simplified string-based fake SSE format.
@@ -56,5 +57,5 @@ def convert_agui_event_to_sse(event: BaseEvent) -> dict[str, str]:
             by_alias=True, exclude_none=True, exclude={"type"}
         ),
         "event": event.type.value,
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
     }
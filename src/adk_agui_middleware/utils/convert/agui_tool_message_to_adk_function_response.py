@@ -14,6 +14,35 @@ from google.genai import types
 from ...loggers.record_log import record_warning_log
 
 
+# Shared result for empty tool content; FunctionResponse validation copies it
+_EMPTY_SUCCESS_RESULT: dict[str, Any] = {"success": True, "result": None}
+
+
+def _parse_tool_content(
+    tool_message: ToolMessage, tool_call_name: str
+) -> dict[str, Any]:
+    """Parse tool message content with error handling for empty content.
+
+    Blank content is detected with isspace(), which scans the string without
+    allocating a stripped copy of a possibly large payload.
+
+    Args:
+        :param tool_message: AGUI ToolMessage containing the tool execution result
+        :param tool_call_name: Name of the function that was called
+
+    Returns:
+        Dictionary containing parsed tool result or default success response
+    """
+    content = tool_message.content
+    if not content or content.isspace():
+        record_warning_log(
+            "Empty tool result content for tool call %s: %s, using empty success result",
+            args=(tool_message.tool_call_id, tool_call_name),
+        )
+        return _EMPTY_SUCCESS_RESULT
+    return cast(dict[str, Any], json.loads(content))
+
+
 def convert_agui_tool_message_to_adk_function_response(
     tool_message: ToolMessage, tool_call_name: str
 ) -> types.Part:
@@ -37,23 +66,10 @@ def convert_agui_tool_message_to_adk_function_response(
         json.JSONDecodeError: If tool message content is not valid JSON (implicitly)
     """
 
-    def parse_tool_content() -> dict[str, Any]:
-        """Parse tool message content with error handling for empty content.
-
-        Returns:
-            Dictionary containing parsed tool result or default success response
-        """
-        if not tool_message.content or not tool_message.content.strip():
-            record_warning_log(
-                f"Empty tool result content for tool call {tool_message.tool_call_id}: {tool_call_name}, using empty success result"
-            )
-            return {"success": True, "result": None}
-        return cast(dict[str, Any], json.loads(tool_message.content))
-
     return types.Part(
         function_response=types.FunctionResponse(
             id=tool_message.tool_call_id,
             name=tool_call_name,
-            response=parse_tool_content(),
+            response=_parse_tool_content(tool_message, tool_call_name),
         )
     )
@@ -6,8 +6,6 @@ between Google GenAI and AGUI event formats, managing tool call sequences
 and result event creation.
 """
 
-import json
-import uuid
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -22,7 +20,8 @@ from ag_ui.core import (
 from google.adk.events import Event
 from google.genai import types
 
-from ...tools.json_encoder import PydanticJsonEncoder
+from ...tools.id_generator import generate_id
+from ...tools.json_encoder import encode_json
 
 
 class FunctionCallEventUtil:
@@ -51,10 +50,10 @@ class FunctionCallEventUtil:
             ToolCallResultEvent containing the function result
         """
         return ToolCallResultEvent(
-            message_id=str(uuid.uuid4()),
+            message_id=generate_id("msg_"),
             type=EventType.TOOL_CALL_RESULT,
             tool_call_id=tool_call_id,
-            content=json.dumps(content, cls=PydanticJsonEncoder) if content else "",
+            content=encode_json(content) if content else "",
             raw_event=adk_event,
         )
 
@@ -78,27 +77,62 @@ class FunctionCallEventUtil:
         Yields:
             BaseEvent objects representing the tool call sequence
         """
-        yield ToolCallStartEvent(
-            type=EventType.TOOL_CALL_START,
-            tool_call_id=tool_call_id,
-            tool_call_name=tool_call_name,
-            raw_event=adk_event,
-        )
+        for event in FunctionCallEventUtil._build_function_call_events(
+            tool_call_id, tool_call_name, tool_call_args, adk_event
+        ):
+            yield event
+
+    @staticmethod
+    def _build_function_call_events(
+        tool_call_id: str,
+        tool_call_name: str,
+        tool_call_args: dict[str, Any] | str | None,
+        adk_event: Event | None = None,
+    ) -> list[BaseEvent]:
+        """Build the tool call event sequence for one call as a list.
+
+        Used by the middleware's own translation and frontend tools, which
+        never await between events and so skip the async generator of
+        generate_function_call_event.
+
+        Args:
+            :param tool_call_id: Unique identifier for the tool call
+            :param tool_call_name: Name of the tool being called
+            :param tool_call_args: Arguments for the tool call (dict or string)
+
+        Returns:
+            List of BaseEvent objects representing the tool call sequence
+        """
+        events: list[BaseEvent] = [
+            ToolCallStartEvent(
+                type=EventType.TOOL_CALL_START,
+                tool_call_id=tool_call_id,
+                tool_call_name=tool_call_name,
+                raw_event=adk_event,
+            )
+        ]
         if tool_call_args:
             args_str = (
-                json.dumps(tool_call_args)
+                encode_json(tool_call_args)
                 if isinstance(tool_call_args, dict)
                 else str(tool_call_args)
             )
-            yield ToolCallArgsEvent(
-                type=EventType.TOOL_CALL_ARGS,
+            events.append(
+                ToolCallArgsEvent(
+                    type=EventType.TOOL_CALL_ARGS,
+                    tool_call_id=tool_call_id,
+                    delta=args_str,
+                    raw_event=adk_event,
+                )
+            )
+        events.append(
+            ToolCallEndEvent(
+                type=EventType.TOOL_CALL_END,
                 tool_call_id=tool_call_id,
-                delta=args_str,
                 raw_event=adk_event,
             )
-        yield ToolCallEndEvent(
-            type=EventType.TOOL_CALL_END, tool_call_id=tool_call_id, raw_event=adk_event
         )
+        return events
 
     async def generate_function_calls_event(
         self, function_calls: list[types.FunctionCall], adk_event: Event | None = None
@@ -114,14 +148,31 @@ class FunctionCallEventUtil:
         Yields:
             BaseEvent objects for all function calls in sequence
         """
+        for event in self._build_function_calls_events(function_calls, adk_event):
+            yield event
+
+    def _build_function_calls_events(
+        self, function_calls: list[types.FunctionCall], adk_event: Event | None = None
+    ) -> list[BaseEvent]:
+        """Build the tool call event sequences for several calls as one list.
+
+        Args:
+            :param function_calls: List of Google GenAI function calls to process
+
+        Returns:
+            List of BaseEvent objects for all function calls in sequence
+        """
+        events: list[BaseEvent] = []
         for func_call in function_calls:
-            tool_call_id = func_call.id or str(uuid.uuid4())
+            tool_call_id = func_call.id or generate_id("call_")
             if not func_call.name:
                 continue
-            async for agui_event in self.generate_function_call_event(
-                tool_call_id=tool_call_id,
-                tool_call_name=func_call.name,
-                tool_call_args=func_call.args,
-                adk_event=adk_event,
-            ):
-                yield agui_event
+            events.extend(
+                self._build_function_call_events(
+                    tool_call_id=tool_call_id,
+                    tool_call_name=func_call.name,
+                    tool_call_args=func_call.args,
+                    adk_event=adk_event,
+                )
+            )
+        return events
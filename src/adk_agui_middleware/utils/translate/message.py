@@ -44,21 +44,46 @@ class MessageEventUtil:
         Yields:
             BaseEvent objects for the complete message sequence
         """
-        yield TextMessageStartEvent(
-            type=EventType.TEXT_MESSAGE_START,
-            message_id=message_id,
-            role="assistant",
-            raw_event=adk_event,
-        )
-        yield TextMessageContentEvent(
-            type=EventType.TEXT_MESSAGE_CONTENT,
-            message_id=message_id,
-            delta=message,
-            raw_event=adk_event,
-        )
-        yield TextMessageEndEvent(
-            type=EventType.TEXT_MESSAGE_END, message_id=message_id, raw_event=adk_event
-        )
+        for event in MessageEventUtil._build_message_events(
+            message_id, message, adk_event
+        ):
+            yield event
+
+    @staticmethod
+    def _build_message_events(
+        message_id: str, message: str, adk_event: Event | None = None
+    ) -> list[BaseEvent]:
+        """Build the text message event sequence as a list.
+
+        Used by the middleware's own translation, which never awaits and so
+        skips the async generator of generate_message_event.
+
+        Args:
+            :param message_id: Unique identifier for the message
+            :param message: Text content to display in the message
+
+        Returns:
+            List of BaseEvent objects for the complete message sequence
+        """
+        return [
+            TextMessageStartEvent(
+                type=EventType.TEXT_MESSAGE_START,
+                message_id=message_id,
+                role="assistant",
+                raw_event=adk_event,
+            ),
+            TextMessageContentEvent(
+                type=EventType.TEXT_MESSAGE_CONTENT,
+                message_id=message_id,
+                delta=message,
+                raw_event=adk_event,
+            ),
+            TextMessageEndEvent(
+                type=EventType.TEXT_MESSAGE_END,
+                message_id=message_id,
+                raw_event=adk_event,
+            ),
+        ]
 
     @staticmethod
     def create_message_snapshot(
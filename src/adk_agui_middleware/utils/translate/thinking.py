@@ -1,7 +1,6 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Utility functions for creating thinking events and message sequences in AGUI format."""
 
-import uuid
 from collections.abc import AsyncGenerator
 
 from ag_ui.core import EventType, ThinkingEndEvent, ThinkingStartEvent
@@ -13,6 +12,7 @@ from ...event.agui_event import (
     CustomThinkingTextMessageEndEvent,
     CustomThinkingTextMessageStartEvent,
 )
+from ...tools.id_generator import generate_id
 
 
 class ThinkingEventUtil:
@@ -129,7 +129,7 @@ class ThinkingMessageEventUtil:
         Yields:
             TranslateEvent objects for start, content, and end of thinking message
         """
-        uid = uid if uid else str(uuid.uuid4())
+        uid = uid if uid else generate_id("thinking_")
         yield self.create_thinking_message_start_event(uid, adk_event=adk_event)
         yield self.create_thinking_message_content_event(
             message, uid, adk_event=adk_event
@@ -153,7 +153,7 @@ class ThinkingMessageEventUtil:
         Yields:
             TranslateEvent objects representing thinking events sequence (start, content chunks, end)
         """
-        uid = uid if uid else str(uuid.uuid4())
+        uid = uid if uid else generate_id("thinking_")
         yield self.create_thinking_message_start_event(uid, adk_event=adk_event)
         async for text_chunk in message:
             yield self.create_thinking_message_content_event(
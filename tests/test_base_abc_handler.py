@@ -0,0 +1,64 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.base_abc.handler module."""
+
+import unittest
+from unittest.mock import AsyncMock
+
+from adk_agui_middleware.base_abc.handler import (
+    BaseADKEventHandler,
+    BaseInOutHandler,
+    BaseTranslateHandler,
+)
+
+
+class TestHandlerAsyncHooks(unittest.TestCase):
+    """Test cases for the async hook check run when handlers are subclassed."""
+
+    def test_sync_hook_is_rejected(self):
+        """Test that a plain def override of an awaited hook raises TypeError."""
+        with self.assertRaisesRegex(TypeError, "SyncHandler.process"):
+
+            class SyncHandler(BaseADKEventHandler):
+                def __init__(self, input_info):
+                    self.input_info = input_info
+
+                def process(self, event):
+                    return [event]
+
+    def test_sync_in_out_hook_is_rejected(self):
+        """Test that in/out handler recording hooks are checked too."""
+        with self.assertRaisesRegex(TypeError, "input_record"):
+
+            class SyncRecorder(BaseInOutHandler):
+                def input_record(self, input_info):
+                    pass
+
+    def test_async_hooks_are_accepted(self):
+        """Test that coroutine, async generator and mock hooks are allowed."""
+
+        class GeneratorHandler(BaseTranslateHandler):
+            def __init__(self, input_info):
+                self.input_info = input_info
+
+            async def translate(self, adk_event):
+                yield adk_event
+
+        class CoroutineHandler(BaseADKEventHandler):
+            def __init__(self, input_info):
+                self.input_info = input_info
+
+            async def process(self, event):
+                return None
+
+        class MockRecorder(BaseInOutHandler):
+            input_record = AsyncMock()
+            output_record = AsyncMock()
+            output_catch_and_change = AsyncMock()
+
+        self.assertTrue(issubclass(GeneratorHandler, BaseTranslateHandler))
+        self.assertTrue(issubclass(CoroutineHandler, BaseADKEventHandler))
+        self.assertTrue(issubclass(MockRecorder, BaseInOutHandler))
+
+
+if __name__ == "__main__":
+    unittest.main()
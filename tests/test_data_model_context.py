@@ -70,6 +70,16 @@ class TestConfigContext:
         assert config.session_id == default_session_id
         assert config.extract_initial_state is None
 
+    def test_context_config_agui_event_queue_unbounded_by_default(self):
+        """Test that the AGUI event queue is unbounded unless configured."""
+        assert ConfigContext(user_id="user").agui_event_queue_max_size == 0
+        assert (
+            ConfigContext(
+                user_id="user", agui_event_queue_max_size=64
+            ).agui_event_queue_max_size
+            == 64
+        )
+
     def test_context_config_creation_all_fields(self):
         """Test ConfigContext creation with all fields specified."""
 
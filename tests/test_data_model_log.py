@@ -0,0 +1,50 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.data_model.log module."""
+
+import unittest
+
+from adk_agui_middleware.data_model.log import LogMessage
+
+
+class TestLogMessage(unittest.TestCase):
+    """Test cases for the LogMessage data model."""
+
+    def test_to_dict_includes_all_fields(self):
+        """Test that to_dict returns every field by default."""
+        message = LogMessage(msg="hello", func_name="module.func")
+
+        self.assertEqual(
+            message.to_dict(),
+            {
+                "msg": "hello",
+                "func_name": "module.func",
+                "error_message": None,
+                "headers": None,
+                "request_body": None,
+                "body": None,
+                "stack_message": None,
+            },
+        )
+
+    def test_to_dict_exclude_none(self):
+        """Test that exclude_none drops unset fields and keeps values by reference."""
+        headers = {"content-type": "application/json"}
+        message = LogMessage(msg="hello", func_name="module.func", headers=headers)
+
+        result = message.to_dict(exclude_none=True)
+
+        self.assertEqual(
+            result, {"msg": "hello", "func_name": "module.func", "headers": headers}
+        )
+        self.assertIs(result["headers"], headers)
+
+    def test_slots_prevent_unknown_attributes(self):
+        """Test that the slotted model rejects undeclared attributes."""
+        message = LogMessage(msg="hello", func_name="module.func")
+
+        with self.assertRaises(AttributeError):
+            message.unknown = "value"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,16 @@ class TestAGUIErrorEvent(unittest.TestCase):
         self.assertEqual(result.code, "EXECUTION_ERROR")
         mock_record_error.assert_called_once_with("Error in new execution", test_exception)
 
+    @patch("adk_agui_middleware.event.error_event.record_error_log")
+    def test_execution_error_truncates_long_exception(self, mock_record_error):
+        """Test that oversized exception text is truncated in the event message."""
+        test_exception = Exception("x" * 1000)
+
+        result = AGUIErrorEvent.create_execution_error_event(test_exception)
+
+        self.assertEqual(result.message, repr(test_exception)[:256] + "...")
+        mock_record_error.assert_called_once_with("Error in new execution", test_exception)
+
     @patch("adk_agui_middleware.event.error_event.record_error_log")
     def test_no_tool_results(self, mock_record_error):
         """Test creating no tool results error event."""
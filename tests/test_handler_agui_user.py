@@ -1,6 +1,7 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Tests for AGUIUserHandler class."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -11,6 +12,7 @@ from ag_ui.core import (BaseEvent, EventType, RunErrorEvent, RunFinishedEvent,
 from google.adk.events import Event
 from google.genai import types
 
+from adk_agui_middleware.data_model.queue import EventQueue
 from adk_agui_middleware.event.error_event import AGUIErrorEvent
 from adk_agui_middleware.handler.agui_user import AGUIUserHandler
 from adk_agui_middleware.handler.queue import QueueHandler
@@ -29,7 +31,7 @@ class TestAGUIUserHandler:
         handler.set_long_running_tool_ids = Mock()
         handler.run_async_with_adk = AsyncMock()
         handler.run_async_with_agui = AsyncMock()
-        handler.force_close_streaming_message = AsyncMock()
+        handler.force_close_streaming_message = Mock(return_value=[])
         handler.create_state_snapshot_event = AsyncMock()
         return handler
 
@@ -260,7 +262,7 @@ class TestAGUIUserHandler:
 
     @pytest.mark.asyncio
     async def test_run_workflow(self, agui_user_handler, mock_session_handler, mock_user_message_handler):
-        """Test complete workflow execution."""
+        """Test complete workflow execution through run."""
         mock_user_message_handler.initial_state = {"initial": "state"}
 
         # Mock the queue iterators to return some events
@@ -277,13 +279,15 @@ class TestAGUIUserHandler:
 
         agui_user_handler.agui_queue.get_iterator = Mock(return_value=mock_agui_queue_iterator())
 
-        with patch.object(agui_user_handler, "_run_async_with_adk", side_effect=mock_run_async_with_adk):
-            with patch.object(agui_user_handler, "_run_async_with_agui", side_effect=mock_run_async_with_agui):
-                agui_user_handler.tool_call_info = {"tool-1": "function_1"}
+        with patch.object(agui_user_handler, "_async_init"):
+            with patch.object(agui_user_handler, "set_user_input", return_value=None):
+                with patch.object(agui_user_handler, "_run_async_with_adk", side_effect=mock_run_async_with_adk):
+                    with patch.object(agui_user_handler, "_run_async_with_agui", side_effect=mock_run_async_with_agui):
+                        agui_user_handler.tool_call_info = {"tool-1": "function_1"}
 
-                events = []
-                async for event in agui_user_handler._run_workflow():
-                    events.append(event)
+                        events = []
+                        async for event in agui_user_handler.run():
+                            events.append(event)
 
         # Should have start event + 2 from queue iterator + finish event
         assert len(events) == 4
@@ -292,25 +296,32 @@ class TestAGUIUserHandler:
 
         # Verify session operations
         mock_session_handler.check_and_create_session.assert_called_once_with({"initial": "state"})
-        mock_session_handler.update_session_state.assert_called_once_with({"initial": "state"})
+        mock_session_handler.update_session_state.assert_called_once_with(
+            {"initial": "state"},
+            session=mock_session_handler.check_and_create_session.return_value,
+        )
         mock_session_handler.overwrite_pending_tool_calls.assert_called_once_with({"tool-1": "function_1"})
 
     @pytest.mark.asyncio
-    async def test_run_success(self, agui_user_handler):
+    async def test_run_success(self, agui_user_handler, mock_running_handler):
         """Test successful run execution."""
-        async def mock_workflow_generator():
+        async def mock_agui_queue_iterator():
             yield Mock(spec=BaseEvent)
             yield Mock(spec=BaseEvent)
 
+        agui_user_handler.agui_queue.get_iterator = Mock(return_value=mock_agui_queue_iterator())
+
         with patch.object(agui_user_handler, "_async_init") as mock_init:
             with patch.object(agui_user_handler, "set_user_input", return_value=None):
-                with patch.object(agui_user_handler, "_run_workflow", return_value=mock_workflow_generator()):
-                    events = []
-                    async for event in agui_user_handler.run():
-                        events.append(event)
+                with patch.object(agui_user_handler, "_run_async_with_adk", new=AsyncMock()):
+                    with patch.object(agui_user_handler, "_run_async_with_agui", new=AsyncMock()):
+                        events = []
+                        async for event in agui_user_handler.run():
+                            events.append(event)
 
-        assert len(events) == 2
+        assert len(events) == 4
         mock_init.assert_called_once()
+        mock_running_handler.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_run_with_input_error(self, agui_user_handler):
@@ -333,17 +344,72 @@ class TestAGUIUserHandler:
 
         with patch.object(agui_user_handler, "_async_init"):
             with patch.object(agui_user_handler, "set_user_input", return_value=None):
-                with patch.object(agui_user_handler, "_run_workflow", side_effect=test_exception):
-                    with patch.object(AGUIErrorEvent, "create_execution_error_event") as mock_error:
-                        mock_error.return_value = Mock(spec=RunErrorEvent)
+                agui_user_handler.session_handler.check_and_create_session.side_effect = test_exception
+                with patch.object(AGUIErrorEvent, "create_execution_error_event") as mock_error:
+                    mock_error.return_value = Mock(spec=RunErrorEvent)
 
-                        events = []
-                        async for event in agui_user_handler.run():
-                            events.append(event)
+                    events = []
+                    async for event in agui_user_handler.run():
+                        events.append(event)
 
-        assert len(events) == 1
+        assert len(events) == 2
+        assert isinstance(events[0], RunStartedEvent)
+        assert events[1] == mock_error.return_value
         mock_error.assert_called_once_with(test_exception)
 
+    @pytest.mark.asyncio
+    async def test_run_long_running_tool_with_small_agui_queue(
+        self, mock_running_handler, mock_user_message_handler, mock_session_handler
+    ):
+        """Test that frontend tool events emitted after the sentinel cannot hang the run."""
+        queue_handler = QueueHandler(
+            EventQueue(adk_event_queue=asyncio.Queue(), agui_event_queue=asyncio.Queue(maxsize=1))
+        )
+        handler = AGUIUserHandler(
+            running_handler=mock_running_handler,
+            user_message_handler=mock_user_message_handler,
+            session_handler=mock_session_handler,
+            queue_handler=queue_handler,
+        )
+        long_running_event = Mock(spec=Event)
+
+        def tool_events(tool_call_id):
+            return [
+                ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=f"{tool_call_id}-{i}")
+                for i in range(3)
+            ]
+
+        async def run_async_with_adk(**_):
+            yield long_running_event
+            # Frontend tools run after ADK yields the long-running call
+            while not handler.agui_queue.closed:
+                await asyncio.sleep(0)
+            await asyncio.gather(
+                handler.agui_queue.put_many(tool_events("a")),
+                handler.agui_queue.put_many(tool_events("b")),
+            )
+
+        async def run_async_with_agui(_adk_event):
+            for event in tool_events("translated"):
+                yield event
+
+        mock_running_handler.run_async_with_adk = run_async_with_adk
+        mock_running_handler.run_async_with_agui = run_async_with_agui
+
+        async def collect():
+            return [event async for event in handler.run()]
+
+        with patch.object(handler, "set_user_input", return_value=None), \
+                patch.object(handler, "check_is_long_running_tool", return_value=True):
+            events = await asyncio.wait_for(collect(), timeout=2)
+
+        assert isinstance(events[0], RunStartedEvent)
+        assert [event.tool_call_id for event in events[1:-1]] == [
+            f"translated-{i}" for i in range(3)
+        ]
+        assert isinstance(events[-1], RunFinishedEvent)
+        mock_session_handler.overwrite_pending_tool_calls.assert_called_once()
+
 
 async def async_generator(items):
     """Helper function to create async generator."""
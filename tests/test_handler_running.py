@@ -104,6 +104,27 @@ class TestRunningHandler(unittest.TestCase):
         self.assertIsNotNone(handler.agui_state_snapshot_handler)
         self.assertIsNotNone(handler.translate_handler)
 
+    def test_init_handler_reuses_shared_instances(self):
+        """Test that handlers configured as instances are not re-created."""
+        class SharedTimeoutHandler(BaseADKEventTimeoutHandler):
+            def __init__(self, input_info):
+                self.input_info = input_info
+
+            async def get_timeout(self):
+                return 30
+
+            async def process_timeout_fallback(self):
+                yield "timeout"
+
+        shared = SharedTimeoutHandler(None)
+        context = HandlerContext(adk_event_timeout_handler=shared)
+
+        first = RunningHandler(self.mock_runner, self.mock_run_config, context)
+        second = RunningHandler(self.mock_runner, self.mock_run_config, context)
+
+        self.assertIs(first.adk_event_timeout_handler, shared)
+        self.assertIs(second.adk_event_timeout_handler, shared)
+
     async def test_process_events_with_handler_no_handler(self):
         """Test processing events without a handler."""
         async def mock_event_stream():
@@ -137,7 +158,7 @@ class TestRunningHandler(unittest.TestCase):
         
         events = []
         async for event in self.handler._process_events_with_handler(
-            mock_event_stream(), mock_log_func, mock_handler
+            mock_event_stream(), mock_log_func, mock_handler.process
         ):
             events.append(event)
         
@@ -163,7 +184,7 @@ class TestRunningHandler(unittest.TestCase):
         
         events = []
         async for event in self.handler._process_events_with_handler(
-            mock_event_stream(), mock_log_func, mock_handler
+            mock_event_stream(), mock_log_func, mock_handler.process
         ):
             events.append(event)
         
@@ -395,5 +416,124 @@ class TestRunningHandler(unittest.TestCase):
                 mock_process.assert_called_once()
 
 
+class TestRunningHandlerTimeoutScope(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the timeout scope around processed event streams."""
+
+    def setUp(self):
+        """Set up a handler with a timeout handler configured."""
+        self.handler = RunningHandler(Mock(spec=Runner), Mock(spec=RunConfig))
+        self.handler.adk_event_timeout_handler = Mock(
+            spec=BaseADKEventTimeoutHandler, get_timeout=AsyncMock(return_value=5)
+        )
+
+    @staticmethod
+    async def _stream():
+        yield "event1"
+
+    async def test_stream_without_timeout_skips_timeout_scope(self):
+        """Test that streams with timeout disabled do not enter asyncio.timeout."""
+        with patch("asyncio.timeout") as mock_timeout:
+            events = [
+                event
+                async for event in self.handler._process_events_with_handler(
+                    self._stream(), Mock()
+                )
+            ]
+
+        self.assertEqual(events, ["event1"])
+        mock_timeout.assert_not_called()
+        self.handler.adk_event_timeout_handler.get_timeout.assert_not_awaited()
+
+    async def test_stream_with_timeout_uses_handler_timeout(self):
+        """Test that streams with timeout enabled are bounded by the handler."""
+        with patch("asyncio.timeout", wraps=asyncio.timeout) as mock_timeout:
+            events = [
+                event
+                async for event in self.handler._process_events_with_handler(
+                    self._stream(), Mock(), enable_timeout=True
+                )
+            ]
+
+        self.assertEqual(events, ["event1"])
+        mock_timeout.assert_called_once_with(5)
+
+
+class TestRunningHandlerProcessEvents(unittest.IsolatedAsyncioTestCase):
+    """Test cases for processing whole event streams through a handler."""
+
+    @staticmethod
+    async def _stream(*events):
+        for event in events:
+            yield event
+
+    async def test_handler_output_replaces_events_and_drops_none(self):
+        """Test that handler results are yielded and None results are dropped."""
+        class DoublingHandler:
+            async def process(self, event):
+                return TestRunningHandlerProcessEvents._stream(event, None, event * 2)
+
+        log_func = Mock()
+        events = [
+            event
+            async for event in RunningHandler._process_events(
+                self._stream(1, 2), log_func, DoublingHandler().process
+            )
+        ]
+
+        self.assertEqual(events, [1, 2, 2, 4])
+        self.assertEqual(log_func.call_count, 2)
+
+    async def test_user_events_bypass_handler(self):
+        """Test that user-authored ADK events are not passed to the handler."""
+        user_event = Mock(spec=Event, author="user")
+        handler = Mock(spec=BaseADKEventHandler)
+
+        events = [
+            event
+            async for event in RunningHandler._process_events(
+                self._stream(user_event), Mock(), handler.process
+            )
+        ]
+
+        self.assertEqual(events, [user_event])
+        handler.process.assert_not_called()
+
+    async def test_async_generator_hooks_are_bound_for_awaiting(self):
+        """Test that hooks written as async generators work once bound."""
+        class GeneratorAGUIHandler(BaseAGUIEventHandler):
+            def __init__(self, input_info):
+                self.input_info = input_info
+
+            async def process(self, event):
+                yield f"processed_{event}"
+
+        class CoroutineTranslateHandler(BaseTranslateHandler):
+            def __init__(self, input_info):
+                self.input_info = input_info
+
+            async def translate(self, adk_event):
+                return TestRunningHandlerProcessEvents._stream()
+
+        handler = RunningHandler(
+            Mock(spec=Runner),
+            Mock(spec=RunConfig),
+            HandlerContext(
+                agui_event_handler=GeneratorAGUIHandler,
+                translate_handler=CoroutineTranslateHandler,
+            ),
+        )
+
+        events = [
+            event
+            async for event in handler._process_events_with_handler(
+                self._stream("event1"), Mock(), handler._agui_event_process
+            )
+        ]
+        translated = [event async for event in await handler._translate(Mock())]
+
+        self.assertEqual(events, ["processed_event1"])
+        self.assertEqual(translated, [])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -227,59 +227,53 @@ class TestSessionHandler(unittest.TestCase):
 
         mock_error.assert_called_once()
 
-    @patch("adk_agui_middleware.handler.session.record_warning_log")
-    async def test_get_pending_tool_calls_success(self, mock_warning):
+    @patch("adk_agui_middleware.handler.session.record_error_log")
+    async def test_get_pending_tool_calls_success(self, mock_error):
         """Test successful retrieval of pending tool calls."""
-        session_state = {
-            "test_session": "session_data",
-            "pending_tool_calls": ["call1", "call2"],
-        }
-        self.mock_session_manager.get_session_state = AsyncMock(
-            return_value=session_state
+        self.mock_session_manager.get_state_value = AsyncMock(
+            return_value={"call1": "tool1", "call2": "tool2"}
         )
 
         result = await self.session_handler.get_pending_tool_calls()
 
-        self.assertEqual(result, ["call1", "call2"])
-        mock_warning.assert_not_called()
+        self.assertEqual(result, {"call1": "tool1", "call2": "tool2"})
+        self.mock_session_manager.get_state_value.assert_called_once_with(
+            self.session_parameter, "pending_tool_calls", {}
+        )
+        mock_error.assert_not_called()
 
     @patch("adk_agui_middleware.handler.session.record_error_log")
     async def test_get_pending_tool_calls_no_session(self, mock_error):
-        """Test get_pending_tool_calls when session state has no pending calls."""
-        session_state = {"other_key": "data"}
-        self.mock_session_manager.get_session_state = AsyncMock(
-            return_value=session_state
+        """Test get_pending_tool_calls when the session does not exist."""
+        self.mock_session_manager.get_state_value = AsyncMock(
+            side_effect=lambda _param, _key, default: default
         )
 
         result = await self.session_handler.get_pending_tool_calls()
 
-        # Should return empty list when pending_tool_calls key is not in state
-        self.assertEqual(result, [])
+        self.assertEqual(result, {})
         mock_error.assert_not_called()
 
     @patch("adk_agui_middleware.handler.session.record_error_log")
     async def test_get_pending_tool_calls_no_pending_calls(self, mock_error):
         """Test get_pending_tool_calls when no pending calls in session."""
-        session_state = {"other_key": "other_value"}
-        self.mock_session_manager.get_session_state = AsyncMock(
-            return_value=session_state
-        )
+        self.mock_session_manager.get_state_value = AsyncMock(return_value={})
 
         result = await self.session_handler.get_pending_tool_calls()
 
-        self.assertEqual(result, [])
+        self.assertEqual(result, {})
         mock_error.assert_not_called()
 
     @patch("adk_agui_middleware.handler.session.record_error_log")
     async def test_get_pending_tool_calls_exception(self, mock_error):
         """Test get_pending_tool_calls handles exceptions."""
-        self.mock_session_manager.get_session_state = AsyncMock(
+        self.mock_session_manager.get_state_value = AsyncMock(
             side_effect=Exception("Test error")
         )
 
         result = await self.session_handler.get_pending_tool_calls()
 
-        self.assertEqual(result, [])  # Should return empty list, not None
+        self.assertEqual(result, {})
         mock_error.assert_called_once()
 
     @patch("adk_agui_middleware.handler.session.record_error_log")
@@ -0,0 +1,140 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.handler.session_lock_handler module."""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+from adk_agui_middleware.data_model.common import SessionLockConfig
+from adk_agui_middleware.handler.session_lock_handler import DefaultSessionLockHandler
+
+
+def _input_info(session_id: str) -> Mock:
+    return Mock(session_id=session_id)
+
+
+class TestDefaultSessionLockHandler(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the DefaultSessionLockHandler class."""
+
+    def setUp(self):
+        """Set up a handler that never waits between retries."""
+        self.handler = DefaultSessionLockHandler(
+            SessionLockConfig(lock_timeout=300, lock_retry_times=0)
+        )
+
+    async def test_lock_and_unlock(self):
+        """Test that a released session can be locked again."""
+        info = _input_info("session-1")
+
+        self.assertTrue(await self.handler.lock(info))
+        self.assertFalse(await self.handler.lock(info))
+
+        await self.handler.unlock(info)
+        self.assertTrue(await self.handler.lock(info))
+
+    async def test_unlock_unknown_session(self):
+        """Test that unlocking a session that is not locked is a no-op."""
+        await self.handler.unlock(_input_info("missing"))
+        self.assertEqual(self.handler.locks, {})
+
+    async def test_concurrent_lock_only_one_wins(self):
+        """Test that concurrent acquisitions of one session admit a single caller."""
+        info = _input_info("session-1")
+
+        results = await asyncio.gather(*(self.handler.lock(info) for _ in range(10)))
+
+        self.assertEqual(results.count(True), 1)
+
+    async def test_expired_lock_is_reclaimed(self):
+        """Test that a lock held past lock_timeout can be taken over."""
+        info = _input_info("session-1")
+        with patch("time.monotonic", return_value=1000.0):
+            self.assertTrue(await self.handler.lock(info))
+        with patch("time.monotonic", return_value=1000.0 + 300):
+            self.assertTrue(await self.handler.lock(info))
+
+    async def test_expired_locks_of_other_sessions_are_purged(self):
+        """Test that abandoned expired locks are removed on any acquisition."""
+        with patch("time.monotonic", return_value=1000.0):
+            await self.handler.lock(_input_info("abandoned"))
+        with patch("time.monotonic", return_value=1100.0):
+            await self.handler.lock(_input_info("fresh"))
+        with patch("time.monotonic", return_value=1300.0):
+            await self.handler.lock(_input_info("other"))
+
+        self.assertEqual(set(self.handler.locks), {"fresh", "other"})
+
+    async def test_reacquired_lock_is_not_purged_by_stale_deadline(self):
+        """Test that a deadline from an earlier hold does not evict a newer lock."""
+        info = _input_info("session-1")
+        with patch("time.monotonic", return_value=1000.0):
+            await self.handler.lock(info)
+            await self.handler.unlock(info)
+        with patch("time.monotonic", return_value=1200.0):
+            await self.handler.lock(info)
+        with patch("time.monotonic", return_value=1350.0):
+            self.assertFalse(await self.handler.lock(info))
+
+    async def test_released_lock_deadlines_do_not_accumulate(self):
+        """Test that lock/unlock cycles keep the expiry heap bounded."""
+        infos = [_input_info(f"session-{i}") for i in range(5)]
+        for _ in range(2000):
+            for info in infos:
+                await self.handler.lock(info)
+                await self.handler.unlock(info)
+
+        self.assertEqual(self.handler.locks, {})
+        self.assertLess(len(self.handler._deadlines), 100)
+
+    async def test_compaction_keeps_deadlines_of_held_locks(self):
+        """Test that compacting the heap still expires locks that are held."""
+        held = _input_info("held")
+        with patch("time.monotonic", return_value=1000.0):
+            await self.handler.lock(held)
+            for i in range(200):
+                info = _input_info(f"session-{i}")
+                await self.handler.lock(info)
+                await self.handler.unlock(info)
+        with patch("time.monotonic", return_value=1350.0):
+            self.assertTrue(await self.handler.lock(held))
+
+    async def test_lock_records_acquisition_timestamp(self):
+        """Test that each held lock is stored as its acquisition timestamp."""
+        with patch("time.monotonic", return_value=1000.0):
+            await self.handler.lock(_input_info("session-1"))
+
+        self.assertEqual(self.handler.locks, {"session-1": 1000.0})
+
+    async def test_lock_without_timeout_never_expires(self):
+        """Test that a None lock_timeout keeps locks until unlocked."""
+        handler = DefaultSessionLockHandler(
+            SessionLockConfig(lock_timeout=None, lock_retry_times=0)
+        )
+        info = _input_info("session-1")
+
+        self.assertTrue(await handler.lock(info))
+        self.assertFalse(await handler.lock(info))
+
+    async def test_locked_releases_on_exit(self):
+        """Test that the locked context releases the lock it acquired."""
+        info = _input_info("session-1")
+
+        async with self.handler.locked(info) as acquired:
+            self.assertTrue(acquired)
+            self.assertIn("session-1", self.handler.locks)
+
+        self.assertNotIn("session-1", self.handler.locks)
+
+    async def test_locked_keeps_lock_it_did_not_acquire(self):
+        """Test that a refused locked context leaves the holder's lock alone."""
+        info = _input_info("session-1")
+        self.assertTrue(await self.handler.lock(info))
+
+        async with self.handler.locked(info) as acquired:
+            self.assertFalse(acquired)
+
+        self.assertIn("session-1", self.handler.locks)
+
+
+if __name__ == "__main__":
+    unittest.main()
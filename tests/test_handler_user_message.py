@@ -1,6 +1,7 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Unit tests for adk_agui_middleware.handler.user_message module."""
 
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, Mock
 
@@ -209,6 +210,38 @@ class TestUserMessageHandler(unittest.TestCase):
         self.assertEqual(handler.initial_state, self.initial_state)
         self.assertIsNone(handler.convert_run_agent_input)
 
+    def test_latest_message_lookup_is_cached(self):
+        """Test that the message scan runs once per AGUI content."""
+        handler = self.create_handler(
+            messages=[UserMessage(id="1", role="user", content="hello")]
+        )
+
+        first = handler.get_latest_message()
+        handler.agui_content.messages.clear()
+
+        self.assertIs(handler.get_latest_message(), first)
+        self.assertIsNone(handler.is_tool_result_submission)
+
+    def test_message_cache_reset_after_input_conversion(self):
+        """Test that converted AGUI content is looked up afresh."""
+        handler = self.create_handler(
+            messages=[UserMessage(id="1", role="user", content="before")]
+        )
+        converted = handler.agui_content.model_copy(
+            update={
+                "messages": [
+                    ToolMessage(id="2", role="tool", tool_call_id="c", content="r")
+                ]
+            }
+        )
+        handler.convert_run_agent_input = AsyncMock(return_value=converted)
+        self.assertIsNone(handler.is_tool_result_submission)
+
+        asyncio.run(handler.init({}))
+
+        self.assertIsInstance(handler.is_tool_result_submission, ToolMessage)
+        self.assertIsNone(handler.get_latest_message())
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,160 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.loggers.logger module."""
+
+import json
+import logging
+import subprocess
+import sys
+import unittest
+
+from adk_agui_middleware.loggers import logger
+from adk_agui_middleware.loggers.logger import JsonFormatter, create_queue_listener
+from adk_agui_middleware.tools.json_encoder import PydanticJsonEncoder
+
+
+class TestJsonFormatter(unittest.TestCase):
+    """Test cases for the JsonFormatter class."""
+
+    def _make_record(self, msg):
+        return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+    def test_format_maps_present_attributes(self):
+        """Test that mapped record attributes are emitted and missing ones skipped."""
+        formatter = JsonFormatter(
+            fmt_dict={"level": "levelname", "missing": "not_an_attribute"},
+            cls=PydanticJsonEncoder,
+        )
+
+        result = json.loads(formatter.format(self._make_record({"msg": "hello"})))
+
+        self.assertEqual(result, {"level": "INFO", "message": {"msg": "hello"}})
+
+    def test_format_keeps_falsy_attribute_values(self):
+        """Test that present attributes with falsy values are still emitted."""
+        formatter = JsonFormatter(fmt_dict={"line": "lineno"})
+        record = self._make_record("hello")
+        record.lineno = 0
+
+        result = json.loads(formatter.format(record))
+
+        self.assertEqual(result["line"], 0)
+
+    def test_format_uses_encoder_default_before_str(self):
+        """Test that the encoder class handles custom types and str is the fallback."""
+
+        class Known:
+            pass
+
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        class KnownEncoder(json.JSONEncoder):
+            def default(self, o):
+                if isinstance(o, Known):
+                    return {"known": True}
+                return super().default(o)
+
+        formatter = JsonFormatter(fmt_dict={}, cls=KnownEncoder)
+        record = self._make_record({"known": Known(), "other": Opaque()})
+
+        result = json.loads(formatter.format(record))
+
+        self.assertEqual(result["message"], {"known": {"known": True}, "other": "opaque"})
+
+    def test_format_keeps_non_ascii(self):
+        """Test that non-ASCII characters are emitted unescaped."""
+        formatter = JsonFormatter(fmt_dict={})
+
+        self.assertIn("🚨", formatter.format(self._make_record("🚨")))
+
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler that keeps every record it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestQueueListener(unittest.TestCase):
+    """Test cases for create_queue_listener."""
+
+    def test_records_reach_handlers_in_order_and_unformatted(self):
+        """Test that every level is delivered, in order, with dict messages intact."""
+        test_logger = logging.getLogger("test_queue_listener")
+        test_logger.setLevel(logging.INFO)
+        test_logger.propagate = False
+        collector = _CollectingHandler()
+        test_logger.addHandler(collector)
+
+        listener = create_queue_listener(test_logger)
+        self.assertNotIn(collector, test_logger.handlers)
+        test_logger.info({"n": 1})
+        test_logger.error({"n": 2})
+        test_logger.warning({"n": 3})
+        listener.stop()
+
+        self.assertEqual(
+            [(r.levelno, r.msg) for r in collector.records],
+            [
+                (logging.INFO, {"n": 1}),
+                (logging.ERROR, {"n": 2}),
+                (logging.WARNING, {"n": 3}),
+            ],
+        )
+
+
+class TestLogListenerLifecycle(unittest.TestCase):
+    """Test cases for starting and stopping the default log listener."""
+
+    def tearDown(self):
+        """Leave the default logger logging synchronously."""
+        logger.stop_log_listener()
+
+    def test_import_starts_no_thread(self):
+        """Test that importing the package leaves logging and threads untouched."""
+        code = (
+            "import threading\n"
+            "import adk_agui_middleware\n"
+            "from adk_agui_middleware.loggers import logger\n"
+            "assert logger.log_listener is None\n"
+            "assert threading.active_count() == 1, threading.enumerate()\n"
+            "assert [type(h) for h in logger.logging.handlers] == "
+            "[logger.log.StreamHandler]\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_start_is_idempotent_and_stop_restores_handlers(self):
+        """Test that start moves handlers behind a queue and stop puts them back."""
+        handlers = list(logger.logging.handlers)
+
+        listener = logger.start_log_listener()
+        self.assertIs(logger.start_log_listener(), listener)
+        self.assertEqual(list(listener.handlers), handlers)
+        self.assertNotIn(handlers[0], logger.logging.handlers)
+
+        logger.stop_log_listener()
+        self.assertIsNone(logger.log_listener)
+        self.assertEqual(logger.logging.handlers, handlers)
+
+    def test_stop_without_start_is_noop(self):
+        """Test that stopping a listener that never started changes nothing."""
+        handlers = list(logger.logging.handlers)
+
+        logger.stop_log_listener()
+
+        self.assertEqual(logger.logging.handlers, handlers)
+
+
+if __name__ == "__main__":
+    unittest.main()
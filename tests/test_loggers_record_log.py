@@ -0,0 +1,107 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.loggers.record_log module."""
+
+import datetime
+import logging
+import unittest
+from unittest.mock import patch
+
+from ag_ui.core import ToolMessage
+
+from adk_agui_middleware.loggers import logger
+from adk_agui_middleware.loggers.record_log import (
+    record_debug_log, record_error_log, record_log)
+
+
+class TestRecordLog(unittest.TestCase):
+    """Test cases for structured logging helpers."""
+
+    def test_record_log_interpolates_args(self):
+        """Test that %-style arguments are applied to the message."""
+        with patch.object(logger.logging, "log") as mock_log:
+            result = record_log("Session %s for %s", {"k": "v"}, args=("s-1", "u-1"))
+
+        self.assertEqual(result["msg"], "Session s-1 for u-1")
+        self.assertEqual(result["body"], {"k": "v"})
+        mock_log.assert_called_once_with(logging.INFO, result)
+
+    def test_disabled_level_skips_message_construction(self):
+        """Test that nothing is formatted or logged when the level is disabled."""
+        with (
+            patch.object(logger.logging, "isEnabledFor", return_value=False),
+            patch(
+                "adk_agui_middleware.loggers.record_log.extract_caller_name"
+            ) as mock_caller,
+            patch.object(logger.logging, "log") as mock_log,
+        ):
+            result = record_debug_log("Skipping %s", args=("tool-1",))
+
+        self.assertIsNone(result)
+        mock_caller.assert_not_called()
+        mock_log.assert_not_called()
+
+    @patch.object(logger.logging, "log")
+    def test_record_error_log_with_exception(self, mock_log):
+        """Test that error logs keep the pre-formatted message and the exception."""
+        error = ValueError("boom")
+
+        result = record_error_log("Failed for session s-1.", error)
+
+        self.assertEqual(result["msg"], "Failed for session s-1.")
+        self.assertEqual(result["error_message"], repr(error))
+        mock_log.assert_called_once_with(logging.ERROR, result)
+
+    def test_format_args_are_keyword_only(self):
+        """Test that extra positional arguments are rejected, not taken as body."""
+        with self.assertRaises(TypeError):
+            record_log("Session %s", None, "s-1")
+        with self.assertRaises(TypeError):
+            record_error_log("failed %s", None, None, "s-1")
+
+    def test_record_log_accepts_positional_body(self):
+        """Test that a positional body is logged as body, not format arguments."""
+        with patch.object(logger.logging, "log"):
+            result = record_log("started", {"k": 1})
+
+        self.assertEqual(result["msg"], "started")
+        self.assertEqual(result["body"], {"k": 1})
+
+    @patch.object(logger.logging, "log")
+    def test_record_error_log_accepts_positional_body(self, _mock_log):
+        """Test that record_error_log keeps its (msg, e, body) positional shape."""
+        error = ValueError("boom")
+
+        result = record_error_log("failed", error, {"k": 1})
+
+        self.assertEqual(result["msg"], "failed")
+        self.assertEqual(result["body"], {"k": 1})
+
+    def test_bad_format_string_is_reported_not_raised(self):
+        """Test that a message that cannot be formatted is logged with its args."""
+        with patch.object(logger.logging, "log"):
+            result = record_log("only %s", args=("a", "b"))
+
+        self.assertTrue(result["msg"].startswith("only %s ('a', 'b')"))
+
+    def test_record_log_converts_model_body_to_json_data(self):
+        """Test that model and date bodies become JSON-compatible data."""
+        message = ToolMessage(id="m-1", role="tool", content="ok", tool_call_id="c-1")
+        body = {"when": datetime.date(2025, 1, 2), "tags": {"a"}, "message": message}
+
+        with patch.object(logger.logging, "log"):
+            result = record_log("Payload", body=body)
+
+        self.assertEqual(result["body"]["when"], "2025-01-02")
+        self.assertEqual(result["body"]["tags"], ["a"])
+        self.assertEqual(result["body"]["message"]["tool_call_id"], "c-1")
+
+    def test_record_log_keeps_undecodable_bytes_placeholder(self):
+        """Test that invalid UTF-8 bytes fall back to the encoder placeholder."""
+        with patch.object(logger.logging, "log"):
+            result = record_log("Bytes", body={"data": b"\xff"})
+
+        self.assertEqual(result["body"], {"data": "[Binary Data]"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.loggers.record_request_log module."""
+
+import logging
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from adk_agui_middleware.config.log import log_config
+from adk_agui_middleware.loggers import logger
+from adk_agui_middleware.loggers.record_request_log import (
+    record_request_error_log, record_request_log)
+
+
+def _create_request(body: bytes) -> Mock:
+    request = Mock()
+    request.headers = {"content-type": "application/json"}
+    request.body = AsyncMock(return_value=body)
+    return request
+
+
+class TestRecordRequestLog(unittest.IsolatedAsyncioTestCase):
+    """Test cases for request logging helpers."""
+
+    @patch.object(logger.logging, "info")
+    async def test_record_request_log_truncates_body(self, mock_info):
+        """Test that oversized bodies are truncated before decoding."""
+        max_bytes = log_config.LOG_REQUEST_BODY_MAX_BYTES
+        request = _create_request(b"a" * (max_bytes + 10))
+
+        result = await record_request_log(request)
+
+        self.assertEqual(result["request_body"], "a" * max_bytes + "...[truncated]")
+        mock_info.assert_called_once_with(result)
+
+    @patch.object(logger.logging, "info")
+    async def test_record_request_log_keeps_headers_mapping(self, _mock_info):
+        """Test that request headers are passed through without copying."""
+        request = _create_request(b"{}")
+
+        result = await record_request_log(request)
+
+        self.assertIs(result["headers"], request.headers)
+
+    @patch.object(logger.logging, "info")
+    async def test_record_request_log_replaces_invalid_utf8(self, _mock_info):
+        """Test that undecodable bytes do not raise."""
+        request = _create_request(b"\xff\xfe")
+
+        result = await record_request_log(request)
+
+        self.assertEqual(result["request_body"], "��")
+
+    @patch.object(logger.logging, "info")
+    async def test_record_request_log_skipped_when_disabled(self, mock_info):
+        """Test that nothing is read or logged when info logging is off."""
+        request = _create_request(b"{}")
+
+        with patch.object(logger.logging, "isEnabledFor", return_value=False):
+            result = await record_request_log(request)
+
+        self.assertIsNone(result)
+        request.body.assert_not_called()
+        mock_info.assert_not_called()
+
+    @patch.object(logger.logging, "error")
+    async def test_record_request_error_log_logs_error(self, mock_error):
+        """Test that request errors are logged at error level."""
+        request = _create_request(b"{}")
+        error = ValueError("boom")
+
+        result = await record_request_error_log(request, error)
+
+        self.assertEqual(result["error_message"], repr(error))
+        self.assertEqual(result["request_body"], "{}")
+        mock_error.assert_called_once_with(result)
+
+    @patch.object(logger.logging, "error")
+    async def test_record_request_error_log_skipped_when_disabled(self, mock_error):
+        """Test that nothing is collected when error logging is off."""
+        request = _create_request(b"{}")
+
+        with patch.object(
+            logger.logging, "isEnabledFor", side_effect=lambda level: level > logging.ERROR
+        ):
+            result = await record_request_error_log(request, ValueError("boom"))
+
+        self.assertIsNone(result)
+        mock_error.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.manager.queue module."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from adk_agui_middleware.manager.queue import QueueManager
+
+
+class TestQueueManager(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the QueueManager class."""
+
+    async def test_put_many_preserves_order(self):
+        """Test that a burst of events is enqueued in order."""
+        manager = QueueManager(asyncio.Queue())
+
+        await manager.put_many(["a", "b", None])
+
+        self.assertEqual(
+            [manager.queue.get_nowait() for _ in range(3)], ["a", "b", None]
+        )
+
+    async def test_put_many_waits_when_bounded_queue_is_full(self):
+        """Test that put_many still applies backpressure on a full queue."""
+        manager = QueueManager(asyncio.Queue(maxsize=1))
+        task = asyncio.create_task(manager.put_many(["a", "b"]))
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+
+        self.assertEqual(manager.queue.get_nowait(), "a")
+        await task
+        self.assertEqual(manager.queue.get_nowait(), "b")
+
+    async def test_puts_after_sentinel_are_dropped(self):
+        """Test that nothing is enqueued once the sentinel has been put."""
+        manager = QueueManager(asyncio.Queue(maxsize=2))
+
+        await manager.put_many(["a", None, "b"])
+        await manager.put_many(["c", "d", "e"])
+        await manager.put("f")
+
+        self.assertTrue(manager.closed)
+        self.assertEqual(
+            [manager.queue.get_nowait() for _ in range(2)], ["a", None]
+        )
+        self.assertTrue(manager.queue.empty())
+
+    async def test_blocked_put_is_released_when_sentinel_is_read(self):
+        """Test that puts overtaken by the sentinel do not wait forever."""
+        manager = QueueManager(asyncio.Queue(maxsize=1))
+        await manager.put("x")
+        blocked = [
+            asyncio.create_task(manager.put_many([name, name]))
+            for name in ("a", "b")
+        ]
+        await asyncio.sleep(0)
+
+        # Free the slot and let the sentinel take it before the waiters run
+        self.assertEqual(manager.queue.get_nowait(), "x")
+        await manager.put(None)
+        manager.queue.task_done()
+        items = [item async for item in manager.get_iterator()]
+
+        await asyncio.wait_for(asyncio.gather(*blocked), timeout=1)
+        self.assertEqual(items, [])
+
+    async def test_cancelling_a_blocked_put_still_cancels(self):
+        """Test that cancelling the producer is not swallowed."""
+        manager = QueueManager(asyncio.Queue(maxsize=1))
+        await manager.put("x")
+        blocked = asyncio.create_task(manager.put("a"))
+        await asyncio.sleep(0)
+
+        blocked.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await blocked
+
+    @patch("adk_agui_middleware.manager.queue.extract_caller_name")
+    @patch("adk_agui_middleware.manager.queue.record_queue_log")
+    async def test_put_skips_logging_when_disabled(self, mock_log, mock_caller):
+        """Test that no log payload is built while queue logging is off."""
+        manager = QueueManager(asyncio.Queue())
+        with patch(
+            "adk_agui_middleware.manager.queue.log_config.LOG_EVENT_QUEUE", False
+        ):
+            await manager.put("event")
+
+        mock_log.assert_not_called()
+        mock_caller.assert_not_called()
+        self.assertEqual(manager.queue.get_nowait(), "event")
+
+    @patch("adk_agui_middleware.manager.queue.extract_caller_name", return_value="x")
+    @patch("adk_agui_middleware.manager.queue.record_queue_log")
+    async def test_put_logs_when_enabled(self, mock_log, _mock_caller):
+        """Test that queue puts are logged when queue logging is on."""
+        manager = QueueManager(asyncio.Queue())
+        with patch(
+            "adk_agui_middleware.manager.queue.log_config.LOG_EVENT_QUEUE", True
+        ):
+            await manager.put_many([None])
+
+        mock_log.assert_called_once_with(
+            {"call_function": "x", "type": "NoneType", "event": None}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
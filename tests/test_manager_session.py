@@ -124,7 +124,7 @@ class TestSessionManager(unittest.TestCase):
         )
 
         self.assertFalse(result)
-        mock_warning_log.assert_called_once()
+        mock_warning_log.assert_not_called()
 
     @patch("adk_agui_middleware.manager.session.record_warning_log")
     async def test_update_session_state_empty_updates(self, mock_warning_log):
@@ -137,7 +137,7 @@ class TestSessionManager(unittest.TestCase):
         )
 
         self.assertFalse(result)
-        mock_warning_log.assert_called_once()
+        mock_warning_log.assert_not_called()
 
     @patch("time.time")
     async def test_update_session_state_success(self, mock_time):
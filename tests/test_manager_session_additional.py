@@ -103,7 +103,7 @@ class TestSessionManagerAdditional(unittest.TestCase):
         
         self.assertFalse(result)
         mock_warning_log.assert_called_once_with(
-            "Session not found: test-app:test-session"
+            "Session not found: %s:%s", args=("test-app", "test-session")
         )
 
     @patch("adk_agui_middleware.manager.session.record_warning_log")
@@ -115,7 +115,7 @@ class TestSessionManagerAdditional(unittest.TestCase):
         result = await self.manager.update_session_state(self.session_parameter, None)
         
         self.assertFalse(result)
-        mock_warning_log.assert_called_once()
+        mock_warning_log.assert_not_called()
 
     @patch("adk_agui_middleware.manager.session.record_warning_log")
     async def test_update_session_state_empty_updates(self, mock_warning_log):
@@ -126,7 +126,7 @@ class TestSessionManagerAdditional(unittest.TestCase):
         result = await self.manager.update_session_state(self.session_parameter, {})
         
         self.assertFalse(result)
-        mock_warning_log.assert_called_once()
+        mock_warning_log.assert_not_called()
 
     @patch("adk_agui_middleware.manager.session.time.time")
     async def test_update_session_state_success(self, mock_time):
@@ -148,7 +148,7 @@ class TestSessionManagerAdditional(unittest.TestCase):
         event = call_args[0][1]  # Second argument is the event
         
         self.assertIsInstance(event, Event)
-        self.assertEqual(event.invocation_id, "state_update_1234567890")
+        self.assertEqual(event.invocation_id, "state_update_1234567890.000000_0")
         self.assertEqual(event.author, "system")
         self.assertEqual(event.actions.state_delta, state_updates)
         self.assertEqual(event.timestamp, 1234567890.0)
@@ -172,7 +172,7 @@ class TestSessionManagerAdditional(unittest.TestCase):
         
         self.assertEqual(result, {})
         mock_warning_log.assert_called_once_with(
-            "Session not found: test-app:test-session"
+            "Session not found: %s:%s", args=("test-app", "test-session")
         )
 
     @patch("adk_agui_middleware.manager.session.record_error_log")
@@ -222,7 +222,7 @@ class TestSessionManagerAdditional(unittest.TestCase):
         
         self.assertEqual(result, "default")
         mock_warning_log.assert_called_once_with(
-            "Session not found: test-app:test-session"
+            "Session not found: %s:%s", args=("test-app", "test-session")
         )
 
     @patch("adk_agui_middleware.manager.session.record_error_log")
@@ -272,7 +272,8 @@ class TestSessionManager:
             result = await session_manager.update_session_state(session_parameter, None)
 
         assert result is False
-        mock_log.assert_called_once()
+        mock_log.assert_not_called()
+        mock_session_service.get_session.assert_not_called()
         mock_session_service.append_event.assert_not_called()
 
     @pytest.mark.asyncio
@@ -285,7 +286,8 @@ class TestSessionManager:
             result = await session_manager.update_session_state(session_parameter, {})
 
         assert result is False
-        mock_log.assert_called_once()
+        mock_log.assert_not_called()
+        mock_session_service.get_session.assert_not_called()
         mock_session_service.append_event.assert_not_called()
 
     @pytest.mark.asyncio
@@ -300,6 +302,86 @@ class TestSessionManager:
         with pytest.raises(Exception, match="Append failed"):
             await session_manager.update_session_state(session_parameter, state_updates)
 
+    @pytest.mark.asyncio
+    async def test_update_session_state_with_prefetched_session(self, session_manager: SessionManager,
+                                                               mock_session_service: Mock,
+                                                               session_parameter: SessionParameter,
+                                                               mock_session: Mock):
+        """Test state update reuses a provided session without fetching it again."""
+        state_updates = {"key": "value"}
+
+        result = await session_manager.update_session_state(
+            session_parameter, state_updates, session=mock_session
+        )
+
+        assert result is True
+        mock_session_service.get_session.assert_not_called()
+        session_arg, event_arg = mock_session_service.append_event.call_args[0]
+        assert session_arg is mock_session
+        assert event_arg.actions.state_delta == state_updates
+
+    @pytest.mark.asyncio
+    async def test_update_session_state_unique_invocation_ids(self, session_manager: SessionManager,
+                                                             mock_session_service: Mock,
+                                                             session_parameter: SessionParameter,
+                                                             mock_session: Mock):
+        """Test updates within the same clock tick get distinct invocation IDs."""
+        mock_session_service.get_session.return_value = mock_session
+
+        with patch('time.time', return_value=1234567890.0):
+            await session_manager.update_session_state(session_parameter, {"a": 1})
+            await session_manager.update_session_state(session_parameter, {"b": 2})
+
+        first, second = (call[0][1] for call in mock_session_service.append_event.call_args_list)
+        assert first.invocation_id != second.invocation_id
+        assert first.timestamp == second.timestamp == 1234567890.0
+
+    # ========== Mutate State Tests ==========
+
+    @pytest.mark.asyncio
+    async def test_mutate_state_appends_only_changed_keys(self, session_manager: SessionManager,
+                                                          mock_session_service: Mock,
+                                                          session_parameter: SessionParameter,
+                                                          mock_session: Mock):
+        """Test mutate_state fetches once and writes a single delta of changed keys."""
+        mock_session_service.get_session.return_value = mock_session
+
+        result = await session_manager.mutate_state(
+            session_parameter, lambda state: {**state, "key2": 43, "key3": "new"}
+        )
+
+        assert result is True
+        mock_session_service.get_session.assert_called_once()
+        session_arg, event_arg = mock_session_service.append_event.call_args[0]
+        assert session_arg is mock_session
+        assert event_arg.actions.state_delta == {"key2": 43, "key3": "new"}
+
+    @pytest.mark.asyncio
+    async def test_mutate_state_no_changes(self, session_manager: SessionManager, mock_session_service: Mock,
+                                           session_parameter: SessionParameter, mock_session: Mock):
+        """Test mutate_state skips the append when nothing changed."""
+        mock_session_service.get_session.return_value = mock_session
+
+        result = await session_manager.mutate_state(session_parameter, dict)
+
+        assert result is True
+        mock_session_service.append_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mutate_state_session_not_found(self, session_manager: SessionManager,
+                                                  mock_session_service: Mock, session_parameter: SessionParameter):
+        """Test mutate_state when the session doesn't exist."""
+        mock_session_service.get_session.return_value = None
+        mutate = Mock()
+
+        with patch('adk_agui_middleware.manager.session.record_warning_log') as mock_log:
+            result = await session_manager.mutate_state(session_parameter, mutate)
+
+        assert result is False
+        mock_log.assert_called_once()
+        mutate.assert_not_called()
+        mock_session_service.append_event.assert_not_called()
+
     # ========== Get Session State Tests ==========
 
     @pytest.mark.asyncio
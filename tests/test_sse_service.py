@@ -1,7 +1,9 @@
 # Copyright (C) 2025 Trend Micro Inc. All rights reserved.
 """Unit tests for adk_agui_middleware.sse_service module."""
 
+import asyncio
 import unittest
+from contextlib import aclosing
 from unittest.mock import AsyncMock, Mock, patch
 
 from ag_ui.core import BaseEvent, RunAgentInput
@@ -10,8 +12,10 @@ from fastapi import Request
 from google.adk import Runner
 from google.adk.agents import BaseAgent
 
+from adk_agui_middleware.base_abc.handler import BaseInOutHandler
+from adk_agui_middleware.data_model.common import SessionLockConfig
 from adk_agui_middleware.data_model.config import RunnerConfig
-from adk_agui_middleware.data_model.context import ConfigContext
+from adk_agui_middleware.data_model.context import ConfigContext, HandlerContext
 from adk_agui_middleware.data_model.session import SessionParameter
 from adk_agui_middleware.service.sse_service import SSEService
 
@@ -135,7 +139,9 @@ class TestSSEService(unittest.TestCase):
 
     @patch("adk_agui_middleware.service.sse_service.AGUIErrorEvent")
     @patch("adk_agui_middleware.service.sse_service.convert_agui_event_to_str_fake_sse")
-    def test_encoding_handler_exception(self, mock_convert_fake_sse, mock_agui_error_event):
+    def test_encoding_handler_exception(
+        self, mock_convert_fake_sse, mock_agui_error_event
+    ):
         """Test _encode_event_to_sse with encoding exception."""
         exception_obj = Exception("Encoding failed")
         mock_convert_fake_sse.side_effect = exception_obj
@@ -143,21 +149,26 @@ class TestSSEService(unittest.TestCase):
         error_event = Mock(spec=BaseEvent)
         mock_agui_error_event.create_encoding_error_event.return_value = error_event
         # Mock the converter again for the error event
-        mock_convert_fake_sse.side_effect = [exception_obj, "data: error_event_string\n\n"]
+        mock_convert_fake_sse.side_effect = [
+            exception_obj,
+            "data: error_event_string\n\n",
+        ]
 
         result = self.sse_service._encode_event_to_sse(mock_event)
 
         self.assertEqual(result, "data: error_event_string\n\n")
-        mock_agui_error_event.create_encoding_error_event.assert_called_once_with(exception_obj)
+        mock_agui_error_event.create_encoding_error_event.assert_called_once_with(
+            exception_obj
+        )
 
     @patch("adk_agui_middleware.service.sse_service.Runner")
-    async def test_create_runner_new(self, mock_runner_class):
+    def test_create_runner_new(self, mock_runner_class):
         """Test _create_runner creates new runner for new app."""
         mock_runner_instance = Mock(spec=Runner)
         mock_runner_class.return_value = mock_runner_instance
 
         app_name = "new_app"
-        result = await self.sse_service._create_runner(app_name)
+        result = self.sse_service._create_runner(app_name)
 
         self.assertEqual(result, mock_runner_instance)
 
@@ -166,22 +177,32 @@ class TestSSEService(unittest.TestCase):
         mock_runner_class.assert_called_once()
         call_kwargs = mock_runner_class.call_args[1]
         self.assertEqual(call_kwargs["app_name"], app_name)
-        self.assertEqual(call_kwargs["session_service"], self.sse_service.session_manager.session_service)
-        self.assertEqual(call_kwargs["artifact_service"], self.runner_config.get_artifact_service())
-        self.assertEqual(call_kwargs["memory_service"], self.runner_config.get_memory_service())
-        self.assertEqual(call_kwargs["credential_service"], self.runner_config.get_credential_service())
+        self.assertEqual(
+            call_kwargs["session_service"],
+            self.sse_service.session_manager.session_service,
+        )
+        self.assertEqual(
+            call_kwargs["artifact_service"], self.runner_config.get_artifact_service()
+        )
+        self.assertEqual(
+            call_kwargs["memory_service"], self.runner_config.get_memory_service()
+        )
+        self.assertEqual(
+            call_kwargs["credential_service"],
+            self.runner_config.get_credential_service(),
+        )
         self.assertEqual(call_kwargs["plugins"], self.runner_config.plugins)
 
     @patch("adk_agui_middleware.service.sse_service.Runner")
-    async def test_create_runner_creates_new_instance(self, mock_runner_class):
+    def test_create_runner_creates_new_instance(self, mock_runner_class):
         """Test _create_runner creates a new runner instance each time."""
         mock_runner_instance1 = Mock(spec=Runner)
         mock_runner_instance2 = Mock(spec=Runner)
         mock_runner_class.side_effect = [mock_runner_instance1, mock_runner_instance2]
 
         app_name = "test_app"
-        result1 = await self.sse_service._create_runner(app_name)
-        result2 = await self.sse_service._create_runner(app_name)
+        result1 = self.sse_service._create_runner(app_name)
+        result2 = self.sse_service._create_runner(app_name)
 
         # Each call should create a new instance
         self.assertEqual(result1, mock_runner_instance1)
@@ -219,7 +240,7 @@ class TestSSEService(unittest.TestCase):
 
         # Mock runner creation
         mock_runner = Mock(spec=Runner)
-        self.sse_service._create_runner = AsyncMock(return_value=mock_runner)
+        self.sse_service._create_runner = Mock(return_value=mock_runner)
 
         # Get the runner function
         runner_func, in_out_handler = await self.sse_service.get_runner(
@@ -274,9 +295,7 @@ class TestSSEService(unittest.TestCase):
         ) as mock_encoding_handler:
             # Collect results from generator
             results = []
-            async for encoded_event in self.sse_service.event_generator(
-                mock_runner
-            ):
+            async for encoded_event in self.sse_service.event_generator(mock_runner):
                 results.append(encoded_event)
 
             # Verify results
@@ -296,13 +315,13 @@ class TestSSEService(unittest.TestCase):
         async def mock_runner():
             raise Exception("Runner failed")
 
-        mock_agui_encoder_error.create_agent_error_event.return_value = "error_encoded_event"
+        mock_agui_encoder_error.create_agent_error_event.return_value = (
+            "error_encoded_event"
+        )
 
         # Collect results from generator
         results = []
-        async for encoded_event in self.sse_service.event_generator(
-            mock_runner
-        ):
+        async for encoded_event in self.sse_service.event_generator(mock_runner):
             results.append(encoded_event)
 
         # Should yield error event
@@ -319,9 +338,7 @@ class TestSSEService(unittest.TestCase):
 
         # Collect results
         results = []
-        async for encoded_event in self.sse_service.event_generator(
-            mock_runner
-        ):
+        async for encoded_event in self.sse_service.event_generator(mock_runner):
             results.append(encoded_event)
 
         # Should yield nothing
@@ -350,21 +367,21 @@ class TestSSEService(unittest.TestCase):
         self.assertEqual(service.config_context, context_config)
 
     @patch("adk_agui_middleware.service.sse_service.Runner")
-    async def test_runner_creation_isolation(self, mock_runner_class):
+    def test_runner_creation_isolation(self, mock_runner_class):
         """Test that each _create_runner call creates independent runner instances."""
         mock_runner1 = Mock(spec=Runner)
         mock_runner2 = Mock(spec=Runner)
         mock_runner3 = Mock(spec=Runner)
         mock_runner_class.side_effect = [mock_runner1, mock_runner2, mock_runner3]
 
-        app1_runner = await self.sse_service._create_runner("app1")
-        app2_runner = await self.sse_service._create_runner("app2")
+        app1_runner = self.sse_service._create_runner("app1")
+        app2_runner = self.sse_service._create_runner("app2")
 
         # Should be different instances
         self.assertNotEqual(app1_runner, app2_runner)
 
         # Each call creates a new instance (no caching)
-        app1_runner_again = await self.sse_service._create_runner("app1")
+        app1_runner_again = self.sse_service._create_runner("app1")
         self.assertNotEqual(app1_runner, app1_runner_again)
 
         # Verify all three runners were created
@@ -416,5 +433,296 @@ class TestSSEService(unittest.TestCase):
         self.assertIsNone(initial_state)
 
 
+class TestSSEServiceRunAgent(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the agent run bound by SSEService.get_runner."""
+
+    def create_service(self, auto_remove_agui_raw_event):
+        """Create a service whose session lock is always granted."""
+        service = SSEService(
+            agent=Mock(spec=BaseAgent),
+            config_context=ConfigContext(
+                app_name="test_app",
+                user_id="test_user",
+                auto_remove_agui_raw_event=auto_remove_agui_raw_event,
+            ),
+        )
+        service._create_runner = Mock(return_value=Mock(spec=Runner))
+        return service
+
+    async def _collect(self, service, input_info=None, limit=None):
+        """Run the agent with a stubbed user handler and collect its events."""
+        event = Mock(spec=BaseEvent)
+        event.raw_event = "raw"
+
+        async def run():
+            yield event
+            yield event
+
+        input_info = input_info or Mock(
+            app_name="test_app", user_id="u", session_id="s"
+        )
+        with (
+            patch("adk_agui_middleware.service.sse_service.AGUIUserHandler") as handler,
+            patch("adk_agui_middleware.service.sse_service.UserMessageHandler"),
+            patch("adk_agui_middleware.service.sse_service.RunningHandler"),
+        ):
+            handler.return_value.run = run
+            events = []
+            async with aclosing(service._run_agent(input_info)) as stream:
+                async for e in stream:
+                    events.append(e)
+                    if len(events) == limit:
+                        break
+            return events
+
+    async def test_run_agent_strips_raw_events(self):
+        """Test that raw events are removed when configured."""
+        events = await self._collect(self.create_service(True))
+
+        self.assertIsNone(events[0].raw_event)
+
+    async def test_run_agent_keeps_raw_events(self):
+        """Test that raw events are kept when removal is disabled."""
+        events = await self._collect(self.create_service(False))
+
+        self.assertEqual(events[0].raw_event, "raw")
+
+    async def test_run_agent_releases_session_lock(self):
+        """Test that the session lock is released after the run completes."""
+        service = self.create_service(False)
+        input_info = Mock(app_name="test_app", user_id="u", session_id="s")
+
+        await self._collect(service, input_info)
+
+        self.assertNotIn("s", service.session_lock_handler.locks)
+
+    async def test_run_agent_releases_session_lock_when_closed_early(self):
+        """Test that the session lock is released when streaming stops early."""
+        service = self.create_service(False)
+        input_info = Mock(app_name="test_app", user_id="u", session_id="s")
+
+        events = await self._collect(service, input_info, limit=1)
+
+        self.assertEqual(len(events), 1)
+        self.assertNotIn("s", service.session_lock_handler.locks)
+
+    async def test_rejected_run_keeps_other_request_lock(self):
+        """Test that a request turned away by the lock does not release it."""
+        service = self.create_service(False)
+        service.session_lock_handler.lock_config = SessionLockConfig(lock_retry_times=0)
+        input_info = Mock(app_name="test_app", user_id="u", session_id="s")
+        self.assertTrue(await service.session_lock_handler.lock(input_info))
+
+        events = await self._collect(service, input_info)
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].code, "THREAD_IS_LOCKED")
+        self.assertIn("s", service.session_lock_handler.locks)
+
+    async def _stream(self, service, inout_handler):
+        """Drain the response produced by event_generator for one event."""
+        event = Mock(spec=BaseEvent)
+
+        async def runner():
+            yield event
+
+        service.session_lock_handler.unlock = AsyncMock()
+        service._encode_event_to_sse = Mock(return_value="encoded")
+        response = await service.event_generator(
+            runner, Mock(input_record_task=None), inout_handler
+        )
+        return event, [chunk async for chunk in response.body_iterator]
+
+    async def test_event_generator_without_inout_handler(self):
+        """Test that events are encoded directly when nothing records output."""
+        service = self.create_service(False)
+
+        event, chunks = await self._stream(service, None)
+
+        self.assertEqual(chunks, ["encoded"])
+        service._encode_event_to_sse.assert_called_once_with(event)
+        service.session_lock_handler.unlock.assert_not_awaited()
+
+    @staticmethod
+    def _inout_handler(replacement=None, modifies_output=True):
+        """Create an in/out handler whose output methods are async mocks."""
+
+        class RecordingHandler(BaseInOutHandler):
+            input_record = AsyncMock()
+            output_record = AsyncMock()
+            output_catch_and_change = AsyncMock(return_value=replacement)
+
+        RecordingHandler.modifies_output = modifies_output
+        return RecordingHandler()
+
+    async def test_event_generator_records_output(self):
+        """Test that the in/out handler records and may replace each event."""
+        service = self.create_service(False)
+        replaced = Mock(spec=BaseEvent)
+        inout_handler = self._inout_handler(replaced)
+
+        event, chunks = await self._stream(service, inout_handler)
+
+        self.assertEqual(chunks, ["encoded"])
+        inout_handler.output_record.assert_awaited_once_with(event)
+        service._encode_event_to_sse.assert_called_once_with(replaced)
+
+    async def test_event_generator_skips_change_for_record_only_handler(self):
+        """Test that output_catch_and_change is skipped when output is not modified."""
+        service = self.create_service(False)
+        inout_handler = self._inout_handler(modifies_output=False)
+
+        event, chunks = await self._stream(service, inout_handler)
+
+        self.assertEqual(chunks, ["encoded"])
+        inout_handler.output_record.assert_awaited_once_with(event)
+        inout_handler.output_catch_and_change.assert_not_awaited()
+        service._encode_event_to_sse.assert_called_once_with(event)
+
+    async def test_event_generator_uses_overridden_output_process(self):
+        """Test that a handler overriding output_process gets one call per event."""
+        service = self.create_service(False)
+        replaced = Mock(spec=BaseEvent)
+        recorder = self._inout_handler()
+
+        class ProcessingHandler(type(recorder)):
+            output_process = AsyncMock(return_value=replaced)
+
+        inout_handler = ProcessingHandler()
+
+        event, chunks = await self._stream(service, inout_handler)
+
+        self.assertEqual(chunks, ["encoded"])
+        inout_handler.output_process.assert_awaited_once_with(event)
+        inout_handler.output_record.assert_not_awaited()
+        service._encode_event_to_sse.assert_called_once_with(replaced)
+
+    async def test_create_and_record_message_reuses_shared_instance(self):
+        """Test that an in/out handler instance is shared rather than created."""
+        recorder = Mock(
+            spec=BaseInOutHandler, input_record=AsyncMock(), defers_input_record=False
+        )
+        service = SSEService(
+            agent=Mock(spec=BaseAgent),
+            config_context=ConfigContext(app_name="test_app", user_id="test_user"),
+            handler_context=HandlerContext(in_out_record_handler=recorder),
+        )
+        input_info = Mock()
+
+        first = await service._create_and_record_message(input_info)
+        second = await service._create_and_record_message(input_info)
+
+        self.assertIs(first, recorder)
+        self.assertIs(second, recorder)
+        self.assertEqual(recorder.input_record.await_count, 2)
+
+    async def test_deferred_input_record_finishes_before_output_record(self):
+        """Test that a deferred input record runs in the background but first."""
+        calls = []
+        release = asyncio.Event()
+
+        class DeferredHandler(BaseInOutHandler):
+            defers_input_record = True
+            modifies_output = False
+
+            async def input_record(self, input_info):
+                await release.wait()
+                calls.append("input")
+
+            async def output_record(self, agui_event):
+                calls.append("output")
+
+            async def output_catch_and_change(self, agui_event):
+                return agui_event
+
+        service = SSEService(
+            agent=Mock(spec=BaseAgent),
+            config_context=ConfigContext(app_name="test_app", user_id="test_user"),
+            handler_context=HandlerContext(in_out_record_handler=DeferredHandler),
+        )
+        service._encode_event_to_sse = Mock(return_value="encoded")
+        input_info = Mock(input_record_task=None)
+
+        async def runner():
+            calls.append("agent")
+            yield Mock(spec=BaseEvent)
+
+        inout_handler = await service._create_and_record_message(input_info)
+        self.assertEqual(calls, [])
+        self.assertIsNotNone(input_info.input_record_task)
+
+        response = await service.event_generator(runner, input_info, inout_handler)
+        body = response.body_iterator
+        first = asyncio.ensure_future(anext(body))
+        await asyncio.sleep(0)
+        self.assertEqual(calls, ["agent"])
+        release.set()
+
+        self.assertEqual(await first, "encoded")
+        self.assertEqual(calls, ["agent", "input", "output"])
+        self.assertEqual(service._input_record_tasks, set())
+
+    @patch("adk_agui_middleware.service.sse_service.record_error_log")
+    async def test_failed_deferred_input_record_is_logged(self, mock_error_log):
+        """Test that a failing deferred input record is logged, not streamed."""
+        error = RuntimeError("audit store down")
+
+        class FailingHandler(BaseInOutHandler):
+            defers_input_record = True
+            modifies_output = False
+
+            async def input_record(self, input_info):
+                raise error
+
+            async def output_record(self, agui_event):
+                pass
+
+            async def output_catch_and_change(self, agui_event):
+                return agui_event
+
+        service = SSEService(
+            agent=Mock(spec=BaseAgent),
+            config_context=ConfigContext(app_name="test_app", user_id="test_user"),
+            handler_context=HandlerContext(in_out_record_handler=FailingHandler),
+        )
+        service._encode_event_to_sse = Mock(return_value="encoded")
+        input_info = Mock(input_record_task=None)
+
+        async def runner():
+            yield Mock(spec=BaseEvent)
+
+        inout_handler = await service._create_and_record_message(input_info)
+        response = await service.event_generator(runner, input_info, inout_handler)
+        chunks = [chunk async for chunk in response.body_iterator]
+
+        self.assertEqual(chunks, ["encoded"])
+        mock_error_log.assert_called_once_with("Deferred input record failed", error)
+        self.assertIsNone(input_info.input_record_task.exception())
+
+    @patch("adk_agui_middleware.service.sse_service.record_error_log")
+    async def test_failed_deferred_input_record_without_events(self, mock_error_log):
+        """Test that a failed deferred record is observed when nothing streams."""
+        recorder = Mock(
+            spec=BaseInOutHandler,
+            input_record=AsyncMock(side_effect=RuntimeError("audit store down")),
+            defers_input_record=True,
+        )
+        service = SSEService(
+            agent=Mock(spec=BaseAgent),
+            config_context=ConfigContext(app_name="test_app", user_id="test_user"),
+            handler_context=HandlerContext(in_out_record_handler=recorder),
+        )
+        input_info = Mock(input_record_task=None)
+
+        await service._create_and_record_message(input_info)
+        await asyncio.wait({input_info.input_record_task})
+        await asyncio.sleep(0)
+
+        self.assertTrue(input_info.input_record_task.done())
+        self.assertIsNone(input_info.input_record_task.exception())
+        mock_error_log.assert_called_once()
+        self.assertEqual(service._input_record_tasks, set())
+
+
 if __name__ == "__main__":
     unittest.main()
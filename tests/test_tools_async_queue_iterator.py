@@ -0,0 +1,51 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.tools.async_queue_iterator module."""
+
+import asyncio
+import unittest
+
+from adk_agui_middleware.tools.async_queue_iterator import AsyncQueueIterator
+
+
+class TestAsyncQueueIterator(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncQueueIterator."""
+
+    async def test_drains_ready_items_until_sentinel(self):
+        """Test that queued items are returned in order and None stops iteration."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in (1, 2, 3, None, 4):
+            queue.put_nowait(item)
+
+        items = [item async for item in AsyncQueueIterator(queue)]
+
+        self.assertEqual(items, [1, 2, 3])
+        self.assertEqual(queue.get_nowait(), 4)
+
+    async def test_waits_for_items_from_producer(self):
+        """Test that an empty queue suspends until a producer adds items."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        async def produce() -> None:
+            for item in ("a", "b", None):
+                await queue.put(item)
+
+        producer = asyncio.create_task(produce())
+        items = [item async for item in AsyncQueueIterator(queue)]
+        await producer
+
+        self.assertEqual(items, ["a", "b"])
+
+    async def test_marks_every_item_done(self):
+        """Test that task_done is called for items and the sentinel."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in ("x", None):
+            queue.put_nowait(item)
+
+        async for _ in AsyncQueueIterator(queue):
+            pass
+
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,11 @@
 import unittest
 from unittest.mock import Mock, patch
 
-from ag_ui.core import BaseEvent, EventType
+from ag_ui.core import BaseEvent, EventType, ToolMessage
 
 from adk_agui_middleware.utils.convert.agui_event_to_sse import convert_agui_event_to_sse
+from adk_agui_middleware.utils.convert.agui_tool_message_to_adk_function_response import \
+    convert_agui_tool_message_to_adk_function_response
 
 
 class TestAGUIToSSE(unittest.TestCase):
@@ -73,5 +75,53 @@ class TestAGUIToSSE(unittest.TestCase):
         self.assertNotEqual(result1["id"], result2["id"])
 
 
+class TestToolMessageToFunctionResponse(unittest.TestCase):
+    """Test cases for convert_agui_tool_message_to_adk_function_response."""
+
+    @staticmethod
+    def _tool_message(content: str) -> ToolMessage:
+        return ToolMessage(id="msg-1", role="tool", content=content, tool_call_id="call-1")
+
+    def test_json_content_is_parsed(self):
+        """Test that JSON content becomes the function response payload."""
+        part = convert_agui_tool_message_to_adk_function_response(
+            self._tool_message('{"value": 1}'), "my_tool"
+        )
+
+        self.assertEqual(part.function_response.id, "call-1")
+        self.assertEqual(part.function_response.name, "my_tool")
+        self.assertEqual(part.function_response.response, {"value": 1})
+
+    @patch(
+        "adk_agui_middleware.utils.convert.agui_tool_message_to_adk_function_response.record_warning_log"
+    )
+    def test_blank_content_uses_empty_success_result(self, mock_warning):
+        """Test that empty and whitespace-only content yield the default result."""
+        for content in ("", "  \n\t "):
+            part = convert_agui_tool_message_to_adk_function_response(
+                self._tool_message(content), "my_tool"
+            )
+            self.assertEqual(
+                part.function_response.response, {"success": True, "result": None}
+            )
+        self.assertEqual(mock_warning.call_count, 2)
+
+    @patch(
+        "adk_agui_middleware.utils.convert.agui_tool_message_to_adk_function_response.record_warning_log"
+    )
+    def test_empty_success_result_is_not_shared(self, _mock_warning):
+        """Test that mutating one response does not leak into the next."""
+        first = convert_agui_tool_message_to_adk_function_response(
+            self._tool_message(""), "my_tool"
+        )
+        first.function_response.response["result"] = "changed"
+
+        second = convert_agui_tool_message_to_adk_function_response(
+            self._tool_message(""), "my_tool"
+        )
+
+        self.assertIsNone(second.function_response.response["result"])
+
+
 if __name__ == "__main__":
     unittest.main()
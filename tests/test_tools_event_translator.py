@@ -3,6 +3,7 @@
 
 import asyncio
 import json
+import os
 import unittest
 import uuid
 from unittest.mock import AsyncMock, Mock, patch
@@ -30,6 +31,19 @@ class TestEventTranslator(unittest.TestCase):
         self.assertEqual(self.translator._streaming_message_id, {})
         self.assertEqual(self.translator.long_running_tool_ids, {})
 
+    def test_translation_utils_shared_between_instances(self):
+        """Test that stateless utilities are shared while state is per instance."""
+        other = EventTranslator()
+
+        self.assertIs(other.state_event_util, self.translator.state_event_util)
+        self.assertIs(
+            other.function_call_event_util, self.translator.function_call_event_util
+        )
+        self.assertIs(other.message_event_util, self.translator.message_event_util)
+        self.assertIsNot(
+            other.long_running_tool_ids, self.translator.long_running_tool_ids
+        )
+
     @patch("adk_agui_middleware.tools.event_translator.record_error_log")
     async def test_translate_user_authored_event(self, mock_record_error):
         """Test that user-authored events are skipped."""
@@ -502,5 +516,182 @@ class TestEventTranslator(unittest.TestCase):
         self.assertEqual(events[0].delta, [])
 
 
+class TestEventTranslatorReturnsLists(unittest.TestCase):
+    """Test cases for the list-returning translation API."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.translator = EventTranslator()
+
+    @staticmethod
+    def _text_event(text: str, partial: bool) -> ADKEvent:
+        return ADKEvent(
+            author="agent",
+            partial=partial,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+        )
+
+    def test_translate_streaming_text_sequence(self):
+        """Test that a partial then final text event stream start, content and end."""
+        first = self.translator.translate(self._text_event("Hel", partial=True))
+        last = self.translator.translate(self._text_event("Hello", partial=False))
+
+        self.assertIsInstance(first, list)
+        self.assertEqual(
+            [event.type for event in first],
+            [EventType.TEXT_MESSAGE_START, EventType.TEXT_MESSAGE_CONTENT],
+        )
+        self.assertEqual([event.type for event in last], [EventType.TEXT_MESSAGE_END])
+        self.assertEqual(first[0].message_id, last[0].message_id)
+        self.assertEqual(self.translator._streaming_message_id, {})
+
+    def test_translate_user_event_returns_empty_list(self):
+        """Test that user-authored events produce no AGUI events."""
+        event = ADKEvent(
+            author="user",
+            content=types.Content(role="user", parts=[types.Part(text="hi")]),
+        )
+
+        self.assertEqual(self.translator.translate(event), [])
+
+    def test_translate_function_call_closes_stream_first(self):
+        """Test that an open text stream is closed before tool call events."""
+        self.translator.translate(self._text_event("Hel", partial=True))
+        event = ADKEvent(
+            author="agent",
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            id="call-1", name="tool", args={"a": 1}
+                        )
+                    )
+                ],
+            ),
+        )
+
+        events = self.translator.translate(event)
+
+        self.assertEqual(
+            [e.type for e in events],
+            [
+                EventType.TEXT_MESSAGE_END,
+                EventType.TOOL_CALL_START,
+                EventType.TOOL_CALL_ARGS,
+                EventType.TOOL_CALL_END,
+            ],
+        )
+
+    def test_translate_text_content_checks_final_response_once(self):
+        """Test that the final-response check is evaluated once per event."""
+        self.translator.translate(self._text_event("Hel", partial=True))
+        event = self._text_event("Hello", partial=False)
+
+        with patch.object(
+            ADKEvent, "is_final_response", autospec=True, return_value=True
+        ) as mock_is_final:
+            events = self.translator.translate_text_content(event)
+
+        mock_is_final.assert_called_once()
+        self.assertEqual([e.type for e in events], [EventType.TEXT_MESSAGE_END])
+
+    def test_translate_does_not_rewalk_function_responses(self):
+        """Test that translate classifies parts without get_function_responses."""
+        event = ADKEvent(
+            author="agent",
+            content=types.Content(
+                role="user",
+                parts=[
+                    types.Part(
+                        function_response=types.FunctionResponse(
+                            id="call-1", name="tool", response={"ok": True}
+                        )
+                    )
+                ],
+            ),
+        )
+
+        with patch.object(
+            ADKEvent,
+            "get_function_responses",
+            autospec=True,
+            side_effect=ADKEvent.get_function_responses,
+        ) as mock_get_responses:
+            events = self.translator.translate(event)
+
+        mock_get_responses.assert_not_called()
+        self.assertEqual([e.type for e in events], [EventType.TOOL_CALL_RESULT])
+
+    def test_split_parts_text(self):
+        """Test text joining for zero, one and several text parts."""
+        split = EventTranslator._split_parts
+        single = "only text"
+
+        self.assertEqual(split([types.Part(), types.Part(text="")])[0], "")
+        self.assertIs(split([types.Part(), types.Part(text=single)])[0], single)
+        self.assertEqual(
+            split(
+                [
+                    types.Part(text="a"),
+                    types.Part(),
+                    types.Part(text="b"),
+                    types.Part(text="c"),
+                ]
+            )[0],
+            "abc",
+        )
+
+    def test_split_parts_classifies_in_order(self):
+        """Test that function calls and responses are collected in part order."""
+        call_1 = types.FunctionCall(id="c-1", name="one")
+        call_2 = types.FunctionCall(id="c-2", name="two")
+        response = types.FunctionResponse(id="c-0", name="zero", response={})
+        parts = [
+            types.Part(function_response=response),
+            types.Part(text="hi"),
+            types.Part(function_call=call_1),
+            types.Part(function_call=call_2),
+        ]
+
+        text, function_calls, function_responses = EventTranslator._split_parts(parts)
+
+        self.assertEqual(text, "hi")
+        self.assertEqual(function_calls, [call_1, call_2])
+        self.assertEqual(function_responses, [response])
+
+    def test_streaming_message_ids_are_unique(self):
+        """Test that each new streaming message gets a distinct generated id."""
+        first = self.translator.translate(self._text_event("a", partial=True))
+        self.translator.force_close_streaming_message()
+        second = self.translator.translate(self._text_event("b", partial=True))
+
+        self.assertTrue(first[0].message_id.startswith("msg_"))
+        self.assertNotEqual(first[0].message_id, second[0].message_id)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_streaming_message_ids_differ_across_forked_workers(self):
+        """Test that a forked worker does not reuse the parent's message ids."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            events = self.translator.translate(self._text_event("a", partial=True))
+            os.write(write_fd, events[0].message_id.encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reader:
+            child_id = reader.read()
+        os.waitpid(pid, 0)
+        events = self.translator.translate(self._text_event("a", partial=True))
+
+        self.assertTrue(child_id.startswith("msg_"))
+        self.assertNotEqual(child_id, events[0].message_id)
+
+    def test_force_close_streaming_message_without_stream(self):
+        """Test that nothing is emitted when no message is streaming."""
+        self.assertEqual(self.translator.force_close_streaming_message(), [])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
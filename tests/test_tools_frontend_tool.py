@@ -0,0 +1,102 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.tools.frontend_tool module."""
+
+import json
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from ag_ui.core import Tool
+
+from adk_agui_middleware.tools.frontend_tool import FrontendTool, FrontendToolset
+
+
+def _agui_tool(name: str = "confirm") -> Tool:
+    return Tool(
+        name=name,
+        description="Ask the user to confirm",
+        parameters={"type": "object", "properties": {"text": {"type": "string"}}},
+    )
+
+
+class TestFrontendTool(unittest.TestCase):
+    """Test cases for the FrontendTool class."""
+
+    def test_declaration_is_cached(self):
+        """Test that the declaration is built once and reused."""
+        tool = FrontendTool(_agui_tool(), Mock())
+
+        declaration = tool._get_declaration()
+
+        self.assertEqual(declaration.name, "confirm")
+        self.assertIn("text", declaration.parameters.properties)
+        self.assertIs(tool._get_declaration(), declaration)
+
+    def test_declaration_follows_rename(self):
+        """Test that renaming the tool rebuilds its declaration."""
+        tool = FrontendTool(_agui_tool(), Mock())
+        tool._get_declaration()
+
+        tool.name = "ui_confirm"
+
+        self.assertEqual(tool._get_declaration().name, "ui_confirm")
+
+
+class TestFrontendToolRunAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for FrontendTool.run_async."""
+
+    async def test_run_async_emits_function_call_events(self):
+        """Test that the model's arguments are forwarded to the client."""
+        queue = Mock(put_many=AsyncMock())
+        tool = FrontendTool(_agui_tool(), queue)
+
+        result = await tool.run_async(
+            args={"text": "proceed?"}, tool_context=Mock(function_call_id="fc-1")
+        )
+
+        self.assertIsNone(result)
+        events = queue.put_many.await_args.args[0]
+        self.assertEqual([event.tool_call_id for event in events], ["fc-1"] * 3)
+        self.assertEqual(events[0].tool_call_name, "confirm")
+        self.assertEqual(json.loads(events[1].delta), {"text": "proceed?"})
+
+    async def test_run_async_uses_each_call_arguments(self):
+        """Test that every invocation emits its own arguments."""
+        queue = Mock(put_many=AsyncMock())
+        tool = FrontendTool(_agui_tool(), queue)
+
+        await tool.run_async(args={"text": "a"}, tool_context=Mock(function_call_id="1"))
+        await tool.run_async(args={"text": "b"}, tool_context=Mock(function_call_id="2"))
+
+        deltas = [call.args[0][1].delta for call in queue.put_many.await_args_list]
+        self.assertEqual([json.loads(delta) for delta in deltas], [{"text": "a"}, {"text": "b"}])
+
+
+class TestFrontendToolset(unittest.TestCase):
+    """Test cases for the FrontendToolset class."""
+
+    def test_set_frontend_tools_applies_prefix_and_filter(self):
+        """Test that tools are prefixed and then filtered by name."""
+        toolset = FrontendToolset(
+            tool_filter=["ui_confirm"], tool_name_prefix="ui_"
+        )
+
+        toolset.set_frontend_tools(Mock(), [_agui_tool(), _agui_tool("other")])
+
+        self.assertEqual([tool.name for tool in toolset.frontend_tools], ["ui_confirm"])
+
+    def test_set_frontend_tools_skips_identical_rebuild(self):
+        """Test that re-setting the same queue and tools keeps the built tools."""
+        toolset = FrontendToolset()
+        queue, agui_tools = Mock(), [_agui_tool()]
+        toolset.set_frontend_tools(queue, agui_tools)
+        built = toolset.frontend_tools
+
+        toolset.set_frontend_tools(queue, agui_tools)
+        self.assertIs(toolset.frontend_tools, built)
+
+        toolset.set_frontend_tools(Mock(), agui_tools)
+        self.assertIsNot(toolset.frontend_tools, built)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,6 +59,34 @@ class TestFunctionNameUtils(unittest.TestCase):
         self.assertIsInstance(result, str)
         self.assertNotEqual(result, "unknown_function")
 
+    def test_extract_caller_name_excludes_itself(self):
+        """Test that the immediate caller is returned, not the extractor."""
+
+        def outer_function():
+            return extract_caller_name()
+
+        self.assertEqual(outer_function(), "outer_function")
+
+    def test_extract_caller_name_full_chain_max_depth(self):
+        """Test that the chain is limited to the innermost max_depth callers."""
+
+        def level_one():
+            return level_two()
+
+        def level_two():
+            return extract_caller_name(full_chain=True, max_depth=2)
+
+        self.assertEqual(level_one(), "level_one -> level_two")
+
+    def test_extract_caller_name_method_context(self):
+        """Test that methods are formatted with their class name."""
+
+        class Sample:
+            def method(self):
+                return extract_caller_name()
+
+        self.assertEqual(Sample().method(), "Sample.method")
+
 
 if __name__ == "__main__":
     unittest.main()
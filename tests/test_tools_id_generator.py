@@ -0,0 +1,48 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.tools.id_generator module."""
+
+import os
+import unittest
+
+from adk_agui_middleware.tools.id_generator import generate_id
+
+
+class TestGenerateId(unittest.TestCase):
+    """Test cases for the generate_id function."""
+
+    def test_ids_are_unique(self):
+        """Test that consecutive IDs never repeat."""
+        ids = {generate_id() for _ in range(1000)}
+
+        self.assertEqual(len(ids), 1000)
+
+    def test_prefix_is_prepended(self):
+        """Test that the optional prefix starts the identifier."""
+        self.assertTrue(generate_id("call_").startswith("call_"))
+
+    def test_ids_share_process_prefix(self):
+        """Test that IDs from one process share the random prefix."""
+        self.assertEqual(generate_id()[:8], generate_id()[:8])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_worker_does_not_repeat_parent_ids(self):
+        """Test that a forked child draws IDs unlike the parent's next ones."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, generate_id().encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reader:
+            child_id = reader.read()
+        os.waitpid(pid, 0)
+        parent_id = generate_id()
+
+        self.assertTrue(child_id)
+        self.assertNotEqual(child_id, parent_id)
+        self.assertNotEqual(child_id[:8], parent_id[:8])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -260,6 +260,51 @@ class TestPydanticJsonEncoder(unittest.TestCase):
 
         self.assertEqual(result, {})
 
+    def test_mapping_encoding(self):
+        """Test that non-dict mappings are encoded as plain dictionaries."""
+        from types import MappingProxyType
+
+        result = self.encoder.default(MappingProxyType({"content-type": "json"}))
+
+        self.assertEqual(result, {"content-type": "json"})
+        self.assertIs(type(result), dict)
+
+    def test_shared_encoder_instance(self):
+        """Test that the shared encoder applies the custom conversions."""
+        shared = json_encoder_module.pydantic_json_encoder
+
+        self.assertIsInstance(shared, PydanticJsonEncoder)
+        self.assertEqual(shared.encode({"ids": {1}}), '{"ids": [1]}')
+
+
+
+class TestEncodeJson(unittest.TestCase):
+    """Test cases for the encode_json helper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.encode_json = json_encoder_module.encode_json
+
+    def test_encodes_compact_json(self):
+        """Test that plain payloads round-trip through compact JSON."""
+        payload = {"text": "proceed?", "items": [1, 2.5, None, True], "name": "é"}
+
+        result = self.encode_json(payload)
+
+        self.assertEqual(json.loads(result), payload)
+        self.assertNotIn(", ", result)
+
+    def test_non_utf8_bytes_fall_back_to_encoder(self):
+        """Test that undecodable bytes use the PydanticJsonEncoder placeholder."""
+        self.assertEqual(
+            json.loads(self.encode_json({"data": b"\xff"})), {"data": "[Binary Data]"}
+        )
+
+    def test_unsupported_object_raises_typeerror(self):
+        """Test that unknown objects still raise TypeError."""
+        with self.assertRaises(TypeError):
+            self.encode_json({"obj": object()})
+
 
 if __name__ == "__main__":
     unittest.main()
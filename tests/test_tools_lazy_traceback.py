@@ -0,0 +1,47 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for adk_agui_middleware.tools.lazy_traceback module."""
+
+import traceback
+import unittest
+from unittest.mock import patch
+
+from adk_agui_middleware.tools.lazy_traceback import LazyTraceback
+
+
+def _raise_value_error():
+    raise ValueError("boom")
+
+
+class TestLazyTraceback(unittest.TestCase):
+    """Test cases for the LazyTraceback class."""
+
+    def _capture(self):
+        try:
+            _raise_value_error()
+        except ValueError as e:
+            return e, traceback.format_exc()
+
+    def test_str_matches_format_exc(self):
+        """Rendered text matches the eagerly formatted traceback."""
+        error, expected = self._capture()
+        self.assertEqual(str(LazyTraceback(error)), expected)
+        self.assertEqual(repr(LazyTraceback(error)), expected)
+
+    def test_formatting_is_deferred_and_cached(self):
+        """Traceback is formatted only on first render, then cached."""
+        error, _ = self._capture()
+        with patch(
+            "adk_agui_middleware.tools.lazy_traceback.traceback.TracebackException",
+            wraps=traceback.TracebackException,
+        ) as mock_tb:
+            lazy = LazyTraceback(error)
+            mock_tb.assert_not_called()
+            first = str(lazy)
+            second = str(lazy)
+        mock_tb.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertIn("ValueError: boom", first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Copyright (C) 2025 Trend Micro Inc. All rights reserved.
+"""Unit tests for the public event utilities in adk_agui_middleware.utils.translate."""
+
+import unittest
+
+from ag_ui.core import EventType
+from google.genai import types
+
+from adk_agui_middleware.utils.translate import FunctionCallEventUtil, MessageEventUtil
+
+
+class TestTranslateUtilityGenerators(unittest.IsolatedAsyncioTestCase):
+    """Test that the public utilities stay async generators for custom handlers."""
+
+    async def test_generate_message_event_yields_sequence(self):
+        """Test that a text message is yielded as start, content and end."""
+        events = [
+            event
+            async for event in MessageEventUtil.generate_message_event("msg-1", "hi")
+        ]
+
+        self.assertEqual(
+            [event.type for event in events],
+            [
+                EventType.TEXT_MESSAGE_START,
+                EventType.TEXT_MESSAGE_CONTENT,
+                EventType.TEXT_MESSAGE_END,
+            ],
+        )
+        self.assertEqual(events[1].delta, "hi")
+
+    async def test_generate_function_call_event_yields_sequence(self):
+        """Test that a tool call is yielded as start, args and end."""
+        events = [
+            event
+            async for event in FunctionCallEventUtil.generate_function_call_event(
+                "call-1", "tool", {"a": 1}
+            )
+        ]
+
+        self.assertEqual(
+            [event.type for event in events],
+            [
+                EventType.TOOL_CALL_START,
+                EventType.TOOL_CALL_ARGS,
+                EventType.TOOL_CALL_END,
+            ],
+        )
+
+    async def test_generate_function_calls_event_skips_unnamed_calls(self):
+        """Test that every named call is yielded and unnamed calls are skipped."""
+        calls = [
+            types.FunctionCall(id="call-1", name="tool", args=None),
+            types.FunctionCall(id="call-2", name=None, args=None),
+        ]
+
+        events = [
+            event
+            async for event in FunctionCallEventUtil().generate_function_calls_event(
+                calls
+            )
+        ]
+
+        self.assertEqual(
+            [(event.type, event.tool_call_id) for event in events],
+            [
+                (EventType.TOOL_CALL_START, "call-1"),
+                (EventType.TOOL_CALL_END, "call-1"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()